@@ -26,11 +26,13 @@ from agent_contracts.core.contract import (
 from agent_contracts.core.enforcement import (
     ContractEnforcer,
     EnforcementAction,
+    EnforcementBatchCallback,
     EnforcementCallback,
     EnforcementEvent,
 )
 from agent_contracts.core.monitor import (
     ResourceMonitor,
+    ResourceSnapshot,
     ResourceUsage,
     TemporalMonitor,
     ViolationInfo,
@@ -105,6 +107,7 @@ __all__ = [
     "DataAnalysisContract",
     "DeadlineType",
     "EnforcementAction",
+    "EnforcementBatchCallback",
     "EnforcementCallback",
     "EnforcementEvent",
     "ExecutionLog",
@@ -115,6 +118,7 @@ __all__ = [
     "ResourceAllocation",
     "ResourceConstraints",
     "ResourceMonitor",
+    "ResourceSnapshot",
     "ResourceUsage",
     "StrategyRecommendation",
     "SuccessCriterion",
@@ -19,11 +19,13 @@ from agent_contracts.core.contract import (
 from agent_contracts.core.enforcement import (
     ContractEnforcer,
     EnforcementAction,
+    EnforcementBatchCallback,
     EnforcementCallback,
     EnforcementEvent,
 )
 from agent_contracts.core.monitor import (
     ResourceMonitor,
+    ResourceSnapshot,
     ResourceUsage,
     TemporalMonitor,
     ViolationInfo,
@@ -67,6 +69,7 @@ __all__ = [
     "CostEstimate",
     "DeadlineType",
     "EnforcementAction",
+    "EnforcementBatchCallback",
     "EnforcementCallback",
     "EnforcementEvent",
     "ExecutionLog",
@@ -76,6 +79,7 @@ __all__ = [
     "ResourceAllocation",
     "ResourceConstraints",
     "ResourceMonitor",
+    "ResourceSnapshot",
     "ResourceUsage",
     "StrategyRecommendation",
     "SuccessCriterion",
@@ -191,6 +191,27 @@ class ResourceConstraints:
             )
         # "low" effort can work with any budget (even <500 tokens)
 
+    def any_set(self) -> bool:
+        """Check whether any resource limit is specified.
+
+        Returns:
+            True if at least one limit is set, False if fully unlimited
+        """
+        return any(
+            value is not None
+            for value in (
+                self.tokens,
+                self.reasoning_tokens,
+                self.text_tokens,
+                self.api_calls,
+                self.web_searches,
+                self.tool_invocations,
+                self.memory_mb,
+                self.compute_seconds,
+                self.cost_usd,
+            )
+        )
+
     @property
     def token_mode(self) -> str:
         """Determine active token budget mode.
@@ -257,6 +278,18 @@ class TemporalConstraints:
                 f"got {self.soft_deadline_quality_decay}"
             )
 
+    def any_set(self) -> bool:
+        """Check whether any time boundary is specified.
+
+        Returns:
+            True if a deadline, max duration or expiration is set
+        """
+        return (
+            self.deadline is not None
+            or self.max_duration is not None
+            or self.contract_expiration is not None
+        )
+
 
 @dataclass
 class InputSpecification:
@@ -4,7 +4,8 @@ This module implements the enforcement layer that actively monitors and enforces
 contract constraints during agent execution.
 """
 
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -40,6 +41,8 @@ class EnforcementEvent:
         timestamp: When the event occurred
     """
 
+    __slots__ = ("_timestamp", "_timestamp_ns", "contract", "data", "event_type", "message")
+
     def __init__(
         self,
         event_type: str,
@@ -59,7 +62,21 @@ class EnforcementEvent:
         self.contract = contract
         self.message = message
         self.data = data or {}
-        self.timestamp = datetime.now()
+        # Raw clock reading; the datetime is only built if someone reads it
+        self._timestamp_ns = time.time_ns()
+        self._timestamp: datetime | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the event occurred, as a local naive datetime."""
+        if self._timestamp is None:
+            seconds, nanos = divmod(self._timestamp_ns, 1_000_000_000)
+            self._timestamp = datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
 
     def __repr__(self) -> str:
         """String representation of event."""
@@ -72,6 +89,9 @@ class EnforcementEvent:
 # Type alias for enforcement callbacks
 EnforcementCallback = Callable[[EnforcementEvent], None]
 
+# Type alias for callbacks that receive all events from one enforcer call at once
+EnforcementBatchCallback = Callable[[list[EnforcementEvent]], None]
+
 
 class ContractEnforcer:
     """Enforces contract constraints during agent execution.
@@ -83,6 +103,7 @@ class ContractEnforcer:
         contract: The contract being enforced
         monitor: Resource monitor tracking actual usage
         callbacks: List of callback functions for enforcement events
+        batch_callbacks: List of callback functions receiving buffered events
         strict_mode: If True, violations immediately terminate execution
     """
 
@@ -91,18 +112,29 @@ class ContractEnforcer:
         contract: Contract,
         strict_mode: bool = True,
         callbacks: list[EnforcementCallback] | None = None,
+        batch_callbacks: list[EnforcementBatchCallback] | None = None,
     ) -> None:
         """Initialize contract enforcer.
 
+        Batch callbacks are an alternative to per-event callbacks for
+        consumers with a high per-call cost (e.g. shipping events over the
+        network). Events are buffered and delivered as one list when the
+        enforcer call that produced them returns, so a strict-mode violation
+        arrives as a single batch rather than three separate calls.
+
         Args:
             contract: Contract to enforce
             strict_mode: If True, violations cause immediate termination
             callbacks: Optional list of callback functions for events
+            batch_callbacks: Optional list of callback functions for event batches
         """
         self.contract = contract
         self.monitor = ResourceMonitor(contract.resources)
         self.strict_mode = strict_mode
         self.callbacks = callbacks or []
+        self.batch_callbacks = batch_callbacks or []
+        self._typed_callbacks: dict[str, list[EnforcementCallback]] = {}
+        self._event_buffer: list[EnforcementEvent] = []
         self._enforcement_active = False
 
     def start(self) -> None:
@@ -127,10 +159,20 @@ class ContractEnforcer:
                 message=f"Contract '{self.contract.name}' enforcement started",
             )
         )
+        self.flush()
 
     def stop(self, reason: str = "") -> None:
         """Stop enforcement.
 
+        Args:
+            reason: Optional reason for stopping
+        """
+        self._stop(reason)
+        self.flush()
+
+    def _stop(self, reason: str = "") -> None:
+        """Stop enforcement without flushing buffered events.
+
         Args:
             reason: Optional reason for stopping
         """
@@ -186,8 +228,23 @@ class ContractEnforcer:
             if self.strict_mode:
                 self._handle_violation(violations)
 
+            self.flush()
+
         return is_violated, violations
 
+    def check_constraints_fast(self) -> bool:
+        """Check whether any constraint is violated, without side effects.
+
+        This is the cheap allow-path for per-step checks: it builds no
+        violation list, records nothing, and emits no events. Callers should
+        follow up with check_constraints() when it returns True so the
+        violation is recorded and handled.
+
+        Returns:
+            True if any resource constraint is currently violated
+        """
+        return self.monitor.is_violated()
+
     def check_temporal_constraints(self) -> bool:
         """Check if temporal constraints are violated.
 
@@ -208,6 +265,7 @@ class ContractEnforcer:
             )
             if self.strict_mode:
                 self._handle_deadline_exceeded()
+            self.flush()
             return True
 
         if self.contract.temporal.max_duration is not None:
@@ -226,6 +284,7 @@ class ContractEnforcer:
                 )
                 if self.strict_mode:
                     self._handle_duration_exceeded()
+                self.flush()
                 return True
 
         return False
@@ -244,13 +303,24 @@ class ContractEnforcer:
             "is_violated": self.monitor.is_violated(),
         }
 
-    def add_callback(self, callback: EnforcementCallback) -> None:
+    def add_callback(
+        self, callback: EnforcementCallback, event_types: Iterable[str] | None = None
+    ) -> None:
         """Add a callback function for enforcement events.
 
+        Filtered callbacks are indexed by event type, so emitting an event
+        only visits the callbacks registered for it.
+
         Args:
             callback: Function that takes an EnforcementEvent
+            event_types: Event types to receive; None receives every event
         """
-        self.callbacks.append(callback)
+        if event_types is None:
+            self.callbacks.append(callback)
+            return
+
+        for event_type in event_types:
+            self._typed_callbacks.setdefault(event_type, []).append(callback)
 
     def remove_callback(self, callback: EnforcementCallback) -> None:
         """Remove a callback function.
@@ -261,19 +331,61 @@ class ContractEnforcer:
         if callback in self.callbacks:
             self.callbacks.remove(callback)
 
+        for event_type, callbacks in list(self._typed_callbacks.items()):
+            if callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._typed_callbacks[event_type]
+
+    def has_listeners(self, event_type: str) -> bool:
+        """Check whether an event of this type would reach any callback.
+
+        Lets callers skip building events nobody receives.
+
+        Args:
+            event_type: Type of event about to be emitted
+
+        Returns:
+            True if any per-event, typed or batch callback would receive it
+        """
+        return bool(self.callbacks or self.batch_callbacks or event_type in self._typed_callbacks)
+
+    def flush(self) -> None:
+        """Deliver buffered events to batch callbacks.
+
+        Called automatically before each public enforcer method returns;
+        exposed for callers that emit events through other paths.
+        """
+        if not self._event_buffer:
+            return
+
+        events, self._event_buffer = self._event_buffer, []
+        for callback in self.batch_callbacks:
+            try:
+                callback(events)
+            except Exception as e:
+                # Don't let callback errors crash enforcement
+                print(f"Error in enforcement batch callback: {e}")
+
     def _emit_event(self, event: EnforcementEvent) -> None:
         """Emit an enforcement event to all callbacks.
 
+        Per-event callbacks run immediately; the event is also buffered for
+        batch callbacks, if any are registered.
+
         Args:
             event: Event to emit
         """
-        for callback in self.callbacks:
+        for callback in (*self.callbacks, *self._typed_callbacks.get(event.event_type, ())):
             try:
                 callback(event)
             except Exception as e:
                 # Don't let callback errors crash enforcement
                 print(f"Error in enforcement callback: {e}")
 
+        if self.batch_callbacks:
+            self._event_buffer.append(event)
+
     def _handle_violation(self, violations: list[ViolationInfo]) -> None:
         """Handle constraint violations in strict mode.
 
@@ -288,7 +400,7 @@ class ContractEnforcer:
         self.contract.violate(reason=reason)
 
         # Stop enforcement
-        self.stop(reason=reason)
+        self._stop(reason=reason)
 
         # Emit termination event
         self._emit_event(
@@ -304,7 +416,7 @@ class ContractEnforcer:
         """Handle deadline exceeded in strict mode."""
         reason = f"Deadline exceeded: {self.contract.temporal.deadline}"
         self.contract.expire()
-        self.stop(reason=reason)
+        self._stop(reason=reason)
 
         self._emit_event(
             EnforcementEvent(
@@ -320,7 +432,7 @@ class ContractEnforcer:
         elapsed = self.monitor.usage.elapsed_time()
         reason = f"Max duration exceeded: {elapsed} > {self.contract.temporal.max_duration}"
         self.contract.expire()
-        self.stop(reason=reason)
+        self._stop(reason=reason)
 
         self._emit_event(
             EnforcementEvent(
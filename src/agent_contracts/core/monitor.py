@@ -4,6 +4,7 @@ This module implements the runtime resource monitoring system that tracks actual
 resource consumption and validates it against contract constraints.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
@@ -114,6 +115,31 @@ class ResourceUsage:
         self.tokens += tokens
         self.last_updated = datetime.now()
 
+    def add_api_calls(self, count: int, cost: float = 0.0, tokens: int = 0) -> None:
+        """Record several identical API calls in one update.
+
+        Equivalent to calling add_api_call(cost, tokens) count times.
+
+        Args:
+            count: Number of API calls to record
+            cost: Cost of each call in USD
+            tokens: Number of tokens consumed by each call
+
+        Raises:
+            ValueError: If count, cost or tokens are negative
+        """
+        if count < 0:
+            raise ValueError(f"Call count must be non-negative, got {count}")
+        if cost < 0:
+            raise ValueError(f"Cost must be non-negative, got {cost}")
+        if tokens < 0:
+            raise ValueError(f"Tokens must be non-negative, got {tokens}")
+
+        self.api_calls += count
+        self.cost_usd += cost * count
+        self.tokens += tokens * count
+        self.last_updated = datetime.now()
+
     def add_web_search(self) -> None:
         """Record a web search."""
         self.web_searches += 1
@@ -231,6 +257,21 @@ class ViolationInfo:
         return f"ViolationInfo({self.resource}: {self.actual} > {self.limit})"
 
 
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Point-in-time view of remaining resource budgets.
+
+    Attributes:
+        remaining_tokens: Remaining tokens (inf if unlimited)
+        remaining_cost: Remaining cost in USD (inf if unlimited)
+        remaining_api_calls: Remaining API calls (inf if unlimited)
+    """
+
+    remaining_tokens: float
+    remaining_cost: float
+    remaining_api_calls: float
+
+
 class ResourceMonitor:
     """Monitors resource usage and validates against constraints.
 
@@ -382,10 +423,47 @@ class ResourceMonitor:
     def is_violated(self) -> bool:
         """Check if any constraints are currently violated.
 
+        Unlike check_constraints(), this short-circuits on the first exceeded
+        limit and never builds ViolationInfo objects, so it is cheap enough to
+        call on every agent step.
+
         Returns:
             True if any constraint is violated, False otherwise
         """
-        return len(self.check_constraints()) > 0
+        constraints = self.constraints
+        usage = self.usage
+
+        # Token validation based on mode (mirrors check_constraints)
+        mode = constraints.token_mode
+        if mode == "lumpsum":
+            if constraints.tokens is not None and usage.tokens > constraints.tokens:
+                return True
+        elif mode == "fine_grained":
+            if (
+                constraints.reasoning_tokens is not None
+                and usage.reasoning_tokens > constraints.reasoning_tokens
+            ):
+                return True
+            if constraints.text_tokens is not None and usage.text_tokens > constraints.text_tokens:
+                return True
+
+        return (
+            (constraints.api_calls is not None and usage.api_calls > constraints.api_calls)
+            or (
+                constraints.web_searches is not None
+                and usage.web_searches > constraints.web_searches
+            )
+            or (
+                constraints.tool_invocations is not None
+                and usage.tool_invocations > constraints.tool_invocations
+            )
+            or (constraints.memory_mb is not None and usage.memory_mb > constraints.memory_mb)
+            or (
+                constraints.compute_seconds is not None
+                and usage.compute_seconds > constraints.compute_seconds
+            )
+            or (constraints.cost_usd is not None and usage.cost_usd > constraints.cost_usd)
+        )
 
     def record_violation(self, violation: ViolationInfo) -> None:
         """Record a constraint violation.
@@ -489,6 +567,73 @@ class ResourceMonitor:
             return float("inf")
         return max(0.0, self.constraints.api_calls - self.usage.api_calls)
 
+    def snapshot(self) -> ResourceSnapshot:
+        """Capture all remaining budgets in one call.
+
+        Returns:
+            Frozen snapshot of remaining tokens, cost and API calls
+        """
+        constraints = self.constraints
+        usage = self.usage
+        inf = float("inf")
+        return ResourceSnapshot(
+            remaining_tokens=inf
+            if constraints.tokens is None
+            else max(0.0, constraints.tokens - usage.tokens),
+            remaining_cost=inf
+            if constraints.cost_usd is None
+            else max(0.0, constraints.cost_usd - usage.cost_usd),
+            remaining_api_calls=inf
+            if constraints.api_calls is None
+            else max(0.0, constraints.api_calls - usage.api_calls),
+        )
+
+    # Usage fields accepted by update_resources()
+    _UPDATABLE_RESOURCES = frozenset(
+        {
+            "tokens",
+            "reasoning_tokens",
+            "text_tokens",
+            "api_calls",
+            "web_searches",
+            "tool_invocations",
+            "memory_mb",
+            "compute_seconds",
+            "cost_usd",
+        }
+    )
+
+    def update_resources(self, deltas: Mapping[str, float]) -> None:
+        """Apply several usage increments in a single update.
+
+        Keys are ResourceUsage field names. As with add_tokens(),
+        reasoning_tokens and text_tokens also count toward tokens; memory_mb
+        tracks the peak rather than accumulating. All deltas are validated
+        before any is applied.
+
+        Args:
+            deltas: Mapping of resource name to increment
+
+        Raises:
+            ValueError: If a resource name is unknown or a delta is negative
+        """
+        for resource, delta in deltas.items():
+            if resource not in self._UPDATABLE_RESOURCES:
+                raise ValueError(f"Unknown resource: {resource}")
+            if delta < 0:
+                raise ValueError(f"{resource} must be non-negative, got {delta}")
+
+        usage = self.usage
+        for resource, delta in deltas.items():
+            if resource == "memory_mb":
+                usage.memory_mb = max(usage.memory_mb, delta)
+                continue
+            setattr(usage, resource, getattr(usage, resource) + delta)
+            if resource in ("reasoning_tokens", "text_tokens"):
+                usage.tokens += delta  # type: ignore[assignment]
+
+        usage.last_updated = datetime.now()
+
     def reset(self) -> None:
         """Reset usage tracking and clear violations."""
         self.usage = ResourceUsage()
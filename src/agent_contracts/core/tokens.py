@@ -160,10 +160,13 @@ class TokenCounter:
         if model_lower in MODEL_PRICING:
             return MODEL_PRICING[model_lower]
 
-        # Try prefix match for versioned models
-        for known_model in MODEL_PRICING:
-            if model_lower.startswith(known_model):
-                return MODEL_PRICING[known_model]
+        # Try prefix match for versioned models, preferring the most specific
+        # (longest) prefix so "gpt-4o-mini-2024-07-18" isn't priced as "gpt-4"
+        matches = [
+            known_model for known_model in MODEL_PRICING if model_lower.startswith(known_model)
+        ]
+        if matches:
+            return MODEL_PRICING[max(matches, key=len)]
 
         return None
 
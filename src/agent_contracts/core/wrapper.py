@@ -27,7 +27,9 @@ Example:
     >>> result = wrapped.execute("Write a report")
 """
 
+import inspect
 from collections.abc import Callable
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -96,6 +98,31 @@ class ExecutionLog:
         }
 
 
+@dataclass
+class _ExecutionRun:
+    """State of a single execution, kept off the agent so concurrent runs don't mix.
+
+    Attributes:
+        start_time: When the execution started
+        events: Events recorded during this execution
+        log: Execution log (None if logging is disabled)
+        events_token: Token restoring the previous event sink when the run ends
+    """
+
+    start_time: datetime
+    events: list[dict[str, Any]]
+    log: ExecutionLog | None
+    events_token: Token[list[dict[str, Any]] | None]
+
+
+# Event list of the execution running in the current context. Each asyncio
+# task (and thread) has its own context, so enforcement events raised while
+# several executions are interleaved land in the right run's log.
+_current_events: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "_current_events", default=None
+)
+
+
 class ContractAgent[TInput, TOutput]:
     """Contract-aware agent wrapper (Whitepaper Section 5.3).
 
@@ -151,9 +178,11 @@ class ContractAgent[TInput, TOutput]:
         # IMPORTANT: Make enforcer use the same resource monitor for tracking
         self.enforcer.monitor = self.resource_monitor
 
-        # Execution state
+        # Execution state (log and events of the most recent execution)
         self.execution_log: ExecutionLog | None = None
         self._events: list[dict[str, Any]] = []
+        # Number of executions in flight; the temporal clock starts with the first
+        self._active_runs = 0
 
     def execute(self, input_data: TInput) -> ExecutionResult[TOutput]:
         """Execute agent within contract constraints.
@@ -175,13 +204,57 @@ class ContractAgent[TInput, TOutput]:
         Raises:
             ContractViolationError: If strict_mode=True and violation occurs
         """
-        # Start execution
+        run = self._begin_execution()
+
+        try:
+            # Execute agent with monitoring
+            output = self._monitored_execution(input_data)
+            return self._finish_execution(output, run)
+        except Exception as e:
+            return self._fail_execution(e, run)
+        finally:
+            self._end_execution(run)
+
+    async def aexecute(self, input_data: TInput) -> ExecutionResult[TOutput]:
+        """Execute agent within contract constraints without blocking the event loop.
+
+        Async counterpart of execute() with the same lifecycle, so many
+        I/O-bound executions can be interleaved with asyncio.gather(). Each
+        execution keeps its own events and log; resource usage and contract
+        state are shared, as with sequential calls.
+
+        Args:
+            input_data: Input to pass to the agent
+
+        Returns:
+            ExecutionResult with output, success status, and audit log
+        """
+        run = self._begin_execution()
+
+        try:
+            # Execute agent with monitoring
+            output = await self._amonitored_execution(input_data)
+            return self._finish_execution(output, run)
+        except Exception as e:
+            return self._fail_execution(e, run)
+        finally:
+            self._end_execution(run)
+
+    def _begin_execution(self) -> _ExecutionRun:
+        """Set up logging, monitoring and enforcement for one execution.
+
+        Must be paired with _end_execution(), typically in a finally block.
+
+        Returns:
+            State of the new execution
+        """
         start_time = datetime.now()
-        self._events = []
+        events: list[dict[str, Any]] = []
 
         # Initialize execution log
+        log = None
         if self.enable_logging:
-            self.execution_log = ExecutionLog(
+            log = ExecutionLog(
                 contract_id=self.contract.id,
                 start_time=start_time,
                 end_time=None,
@@ -191,110 +264,144 @@ class ContractAgent[TInput, TOutput]:
                 events=[],
                 metadata={},
             )
+            self.execution_log = log
+        self._events = events
 
-        # Start monitoring
-        self.temporal_monitor.start()
+        # Start monitoring, unless a concurrent execution already started it
+        if self._active_runs == 0:
+            self.temporal_monitor.start()
+        self._active_runs += 1
 
         # Start enforcement (only if not already active)
         if not self.enforcer._enforcement_active:
             self.enforcer.start()
 
-        try:
-            # Inject budget/time awareness (optional - agent may use these)
-            # For now, agents need to manually check these via get_remaining_budget()
-            # Future: Could use decorators or context managers for automatic injection
+        return _ExecutionRun(
+            start_time=start_time,
+            events=events,
+            log=log,
+            events_token=_current_events.set(events),
+        )
 
-            # Execute agent with monitoring
-            output = self._monitored_execution(input_data)
+    def _end_execution(self, run: _ExecutionRun) -> None:
+        """Release the per-execution state set up by _begin_execution().
 
-            # Check constraints after execution
-            is_violated, _constraint_violations = self.enforcer.check_constraints()
-
-            # Check temporal constraints
-            self.enforcer.check_temporal_constraints()
-
-            # Check success criteria
-            success = self._check_success_criteria(output) and not is_violated
-
-            # Update contract state based on violations
-            # Note: We keep it ACTIVE if successful to allow cumulative tracking
-            # Only mark as VIOLATED if there were actual violations
-            if is_violated:
-                self.contract.state = ContractState.VIOLATED
-            elif not success:
-                self.contract.state = ContractState.VIOLATED
-                self._events.append(
-                    {
-                        "type": "incomplete",
-                        "message": "Success criteria not met",
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
-            # else: keep contract in ACTIVE state for cumulative tracking
-
-            violations = [
-                event["message"]
-                for event in self._events
-                if event["type"] in ("violation", "constraint_violated")
-            ]
-
-            # Note: We don't stop the enforcer here to allow cumulative tracking
-            # across multiple execute() calls. The enforcer stays active.
-
-            # Finalize log
-            end_time = datetime.now()
-            if self.enable_logging and self.execution_log:
-                self.execution_log.end_time = end_time
-                self.execution_log.final_state = self.contract.state
-                self.execution_log.resource_usage = {
-                    "tokens": self.resource_monitor.usage.tokens,
-                    "reasoning_tokens": self.resource_monitor.usage.reasoning_tokens,
-                    "text_tokens": self.resource_monitor.usage.text_tokens,
-                    "api_calls": self.resource_monitor.usage.api_calls,
-                    "cost_usd": self.resource_monitor.usage.cost_usd,
-                }
-                self.execution_log.temporal_metrics = {
-                    "elapsed_seconds": (end_time - start_time).total_seconds(),
-                    "deadline_met": not self.temporal_monitor.is_past_deadline(),
-                }
-                self.execution_log.events = self._events
-
-            return ExecutionResult(
-                output=output,
-                contract=self.contract,
-                success=success,
-                violations=violations,
-                execution_log=self.execution_log,  # type: ignore
-                metadata={"elapsed_seconds": (end_time - start_time).total_seconds()},
-            )
+        Args:
+            run: State of the execution that ended
+        """
+        self._active_runs -= 1
+        _current_events.reset(run.events_token)
 
-        except Exception as e:
-            # Note: Don't stop enforcer to allow recovery and cumulative tracking
+    def _finish_execution(self, output: TOutput, run: _ExecutionRun) -> ExecutionResult[TOutput]:
+        """Check constraints and success criteria after the agent returned.
 
-            # Handle execution failure
+        Args:
+            output: Agent's output
+            run: State of the execution
+
+        Returns:
+            ExecutionResult for a completed execution
+        """
+        # Check constraints after execution
+        is_violated, _constraint_violations = self.enforcer.check_constraints()
+
+        # Check temporal constraints
+        self.enforcer.check_temporal_constraints()
+
+        # Check success criteria
+        success = self._check_success_criteria(output) and not is_violated
+
+        # Update contract state based on violations
+        # Note: We keep it ACTIVE if successful to allow cumulative tracking
+        # Only mark as VIOLATED if there were actual violations
+        if is_violated:
+            self.contract.state = ContractState.VIOLATED
+        elif not success:
             self.contract.state = ContractState.VIOLATED
-            self._events.append(
-                {"type": "error", "message": str(e), "timestamp": datetime.now().isoformat()}
+            run.events.append(
+                {
+                    "type": "incomplete",
+                    "message": "Success criteria not met",
+                    "timestamp": datetime.now().isoformat(),
+                }
             )
+        # else: keep contract in ACTIVE state for cumulative tracking
+
+        violations = [
+            event["message"]
+            for event in run.events
+            if event["type"] in ("violation", "constraint_violated")
+        ]
+
+        # Note: We don't stop the enforcer here to allow cumulative tracking
+        # across multiple execute() calls. The enforcer stays active.
+
+        # Finalize log
+        start_time = run.start_time
+        end_time = datetime.now()
+        log = run.log
+        if log is not None:
+            log.end_time = end_time
+            log.final_state = self.contract.state
+            log.resource_usage = {
+                "tokens": self.resource_monitor.usage.tokens,
+                "reasoning_tokens": self.resource_monitor.usage.reasoning_tokens,
+                "text_tokens": self.resource_monitor.usage.text_tokens,
+                "api_calls": self.resource_monitor.usage.api_calls,
+                "cost_usd": self.resource_monitor.usage.cost_usd,
+            }
+            log.temporal_metrics = {
+                "elapsed_seconds": (end_time - start_time).total_seconds(),
+                "deadline_met": not self.temporal_monitor.is_past_deadline(),
+            }
+            log.events = run.events
+
+        return ExecutionResult(
+            output=output,
+            contract=self.contract,
+            success=success,
+            violations=violations,
+            execution_log=log,  # type: ignore[arg-type]
+            metadata={"elapsed_seconds": (end_time - start_time).total_seconds()},
+        )
 
-            # Finalize log
-            end_time = datetime.now()
-            if self.enable_logging and self.execution_log:
-                self.execution_log.end_time = end_time
-                self.execution_log.final_state = self.contract.state
-                self.execution_log.events = self._events
-
-            return ExecutionResult(
-                output=None,
-                contract=self.contract,
-                success=False,
-                violations=[str(e)],
-                execution_log=self.execution_log,  # type: ignore
-                metadata={
-                    "error": str(e),
-                    "elapsed_seconds": (end_time - start_time).total_seconds(),
-                },
-            )
+    def _fail_execution(self, error: Exception, run: _ExecutionRun) -> ExecutionResult[TOutput]:
+        """Record a failed execution.
+
+        Args:
+            error: Exception raised during execution
+            run: State of the execution
+
+        Returns:
+            ExecutionResult for a failed execution
+        """
+        # Note: Don't stop enforcer to allow recovery and cumulative tracking
+
+        # Handle execution failure
+        self.contract.state = ContractState.VIOLATED
+        run.events.append(
+            {"type": "error", "message": str(error), "timestamp": datetime.now().isoformat()}
+        )
+
+        # Finalize log
+        end_time = datetime.now()
+        log = run.log
+        if log is not None:
+            log.end_time = end_time
+            log.final_state = self.contract.state
+            log.events = run.events
+
+        return ExecutionResult(
+            output=None,
+            contract=self.contract,
+            success=False,
+            violations=[str(error)],
+            execution_log=log,  # type: ignore[arg-type]
+            metadata={
+                "error": str(error),
+                "elapsed_seconds": (end_time - run.start_time).total_seconds(),
+            },
+        )
 
     def _monitored_execution(self, input_data: TInput) -> TOutput:
         """Execute agent with active monitoring.
@@ -312,6 +419,24 @@ class ContractAgent[TInput, TOutput]:
         # Subclasses (like ContractedChain) will override to add monitoring
         return self.agent(input_data)
 
+    async def _amonitored_execution(self, input_data: TInput) -> TOutput:
+        """Async counterpart of _monitored_execution().
+
+        The base implementation calls the agent and awaits the result if the
+        agent is a coroutine function. Subclasses wrapping async-capable
+        frameworks override this to use their native async APIs.
+
+        Args:
+            input_data: Input to pass to the agent
+
+        Returns:
+            Agent's output
+        """
+        output: Any = self.agent(input_data)
+        if inspect.isawaitable(output):
+            output = await output
+        return output  # type: ignore[no-any-return]
+
     def _check_success_criteria(self, output: TOutput) -> bool:
         """Check if success criteria are met.
 
@@ -332,7 +457,11 @@ class ContractAgent[TInput, TOutput]:
             event: Enforcement event from ContractEnforcer
         """
         if self.enable_logging:
-            self._events.append(
+            # Record into the execution running in this context, if any
+            events = _current_events.get()
+            if events is None:
+                events = self._events
+            events.append(
                 {
                     "type": event.event_type,
                     "message": event.message,
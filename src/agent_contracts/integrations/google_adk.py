@@ -39,22 +39,145 @@ Example:
     ... )
 """
 
+import hashlib
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from agent_contracts.core.contract import Contract
+from agent_contracts.core.enforcement import ContractEnforcer
+from agent_contracts.core.monitor import ResourceMonitor
 from agent_contracts.core.wrapper import ContractAgent
 
-# Type checking imports
+# All google-adk imports are resolved once here; the original ImportError is
+# kept so constructing a wrapper without google-adk fails with a clear cause
+_IMPORT_ERROR: ImportError | None = None
 try:
     from google.adk.agents import LlmAgent
     from google.adk.runners import Event, InMemoryRunner
+    from google.genai.types import Content, Part
 
     GOOGLE_ADK_AVAILABLE = True
-except ImportError:
+except ImportError as e:
     GOOGLE_ADK_AVAILABLE = False
+    _IMPORT_ERROR = e
     LlmAgent = Any
     Event = Any
     InMemoryRunner = Any
+    Content = Any
+    Part = Any
+
+# Gemini 2.0 Flash pricing: ~$0.075 per 1M input, ~$0.30 per 1M output tokens
+_COST_PER_INPUT_TOKEN = 0.075 / 1_000_000
+_COST_PER_OUTPUT_TOKEN = 0.30 / 1_000_000
+
+# (event_generator, events or None, per-agent usage or None)
+#   -> (final_response, cumulative_usage)
+_EventLoop = Callable[
+    [Iterable[Any], list[Any] | None, dict[str, int] | None],
+    tuple[str, dict[str, int]],
+]
+
+
+def _make_event_loop(
+    *,
+    strict: bool,
+    monitor: ResourceMonitor,
+    enforcer: ContractEnforcer,
+    cost_in: float = _COST_PER_INPUT_TOKEN,
+    cost_out: float = _COST_PER_OUTPUT_TOKEN,
+) -> _EventLoop:
+    """Build the per-event processing loop for a contracted ADK agent.
+
+    Everything that is fixed for the lifetime of a wrapper (strict mode, the
+    monitor, the enforcer, pricing) is closed over once here, so the loop body
+    does no attribute lookups on the wrapper itself.
+
+    Args:
+        strict: If True, raise on the first violation during execution
+        monitor: Resource monitor to record usage in
+        enforcer: Enforcer used for per-event constraint checks
+        cost_in: Cost in USD per prompt token
+        cost_out: Cost in USD per candidates (output) token
+
+    Returns:
+        Function processing an event stream into (final_response, usage totals)
+    """
+    check_fast = enforcer.check_constraints_fast
+    check = enforcer.check_constraints
+
+    def event_loop(
+        event_generator: Iterable[Any],
+        events: list[Any] | None,
+        per_agent_usage: dict[str, int] | None,
+    ) -> tuple[str, dict[str, int]]:
+        final_response = ""
+        cumulative_usage: dict[str, int] = {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "candidates_tokens": 0,
+            "cached_tokens": 0,
+            "thoughts_tokens": 0,
+        }
+
+        # Resolved per run (not at build time) since monitor.reset() swaps usage
+        add_tokens = monitor.usage.add_tokens
+        add_api_call = monitor.usage.add_api_call
+
+        for event in event_generator:
+            if events is not None:
+                events.append(event)
+
+            # Track token usage from each event
+            usage = event.usageMetadata
+            if usage:
+                # Read each usage field once; everything below uses the locals
+                total_tc = usage.total_token_count or 0
+                prompt_tc = usage.prompt_token_count or 0
+                cand_tc = usage.candidates_token_count or 0
+                cached_tc = usage.cached_content_token_count or 0
+                thoughts_tc = usage.thoughts_token_count or 0
+
+                # Update cumulative tracking
+                cumulative_usage["total_tokens"] += total_tc
+                cumulative_usage["prompt_tokens"] += prompt_tc
+                cumulative_usage["candidates_tokens"] += cand_tc
+                cumulative_usage["cached_tokens"] += cached_tc
+                cumulative_usage["thoughts_tokens"] += thoughts_tc
+
+                # Attribute tokens to the authoring sub-agent
+                if per_agent_usage is not None:
+                    author = getattr(event, "author", None) or "root"
+                    per_agent_usage[author] = per_agent_usage.get(author, 0) + total_tc
+
+                # Track tokens in resource monitor
+                if total_tc > 0:
+                    # Track tokens with breakdown (reasoning vs text)
+                    add_tokens(
+                        count=0,  # count not used when text/reasoning provided
+                        reasoning=thoughts_tc,
+                        text=total_tc - thoughts_tc,
+                    )
+
+                    # Track API call with cost estimate
+                    add_api_call(cost=prompt_tc * cost_in + cand_tc * cost_out, tokens=0)
+
+            # Extract final response
+            if event.content and event.content.parts:
+                for part in event.content.parts:
+                    if hasattr(part, "text") and part.text:
+                        final_response = part.text
+
+            # Check constraints during execution (cheap bool check first; the
+            # full violation list is only built when something is exceeded)
+            if check_fast():
+                is_violated, violations = check()
+                if is_violated and strict:
+                    # Stop execution on violation
+                    raise RuntimeError(f"Contract violated during execution: {violations}")
+
+        return final_response, cumulative_usage
+
+    return event_loop
 
 
 class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
@@ -129,11 +252,11 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
         Raises:
             ImportError: If google-adk is not installed
         """
-        if not GOOGLE_ADK_AVAILABLE:
+        if _IMPORT_ERROR is not None:
             raise ImportError(
                 "google-adk is required for Google ADK integration. "
                 "Install with: pip install google-adk"
-            )
+            ) from _IMPORT_ERROR
 
         # Initialize base ContractAgent with agent execution as callable
         super().__init__(
@@ -149,12 +272,23 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
         if runner is not None:
             self.runner = runner
         else:
-            # Import here to avoid issues if google-adk not installed
-            from google.adk.runners import InMemoryRunner
-
             # InMemoryRunner just needs the agent
             self.runner = InMemoryRunner(agent=agent)
 
+        # Last budget snapshot sent to the agent (see _monitored_execution)
+        self._last_pressure_bucket: int | None = None
+        self._last_remaining_tokens: float | None = None
+
+        # Per-sub-agent token totals (only tracked by ContractedAdkMultiAgent)
+        self._per_agent_usage: dict[str, int] | None = None
+
+        # Event loop specialized for this wrapper's mode, monitor and enforcer
+        self._event_loop = _make_event_loop(
+            strict=strict_mode,
+            monitor=self.resource_monitor,
+            enforcer=self.enforcer,
+        )
+
     def _run_agent(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Run the Google ADK agent.
 
@@ -166,38 +300,29 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
                 - session_id: Session identifier
                 - message: User message (string or Content)
                 - run_config: Optional run configuration
+                - collect_events: If True, keep every event in the result
 
         Returns:
             Dictionary containing:
                 - response: Final agent response text
-                - events: List of all events from execution
+                - events: List of all events (empty unless collect_events)
                 - total_tokens: Total tokens used
                 - usage_metadata: Detailed usage information
+                - per_agent_tokens: Tokens per agent name (multi-agent only)
         """
         # Extract parameters
         user_id = inputs.get("user_id", "user")
         session_id = inputs.get("session_id", "session")
         message = inputs.get("message", "")
         run_config = inputs.get("run_config")
+        collect_events = inputs.get("collect_events", False)
 
         # Convert message to Content if it's a string
-        if isinstance(message, str):
-            from google.genai.types import Content, Part
+        content = Content(parts=[Part(text=message)]) if isinstance(message, str) else message
 
-            content = Content(parts=[Part(text=message)])
-        else:
-            content = message
-
-        # Run agent and collect events
-        events: list[Any] = []
-        final_response = ""
-        cumulative_usage: dict[str, int] = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "candidates_tokens": 0,
-            "cached_tokens": 0,
-            "thoughts_tokens": 0,
-        }
+        # Run agent (events are only retained when the caller asks for them)
+        events: list[Any] | None = [] if collect_events else None
+        per_agent_usage = self._per_agent_usage
 
         # Execute agent via runner
         event_generator = self.runner.run(
@@ -207,61 +332,54 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
             run_config=run_config,
         )
 
-        # Process events and track usage
-        for event in event_generator:
-            events.append(event)
-
-            # Track token usage from each event
-            if event.usageMetadata:
-                usage = event.usageMetadata
-                event_tokens = usage.total_token_count or 0
+        # Process events and track usage with the loop specialized at __init__
+        final_response, cumulative_usage = self._event_loop(
+            event_generator, events, per_agent_usage
+        )
 
-                # Update cumulative tracking
-                cumulative_usage["total_tokens"] += event_tokens
-                cumulative_usage["prompt_tokens"] += usage.prompt_token_count or 0
-                cumulative_usage["candidates_tokens"] += usage.candidates_token_count or 0
-                cumulative_usage["cached_tokens"] += usage.cached_content_token_count or 0
-                cumulative_usage["thoughts_tokens"] += usage.thoughts_token_count or 0
+        result: dict[str, Any] = {
+            "response": final_response,
+            "events": events or [],
+            "total_tokens": cumulative_usage["total_tokens"],
+            "usage_metadata": cumulative_usage,
+        }
+        if per_agent_usage is not None:
+            result["per_agent_tokens"] = dict(per_agent_usage)
+        return result
 
-                # Track tokens in resource monitor
-                if event_tokens > 0:
-                    # Track tokens with breakdown
-                    reasoning_tokens = usage.thoughts_token_count or 0
-                    text_tokens = event_tokens - reasoning_tokens
+    def _budget_changed(self, remaining_tokens: float, time_pressure: float) -> bool:
+        """Check whether the budget moved enough to be worth re-sending.
 
-                    self.resource_monitor.usage.add_tokens(
-                        count=0,  # count not used when text/reasoning provided
-                        reasoning=reasoning_tokens,
-                        text=text_tokens,
-                    )
+        The budget is considered unchanged when time pressure stays in the same
+        10% bucket and remaining tokens are within 10% of the last snapshot
+        sent. The snapshot itself is only updated by _record_budget_sent(),
+        once a turn carrying it has completed.
 
-                    # Track API call with cost estimate
-                    # Gemini 2.0 Flash: ~$0.075 per 1M input, ~$0.30 per 1M output
-                    # Use weighted average based on typical input/output ratio
-                    prompt_cost = (usage.prompt_token_count or 0) * 0.000000075
-                    output_cost = (usage.candidates_token_count or 0) * 0.00000030
-                    total_cost = prompt_cost + output_cost
+        Args:
+            remaining_tokens: Current remaining token budget
+            time_pressure: Current time pressure (0.0-1.0)
 
-                    self.resource_monitor.usage.add_api_call(cost=total_cost, tokens=0)
+        Returns:
+            True if budget info should be injected for this turn
+        """
+        pressure_bucket = int(time_pressure * 10)
+        last_tokens = self._last_remaining_tokens
 
-            # Extract final response
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, "text") and part.text:
-                        final_response = part.text
+        if pressure_bucket != self._last_pressure_bucket or last_tokens is None:
+            return True
+        return remaining_tokens != last_tokens and (
+            abs(remaining_tokens - last_tokens) > 0.1 * last_tokens
+        )
 
-            # Check constraints during execution
-            is_violated, violations = self.enforcer.check_constraints()
-            if is_violated and self.strict_mode:
-                # Stop execution on violation
-                raise RuntimeError(f"Contract violated during execution: {violations}")
+    def _record_budget_sent(self, remaining_tokens: float, time_pressure: float) -> None:
+        """Remember the budget snapshot delivered by a successful turn.
 
-        return {
-            "response": final_response,
-            "events": events,
-            "total_tokens": cumulative_usage["total_tokens"],
-            "usage_metadata": cumulative_usage,
-        }
+        Args:
+            remaining_tokens: Remaining token budget that was sent
+            time_pressure: Time pressure that was sent
+        """
+        self._last_pressure_bucket = int(time_pressure * 10)
+        self._last_remaining_tokens = remaining_tokens
 
     def _monitored_execution(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Execute agent with monitoring.
@@ -274,17 +392,29 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
         Returns:
             Agent's output dictionary
         """
-        # Add budget awareness to inputs
+        # Add budget awareness to inputs, but only when it has meaningfully
+        # changed since the last turn so steady-state turns don't re-send it
+        budget_sent = False
         if "budget_info" not in input_data:
-            input_data["budget_info"] = {
-                "remaining_tokens": self.resource_monitor.get_remaining_tokens(),
-                "remaining_cost": self.resource_monitor.get_remaining_cost(),
-                "remaining_api_calls": self.resource_monitor.get_remaining_api_calls(),
-                "time_pressure": self.temporal_monitor.get_time_pressure(),
-            }
+            remaining_tokens = self.resource_monitor.get_remaining_tokens()
+            time_pressure = self.temporal_monitor.get_time_pressure()
+            if self._budget_changed(remaining_tokens, time_pressure):
+                input_data["budget_info"] = {
+                    "remaining_tokens": remaining_tokens,
+                    "remaining_cost": self.resource_monitor.get_remaining_cost(),
+                    "remaining_api_calls": self.resource_monitor.get_remaining_api_calls(),
+                    "time_pressure": time_pressure,
+                }
+                budget_sent = True
 
         # Execute agent
-        return self._run_agent(input_data)
+        output = self._run_agent(input_data)
+
+        # Only a completed turn counts as having delivered the budget; after a
+        # failure the next turn re-sends it
+        if budget_sent:
+            self._record_budget_sent(remaining_tokens, time_pressure)
+        return output
 
     def run(
         self,
@@ -292,6 +422,7 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
         session_id: str,
         message: str,
         run_config: Any | None = None,
+        collect_events: bool = False,
     ) -> dict[str, Any]:
         """Execute agent with contract enforcement (ADK-style API).
 
@@ -303,6 +434,8 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
             session_id: Session identifier
             message: User message
             run_config: Optional run configuration
+            collect_events: If True, return all ADK events under "events"
+                (defaults to False to avoid retaining every event)
 
         Returns:
             Dictionary with response and metadata
@@ -316,6 +449,7 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
             "session_id": session_id,
             "message": message,
             "run_config": run_config,
+            "collect_events": collect_events,
         }
 
         # Execute with contract enforcement
@@ -349,6 +483,7 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
         user_id: str,
         session_id: str,
         message: str,
+        collect_events: bool = False,
     ) -> dict[str, Any]:
         """Make the contracted agent callable.
 
@@ -356,11 +491,17 @@ class ContractedAdkAgent(ContractAgent[dict[str, Any], dict[str, Any]]):
             user_id: User identifier
             session_id: Session identifier
             message: User message
+            collect_events: If True, return all ADK events under "events"
 
         Returns:
             Dictionary with response and metadata
         """
-        return self.run(user_id=user_id, session_id=session_id, message=message)
+        return self.run(
+            user_id=user_id,
+            session_id=session_id,
+            message=message,
+            collect_events=collect_events,
+        )
 
 
 class ContractedAdkMultiAgent(ContractedAdkAgent):
@@ -372,7 +513,10 @@ class ContractedAdkMultiAgent(ContractedAdkAgent):
 
     Multi-agent systems can spiral out of control quickly as agents coordinate,
     delegate tasks, and iterate. This wrapper ensures the total budget is
-    respected across all agents in the hierarchy.
+    respected across all agents in the hierarchy, and additionally attributes
+    tokens to each sub-agent (by event author) so the agents burning the
+    budget can be identified. Per-agent totals accumulate across runs and are
+    returned as "per_agent_tokens" in the result.
 
     Example:
         >>> from google.adk.agents import LlmAgent
@@ -412,9 +556,62 @@ class ContractedAdkMultiAgent(ContractedAdkAgent):
         ...     session_id="session1",
         ...     message="Research and plan a marketing campaign"
         ... )
+        >>> print(result["per_agent_tokens"])  # e.g. {"researcher": 5200, ...}
     """
 
-    pass  # Inherits all behavior from ContractedAdkAgent
+    def __init__(
+        self,
+        contract: Contract,
+        agent: Any,  # Google ADK LlmAgent type
+        strict_mode: bool = True,
+        enable_logging: bool = True,
+        runner: Any | None = None,  # Optional custom Runner
+    ) -> None:
+        """Initialize contracted Google ADK multi-agent system.
+
+        Args:
+            contract: Contract to enforce across all agents
+            agent: Coordinator LlmAgent (with sub_agents) to wrap
+            strict_mode: If True, violations cause immediate termination
+            enable_logging: If True, log execution for audit trail
+            runner: Optional custom Runner (defaults to InMemoryRunner)
+        """
+        super().__init__(
+            contract=contract,
+            agent=agent,
+            strict_mode=strict_mode,
+            enable_logging=enable_logging,
+            runner=runner,
+        )
+        self._per_agent_usage = {}
+
+    def get_per_agent_usage(self) -> dict[str, int]:
+        """Get cumulative tokens used by each agent in the hierarchy.
+
+        Returns:
+            Dictionary mapping agent name (event author) to total tokens
+        """
+        return dict(self._per_agent_usage or {})
+
+
+def _stable_agent_id(agent: Any) -> str:
+    """Derive a process-independent contract ID from an agent's configuration.
+
+    Hashes the agent's name, model and instruction so the same agent definition
+    gets the same contract ID across restarts, keeping downstream caches keyed
+    on the contract ID reusable.
+
+    Args:
+        agent: Google ADK agent
+
+    Returns:
+        Contract ID of the form "adk-agent-<16 hex chars>"
+    """
+    key_src = "\0".join(
+        str(getattr(agent, attr, "") or "") for attr in ("name", "model", "instruction")
+    )
+    digest = hashlib.blake2b(key_src.encode(), digest_size=8).hexdigest()
+    return f"adk-agent-{digest}"
 
 
 # Convenience function for creating contracted ADK agents
@@ -457,8 +654,8 @@ def create_contracted_adk_agent(
         TemporalConstraints,
     )
 
-    # Create contract
-    contract_id_val = contract_id or f"adk-agent-{id(agent)}"
+    # Create contract (default ID is stable across processes, unlike id(agent))
+    contract_id_val = contract_id or _stable_agent_id(agent)
     contract = Contract(
         id=contract_id_val,
         name=contract_id_val,
@@ -22,33 +22,355 @@ Example:
     >>>
     >>> # Execute with automatic budget enforcement
     >>> result = contracted_chain.execute({"input": "Write a report"})
+    >>>
+    >>> # Or interleave many I/O-bound executions
+    >>> results = await asyncio.gather(*(contracted_chain.aexecute(x) for x in inputs))
 """
 
-from typing import Any
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import weakref
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from typing import Any, Protocol
 
 from agent_contracts.core.contract import Contract
+from agent_contracts.core.tokens import TokenCounter
 from agent_contracts.core.wrapper import ContractAgent, ExecutionResult
 
-# Type checking imports
+# LangChain imports, resolved once at module import
 try:
     # LangChain 1.0+ uses langchain_core
+    from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackHandler
+    from langchain_core.output_parsers import StrOutputParser
     from langchain_core.outputs import LLMResult
+    from langchain_core.prompts import PromptTemplate
     from langchain_core.runnables import Runnable as Chain
+    from langchain_core.runnables import RunnableLambda
 
     LANGCHAIN_AVAILABLE = True
+    _LCEL_AVAILABLE = True
 except ImportError:
+    _LCEL_AVAILABLE = False
     try:
         # Fallback for older LangChain versions
+        from langchain.callbacks.base import AsyncCallbackHandler, BaseCallbackHandler
+        from langchain.chains import LLMChain
         from langchain.chains.base import Chain
+        from langchain.prompts import PromptTemplate
         from langchain.schema import LLMResult
 
         LANGCHAIN_AVAILABLE = True
     except ImportError:
         LANGCHAIN_AVAILABLE = False
+        AsyncCallbackHandler = object
+        BaseCallbackHandler = object
         Chain = Any
         LLMResult = Any
 
 
+def _as_text_output(text: str) -> dict[str, Any]:
+    """Wrap LLM text to match the old LLMChain API (dict with "text" key)."""
+    return {"text": text}
+
+
+# Stateless building blocks shared by every ContractedLLM
+if _LCEL_AVAILABLE:
+    _PASSTHROUGH_PROMPT = PromptTemplate.from_template("{input}")
+    _TEXT_OUTPUT = StrOutputParser() | RunnableLambda(_as_text_output)
+elif LANGCHAIN_AVAILABLE:
+    _PASSTHROUGH_PROMPT = PromptTemplate(input_variables=["input"], template="{input}")
+
+# Canonical JSON for cache keys: orjson (installed with langchain-core via
+# langsmith) is several times faster than the stdlib for large inputs
+try:
+    import orjson
+
+    def _canonical_json(data: Any) -> bytes:
+        """Serialize data to sorted-key JSON bytes."""
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which only the stdlib handles
+            return json.dumps(data, sort_keys=True, default=str).encode()
+
+except ImportError:
+
+    def _canonical_json(data: Any) -> bytes:
+        """Serialize data to sorted-key JSON bytes."""
+        return json.dumps(data, sort_keys=True, default=str).encode()
+
+
+# Fallback (prompt, completion) price per token for models missing from
+# MODEL_PRICING: ~$0.15 per 1M tokens, the Gemini 2.5 Flash average
+_DEFAULT_PRICING = (0.15 / 1_000_000, 0.15 / 1_000_000)
+
+
+@functools.lru_cache(maxsize=64)
+def _pricing_for(model_name: str | None) -> tuple[float, float]:
+    """Return the (prompt, completion) price per token for a model.
+
+    Args:
+        model_name: Model name reported by the provider (may be None)
+
+    Returns:
+        Tuple of (prompt price, completion price) in USD per token
+    """
+    pricing = TokenCounter.get_model_pricing(model_name) if model_name else None
+    if pricing is None:
+        return _DEFAULT_PRICING
+    return pricing["input"], pricing["output"]
+
+
+def _estimate_cost(
+    pricing: tuple[float, float], prompt_tokens: int, completion_tokens: int, total_tokens: int
+) -> float:
+    """Estimate the cost of an LLM call.
+
+    Args:
+        pricing: (prompt, completion) price per token
+        prompt_tokens: Input tokens (0 if unknown)
+        completion_tokens: Output tokens (0 if unknown)
+        total_tokens: Total tokens, used at the average rate if no split is reported
+
+    Returns:
+        Estimated cost in USD
+    """
+    prompt_price, completion_price = pricing
+    if prompt_tokens or completion_tokens:
+        return prompt_price * prompt_tokens + completion_price * completion_tokens
+    return total_tokens * (prompt_price + completion_price) / 2
+
+
+def _chain_reads_budget_info(chain: Any) -> bool:
+    """Check whether a chain may read the injected budget_info input.
+
+    Uses the prompt's input_variables or the Runnable's input_schema fields
+    when they are available; chains with unknown inputs are assumed to read it.
+
+    Args:
+        chain: LangChain chain or Runnable
+
+    Returns:
+        False only if the chain's declared inputs exclude budget_info
+    """
+    input_variables = getattr(chain, "input_variables", None)
+    if isinstance(input_variables, list | tuple | set | frozenset):
+        return "budget_info" in input_variables
+
+    model_fields = getattr(getattr(chain, "input_schema", None), "model_fields", None)
+    # A lone "root" field is a RootModel, i.e. an untyped/opaque input
+    if isinstance(model_fields, dict) and model_fields and "root" not in model_fields:
+        return "budget_info" in model_fields
+
+    return True
+
+
+def _quantize_tokens(remaining: float) -> float:
+    """Round remaining tokens down to a multiple of 1024 (kept exact below 1024)."""
+    if remaining == float("inf") or remaining < 1024:
+        return remaining
+    return float(int(remaining) // 1024 * 1024)
+
+
+def _quantize_cost(remaining: float) -> float:
+    """Round remaining cost down to whole cents."""
+    if remaining == float("inf"):
+        return remaining
+    return int(remaining * 100) / 100
+
+
+def _quantize_pressure(pressure: float) -> float:
+    """Round time pressure to one decimal place."""
+    return round(pressure, 1)
+
+
+class _BudgetView(Mapping[str, float]):
+    """Read-only budget_info mapping that queries the monitors on access.
+
+    The chain only pays for the values it actually reads (e.g. when a prompt
+    template formats {budget_info}). The first read takes one
+    ResourceMonitor.snapshot() plus the time pressure; later reads reuse
+    them. A new view is created for each execution, so a view handed to one
+    execution never changes value afterwards.
+
+    Values are quantized to coarse buckets so a rendered budget stays
+    byte-identical across calls until it moves to the next bucket, which
+    keeps provider-side prompt caches warm.
+    """
+
+    __slots__ = ("_resource_monitor", "_temporal_monitor", "_values")
+
+    _KEYS = ("remaining_tokens", "remaining_cost", "time_pressure")
+
+    def __init__(self, resource_monitor: Any, temporal_monitor: Any) -> None:
+        """Initialize view over the wrapper's monitors.
+
+        Args:
+            resource_monitor: ResourceMonitor providing remaining tokens/cost
+            temporal_monitor: TemporalMonitor providing time pressure
+        """
+        self._resource_monitor = resource_monitor
+        self._temporal_monitor = temporal_monitor
+        self._values: dict[str, float] | None = None
+
+    def _snapshot(self) -> dict[str, float]:
+        """Return the (quantized) values, computing them on first read."""
+        if self._values is None:
+            snapshot = self._resource_monitor.snapshot()
+            self._values = {
+                "remaining_tokens": _quantize_tokens(snapshot.remaining_tokens),
+                "remaining_cost": _quantize_cost(snapshot.remaining_cost),
+                "time_pressure": _quantize_pressure(self._temporal_monitor.get_time_pressure()),
+            }
+        return self._values
+
+    def __getitem__(self, key: str) -> float:
+        """Read the (quantized) value for a budget key."""
+        return self._snapshot()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over budget keys."""
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        """Return the number of budget keys."""
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        """Render current values like a plain dict."""
+        return repr(dict(self))
+
+
+class TokenTrackingCallback(BaseCallbackHandler):  # type: ignore[misc]
+    """Callback to track token usage and update monitor."""
+
+    def __init__(self, monitor: Any) -> None:
+        """Initialize with resource monitor."""
+        self.monitor = monitor
+        # Pricing of the last seen model, reused while it stays the same
+        self._pricing_model: str | None = None
+        self._pricing = _DEFAULT_PRICING
+        # Runs that streamed, keyed by run_id, with the usage reported by
+        # their chunks (empty until a chunk carries usage)
+        self._stream_usage: dict[Any, dict[str, Any]] = {}
+
+    def on_llm_new_token(self, token: str, *, chunk: Any = None, **kwargs: Any) -> None:
+        """Mark the run as streamed and remember usage carried by its chunks."""
+        usage = getattr(chunk, "usage_metadata", None)
+        if usage is None:
+            # ChatGenerationChunk wraps the AIMessageChunk carrying usage
+            usage = getattr(getattr(chunk, "message", None), "usage_metadata", None)
+        run_id = kwargs.get("run_id")
+        if isinstance(usage, dict) and usage:
+            self._stream_usage[run_id] = usage
+        else:
+            self._stream_usage.setdefault(run_id, {})
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        """Forget streamed usage of a failed run."""
+        self._stream_usage.pop(kwargs.get("run_id"), None)
+
+    def on_llm_end(self, response: "LLMResult", **kwargs: Any) -> None:
+        """Track tokens when LLM call completes."""
+        stream_usage = self._stream_usage.pop(kwargs.get("run_id"), None)
+        total_tokens = 0
+        usage: dict[str, Any] = {}
+        llm_output = response.llm_output or {}
+        model_name = llm_output.get("model_name")
+
+        # Try multiple locations for token usage
+        # 1. OpenAI-style: response.llm_output["token_usage"]
+        if "token_usage" in llm_output:
+            usage = llm_output["token_usage"]
+            total_tokens = usage.get("total_tokens", 0)
+
+        # 2. Google-style: response.llm_output["usage_metadata"]
+        elif "usage_metadata" in llm_output:
+            usage = llm_output["usage_metadata"]
+            total_tokens = usage.get("total_tokens", 0)
+
+        # 3. Try generations metadata (some providers put it here)
+        elif (
+            response.generations
+            and len(response.generations) > 0
+            and len(response.generations[0]) > 0
+        ):
+            gen = response.generations[0][0]
+            if hasattr(gen, "message") and hasattr(gen.message, "response_metadata"):
+                metadata = gen.message.response_metadata
+                model_name = model_name or metadata.get("model_name")
+                if "usage_metadata" in metadata:
+                    usage = metadata["usage_metadata"]
+                    total_tokens = usage.get("total_tokens", 0)
+
+        # 4. Streaming: llm_output is empty and usage arrives on the
+        # final chunk (generation_info, the streamed message, or the
+        # chunk seen by on_llm_new_token). Only for runs that streamed:
+        # otherwise the message's usage_metadata is the same usage that
+        # _track_result_usage() records from the returned message
+        if total_tokens == 0 and stream_usage is not None:
+            candidates = [stream_usage]
+            if response.generations and response.generations[-1]:
+                gen = response.generations[-1][-1]
+                gen_info = getattr(gen, "generation_info", None)
+                message = getattr(gen, "message", None)
+                candidates[:0] = [
+                    gen_info.get("usage_metadata") if isinstance(gen_info, dict) else None,
+                    getattr(message, "usage_metadata", None),
+                ]
+            usage = next((u for u in candidates if isinstance(u, dict) and u), {})
+            total_tokens = usage.get("total_tokens", 0)
+
+        # If we found tokens, update the monitor
+        if total_tokens > 0:
+            # Cost estimate from the model's pricing
+            if model_name != self._pricing_model:
+                self._pricing_model = model_name
+                self._pricing = _pricing_for(model_name)
+            cost_estimate = _estimate_cost(
+                self._pricing,
+                usage.get("prompt_tokens", usage.get("input_tokens", 0)),
+                usage.get("completion_tokens", usage.get("output_tokens", 0)),
+                total_tokens,
+            )
+
+            # Track tokens and the API call in a single monitor update
+            self.monitor.update_resources(
+                {"tokens": total_tokens, "api_calls": 1, "cost_usd": cost_estimate}
+            )
+
+
+class AsyncTokenTrackingCallback(AsyncCallbackHandler):  # type: ignore[misc]
+    """Async counterpart of TokenTrackingCallback for ainvoke/abatch runs.
+
+    LangChain dispatches sync handlers of async runs to a thread pool, so
+    concurrent completions would update the monitor from several threads.
+    Async handlers run on the event loop itself, which serializes updates
+    without a lock (the monitor holds none).
+    """
+
+    def __init__(self, tracker: TokenTrackingCallback) -> None:
+        """Initialize with the sync tracker whose accounting is reused."""
+        self.tracker = tracker
+
+    async def on_llm_new_token(self, token: str, *, chunk: Any = None, **kwargs: Any) -> None:
+        """Remember usage metadata carried by streamed chunks."""
+        self.tracker.on_llm_new_token(token, chunk=chunk, **kwargs)
+
+    async def on_llm_end(self, response: "LLMResult", **kwargs: Any) -> None:
+        """Track tokens when LLM call completes."""
+        self.tracker.on_llm_end(response, **kwargs)
+
+    async def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        """Forget streamed usage of a failed run."""
+        self.tracker.on_llm_error(error, **kwargs)
+
+
 class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
     """Contract-aware wrapper for LangChain chains.
 
@@ -60,10 +382,20 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
     - Enforces budget constraints
     - Logs execution for audit
     - Provides budget awareness to the chain
+    - Supports async execution (aexecute/arun/acall) via the chain's ainvoke
+    - Optionally caches outputs for exact-match inputs (deterministic chains)
+
+    Prompt caching: budget_info values are quantized (remaining tokens to
+    1024-token buckets, remaining cost to cents, time pressure to 0.1) so they
+    rarely change between calls. Provider prompt caches only hit on an
+    identical prefix, so templates that use {budget_info} should place it
+    after the static system prompt and instructions, never before them.
 
     Attributes:
         contract: The contract governing execution
         chain: The underlying LangChain chain
+        max_concurrency: Maximum number of concurrent async chain calls
+        cache: Exact-match output cache (None = caching disabled)
         enforcer: Contract enforcement engine
         resource_monitor: Resource consumption tracker
         temporal_monitor: Time constraint tracker
@@ -91,6 +423,8 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
         chain: Any,  # LangChain Chain type (varies by version)
         strict_mode: bool = True,
         enable_logging: bool = True,
+        max_concurrency: int = 8,
+        cache: MutableMapping[bytes, dict[str, Any]] | None = None,
     ) -> None:
         """Initialize contracted LangChain chain.
 
@@ -99,6 +433,11 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
             chain: LangChain Chain to wrap
             strict_mode: If True, violations cause immediate termination
             enable_logging: If True, log execution for audit trail
+            max_concurrency: Maximum concurrent async chain calls (bounds
+                provider rate-limit fan-out when using asyncio.gather)
+            cache: Optional mapping used to memoize outputs keyed on
+                (contract ID, inputs). Pass e.g. {} to enable; only use with
+                deterministic chains (temperature=0)
 
         Raises:
             ImportError: If langchain is not installed
@@ -118,9 +457,26 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
         )
 
         self.chain = chain
-
-        # Set up callback for token tracking
+        self.max_concurrency = max_concurrency
+        # One semaphore per event loop: asyncio primitives bind to the first
+        # loop that waits on them, and the chain may outlive its asyncio.run()
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self.cache = cache
+        # Digest pre-seeded with the contract ID, copied for each cache key
+        self._cache_digest = hashlib.blake2b(contract.id.encode() + b"\0", digest_size=16)
+
+        # Skip budget injection entirely for unconstrained contracts (nothing
+        # to report) and for chains that never read it
+        self._inject_budget = (
+            contract.resources.any_set() or contract.temporal.any_set()
+        ) and _chain_reads_budget_info(chain)
+
+        # Set up callback for token tracking, then bind the entry point of
+        # the (possibly config-bound) runnable once
         self._setup_callbacks()
+        self._invoke = self._bind_invoke(self._runnable)
 
     def _run_chain(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Run the LangChain chain.
@@ -133,103 +489,147 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
         Returns:
             Chain's output dictionary
         """
-        # Try new LangChain 1.0+ API first (invoke), then fall back to old API (__call__)
-        if hasattr(self.chain, "invoke"):
-            # Pass callback handler via config for token tracking
-            config = {"callbacks": [self._callback_handler] if self._callback_handler else []}
-            result = self.chain.invoke(inputs, config=config)
-
-            # Extract usage metadata from result if available
-            if hasattr(result, "usage_metadata") and result.usage_metadata:
-                total_tokens = result.usage_metadata.get("total_tokens", 0)
-                reasoning_tokens = result.usage_metadata.get("output_token_details", {}).get(
-                    "reasoning", 0
-                )
+        # Entry point and config are both resolved once at construction
+        result = self._invoke(inputs, config=self._run_config)
+        self._track_result_usage(result)
+        return result  # type: ignore[no-any-return]
 
-                if total_tokens > 0:
-                    # Track tokens (with reasoning breakdown if available)
-                    self.resource_monitor.usage.add_tokens(
-                        count=0, reasoning=reasoning_tokens, text=total_tokens - reasoning_tokens
-                    )
+    @staticmethod
+    def _bind_invoke(chain: Any) -> Callable[..., Any]:
+        """Select the chain's entry point once.
 
-                    # Track API call with cost
-                    # Estimate cost for Gemini 2.5 Flash (~$0.15 per 1M tokens average)
-                    cost = total_tokens * 0.00000015
-                    self.resource_monitor.usage.add_api_call(cost=cost, tokens=0)
+        LangChain 1.0+ Runnables use invoke(inputs, config=...). Legacy
+        chains without invoke fall back to __call__, which takes no config.
 
-            return result  # type: ignore[no-any-return]
-        else:
-            return self.chain(inputs)  # type: ignore[no-any-return]
+        Args:
+            chain: LangChain chain or Runnable
+
+        Returns:
+            Callable taking (inputs, config=...)
+        """
+        invoke = getattr(chain, "invoke", None)
+        if invoke is not None:
+            return invoke  # type: ignore[no-any-return]
+
+        def legacy_call(inputs: dict[str, Any], config: dict[str, Any]) -> Any:
+            return chain(inputs)
+
+        return legacy_call
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """Get the max_concurrency semaphore for the running event loop.
+
+        Returns:
+            Semaphore shared by all calls on the current loop
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _arun_chain(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """Run the LangChain chain asynchronously.
+
+        Async counterpart of _run_chain(), called by aexecute(). Concurrent
+        calls are bounded by max_concurrency.
+
+        Args:
+            inputs: Input dictionary for the chain
+
+        Returns:
+            Chain's output dictionary
+        """
+        async with self._loop_semaphore():
+            # Prefer LangChain 1.0+ ainvoke, fall back to legacy Chain.acall
+            if hasattr(self._arunnable, "ainvoke"):
+                result = await self._arunnable.ainvoke(inputs, config=self._arun_config)
+                self._track_result_usage(result)
+                return result  # type: ignore[no-any-return]
+            else:
+                return await self._arunnable.acall(inputs)  # type: ignore[no-any-return]
+
+    def _track_result_usage(self, result: Any) -> None:
+        """Record token usage reported on a chain result, if any.
+
+        Args:
+            result: Value returned by the chain (e.g. an AIMessage)
+        """
+        # Extract usage metadata from result if available
+        if hasattr(result, "usage_metadata") and result.usage_metadata:
+            usage = result.usage_metadata
+            total_tokens = usage.get("total_tokens", 0)
+            reasoning_tokens = usage.get("output_token_details", {}).get("reasoning", 0)
+
+            if total_tokens > 0:
+                # Cost priced by the reporting model
+                response_metadata = getattr(result, "response_metadata", None)
+                model_name = (
+                    response_metadata.get("model_name")
+                    if isinstance(response_metadata, dict)
+                    else None
+                )
+                cost = _estimate_cost(
+                    _pricing_for(model_name),
+                    usage.get("input_tokens", 0),
+                    usage.get("output_tokens", 0),
+                    total_tokens,
+                )
+
+                # Track tokens (with reasoning breakdown) and the API call in one update
+                self.resource_monitor.update_resources(
+                    {
+                        "reasoning_tokens": reasoning_tokens,
+                        "text_tokens": total_tokens - reasoning_tokens,
+                        "api_calls": 1,
+                        "cost_usd": cost,
+                    }
+                )
 
     def _setup_callbacks(self) -> None:
         """Set up LangChain callbacks for token tracking.
 
         This creates a callback handler that tracks token usage from LLM calls
-        and updates the resource monitor automatically.
+        and updates the resource monitor automatically. How it is attached is
+        decided once here rather than per call:
+
+        - Runnables get the callback baked in with with_config(), producing
+          the RunnableBinding stored in self._runnable
+        - Legacy chains without invoke() get it appended to chain.callbacks,
+          since their __call__ takes no config
+        - Other invoke()-style chains receive it through self._run_config,
+          the config passed to every invoke call
+
+        The async path (ainvoke/abatch) is bound the same way to an
+        AsyncTokenTrackingCallback sharing the sync handler's accounting.
         """
-        self._callback_handler = None
+        self._callback_handler = TokenTrackingCallback(self.resource_monitor)
+        self._async_callback_handler = AsyncTokenTrackingCallback(self._callback_handler)
 
-        # Try to set up callback handler for automatic token tracking
-        try:
-            # Try LangChain 1.0+ first
-            try:
-                from langchain_core.callbacks import BaseCallbackHandler
-            except ImportError:
-                # Fallback to older LangChain
-                from langchain.callbacks.base import BaseCallbackHandler
-
-            class TokenTrackingCallback(BaseCallbackHandler):  # type: ignore[misc]
-                """Callback to track token usage and update monitor."""
-
-                def __init__(self, monitor: Any) -> None:
-                    """Initialize with resource monitor."""
-                    self.monitor = monitor
-
-                def on_llm_end(self, response: "LLMResult", **kwargs: Any) -> None:
-                    """Track tokens when LLM call completes."""
-                    total_tokens = 0
-
-                    # Try multiple locations for token usage
-                    # 1. OpenAI-style: response.llm_output["token_usage"]
-                    if response.llm_output and "token_usage" in response.llm_output:
-                        usage = response.llm_output["token_usage"]
-                        total_tokens = usage.get("total_tokens", 0)
-
-                    # 2. Google-style: response.llm_output["usage_metadata"]
-                    elif response.llm_output and "usage_metadata" in response.llm_output:
-                        usage = response.llm_output["usage_metadata"]
-                        total_tokens = usage.get("total_tokens", 0)
-
-                    # 3. Try generations metadata (some providers put it here)
-                    elif (
-                        response.generations
-                        and len(response.generations) > 0
-                        and len(response.generations[0]) > 0
-                    ):
-                        gen = response.generations[0][0]
-                        if hasattr(gen, "message") and hasattr(gen.message, "response_metadata"):
-                            metadata = gen.message.response_metadata
-                            if "usage_metadata" in metadata:
-                                usage = metadata["usage_metadata"]
-                                total_tokens = usage.get("total_tokens", 0)
-
-                    # If we found tokens, update the monitor
-                    if total_tokens > 0:
-                        # Track tokens using proper API
-                        self.monitor.usage.add_tokens(count=total_tokens)
-
-                        # Track API call with cost estimate
-                        # Gemini 2.5 Flash: $0.075 per 1M input, $0.30 per 1M output
-                        # Use average rate of ~$0.15 per 1M tokens
-                        cost_estimate = total_tokens * 0.00000015
-                        self.monitor.usage.add_api_call(cost=cost_estimate, tokens=0)
-
-            # Store callback handler for use in _run_chain
-            self._callback_handler = TokenTrackingCallback(self.resource_monitor)
-
-        except ImportError:
-            # Callback setup failed, will need manual token tracking
-            pass
+        self._runnable, self._run_config = self._bind_callback(self._callback_handler)
+        self._arunnable, self._arun_config = self._bind_callback(self._async_callback_handler)
+
+        if not hasattr(self.chain, "invoke"):
+            if getattr(self.chain, "callbacks", None) is None:
+                self.chain.callbacks = []
+            self.chain.callbacks.append(self._callback_handler)
+
+    def _bind_callback(self, handler: Any) -> tuple[Any, dict[str, Any]]:
+        """Attach a callback handler to the chain.
+
+        Args:
+            handler: Callback handler to attach
+
+        Returns:
+            Tuple of (runnable to call, config to pass on each call)
+        """
+        config: dict[str, Any] = {
+            "callbacks": [handler],
+            "tags": [f"contract:{self.contract.id}"],
+        }
+        if _LCEL_AVAILABLE and isinstance(self.chain, Chain):
+            return self.chain.with_config(config), {}
+        return self.chain, config
 
     def _monitored_execution(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Execute chain with monitoring.
@@ -242,16 +642,101 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
         Returns:
             Chain's output dictionary
         """
-        # Add budget awareness to inputs if chain expects it
-        if "budget_info" not in input_data:
-            input_data["budget_info"] = {
-                "remaining_tokens": self.resource_monitor.get_remaining_tokens(),
-                "remaining_cost": self.resource_monitor.get_remaining_cost(),
-                "time_pressure": self.temporal_monitor.get_time_pressure(),
-            }
+        key, cached = self._cache_lookup(input_data)
+        if cached is not None:
+            return cached
+
+        self._inject_budget_info(input_data)
+
+        # Execute chain
+        output = self._run_chain(input_data)
+        if key is not None:
+            self.cache[key] = copy.copy(output)  # type: ignore[index]
+        return output
+
+    async def _amonitored_execution(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Execute chain asynchronously with monitoring.
+
+        Args:
+            input_data: Input dictionary for the chain
+
+        Returns:
+            Chain's output dictionary
+        """
+        key, cached = self._cache_lookup(input_data)
+        if cached is not None:
+            return cached
+
+        self._inject_budget_info(input_data)
 
         # Execute chain
-        return self._run_chain(input_data)
+        output = await self._arun_chain(input_data)
+        if key is not None:
+            self.cache[key] = copy.copy(output)  # type: ignore[index]
+        return output
+
+    def _cache_key(self, input_data: dict[str, Any]) -> bytes:
+        """Compute the exact-match cache key for a set of inputs.
+
+        The key covers the contract ID and the canonical (sorted-key) JSON of
+        the inputs, excluding the injected budget_info.
+
+        Args:
+            input_data: Input dictionary for the chain
+
+        Returns:
+            16-byte digest identifying (contract ID, inputs)
+        """
+        digest = self._cache_digest.copy()
+        digest.update(_canonical_json({k: v for k, v in input_data.items() if k != "budget_info"}))
+        return digest.digest()
+
+    def _cache_lookup(
+        self, input_data: dict[str, Any]
+    ) -> tuple[bytes | None, dict[str, Any] | None]:
+        """Look up inputs in the exact-match cache.
+
+        Cache hits consume no tokens or API calls; they are counted in the
+        resource usage metadata under "cache_hits". Outputs are stored and
+        returned as shallow copies, so a caller replacing keys of its result
+        doesn't alter the cache; nested values are shared and should be
+        treated as read-only.
+
+        Args:
+            input_data: Input dictionary for the chain
+
+        Returns:
+            Tuple of (cache key or None if caching disabled, cached output or None)
+        """
+        if self.cache is None:
+            return None, None
+
+        key = self._cache_key(input_data)
+        cached = self.cache.get(key)
+        if cached is not None:
+            metadata = self.resource_monitor.usage.metadata
+            metadata["cache_hits"] = metadata.get("cache_hits", 0) + 1
+            cached = copy.copy(cached)
+        return key, cached
+
+    def _inject_budget_info(self, input_data: dict[str, Any]) -> None:
+        """Add budget awareness to inputs if not already present.
+
+        budget_info is a lazy view: remaining tokens, remaining cost and time
+        pressure are only computed when the chain reads them. Nothing is
+        injected if the contract has no resource or temporal constraints, or
+        if the chain's declared inputs exclude budget_info.
+
+        Args:
+            input_data: Input dictionary for the chain (modified in place)
+        """
+        if self._inject_budget:
+            # A slotted view is cheap to build, so one lookup via setdefault
+            # beats a membership test plus a store; monitors are only read if
+            # the chain reads budget_info
+            input_data.setdefault(
+                "budget_info", _BudgetView(self.resource_monitor, self.temporal_monitor)
+            )
 
     def run(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Execute chain with contract enforcement (LangChain-style API).
@@ -289,12 +774,228 @@ class ContractedChain(ContractAgent[dict[str, Any], dict[str, Any]]):
         """
         return self.run(inputs)
 
+    async def arun(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Async counterpart of run().
+
+        Args:
+            *args: Positional arguments for the chain
+            **kwargs: Keyword arguments for the chain
+
+        Returns:
+            Chain's output dictionary
+
+        Raises:
+            RuntimeError: If execution fails or contract is violated
+        """
+        # Convert args/kwargs to input dict
+        inputs = (args[0] if isinstance(args[0], dict) else {"input": args[0]}) if args else kwargs
+
+        # Execute with contract enforcement
+        result = await self.aexecute(inputs)
+
+        if result.success and result.output:
+            return result.output
+        else:
+            raise RuntimeError(f"Chain execution failed: {result.violations}")
+
+    async def acall(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """Async counterpart of calling the contracted chain.
+
+        Args:
+            inputs: Input dictionary for the chain
+
+        Returns:
+            Chain's output dictionary
+        """
+        return await self.arun(inputs)
+
+    def batch(
+        self, inputs_list: list[dict[str, Any]], max_concurrency: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute the chain over many inputs in a single batch call.
+
+        Delegates to the chain's own batch() (LCEL runs it on a thread pool)
+        instead of executing inputs one by one. Token usage is recorded per
+        result and the contract is checked once the whole batch completes.
+
+        Args:
+            inputs_list: Input dictionaries, one per chain invocation
+            max_concurrency: Maximum parallel invocations (default: self.max_concurrency)
+
+        Returns:
+            Chain outputs, in input order
+
+        Raises:
+            RuntimeError: If execution fails or contract is violated
+        """
+        run = self._begin_execution()
+        config = {**self._run_config, "max_concurrency": max_concurrency or self.max_concurrency}
+
+        try:
+            for inputs in inputs_list:
+                self._inject_budget_info(inputs)
+
+            if hasattr(self._runnable, "batch"):
+                outputs = self._runnable.batch(inputs_list, config=config)
+                for output in outputs:
+                    self._track_result_usage(output)
+            else:
+                outputs = [self._run_chain(inputs) for inputs in inputs_list]
+
+            result = self._finish_execution(outputs, run)  # type: ignore[arg-type]
+        except Exception as e:
+            result = self._fail_execution(e, run)
+        finally:
+            self._end_execution(run)
+
+        if result.success and result.output is not None:
+            return result.output  # type: ignore[return-value]
+        else:
+            raise RuntimeError(f"Chain batch execution failed: {result.violations}")
+
+    async def abatch(
+        self, inputs_list: list[dict[str, Any]], max_concurrency: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of batch().
+
+        Delegates to the chain's abatch() when available, otherwise gathers
+        individual ainvoke calls bounded by the max_concurrency semaphore.
+
+        Args:
+            inputs_list: Input dictionaries, one per chain invocation
+            max_concurrency: Maximum concurrent invocations (default: self.max_concurrency)
+
+        Returns:
+            Chain outputs, in input order
+
+        Raises:
+            RuntimeError: If execution fails or contract is violated
+        """
+        run = self._begin_execution()
+        config = {**self._arun_config, "max_concurrency": max_concurrency or self.max_concurrency}
+
+        try:
+            for inputs in inputs_list:
+                self._inject_budget_info(inputs)
+
+            if hasattr(self._arunnable, "abatch"):
+                outputs = await self._arunnable.abatch(inputs_list, config=config)
+                for output in outputs:
+                    self._track_result_usage(output)
+            else:
+                outputs = await asyncio.gather(
+                    *(self._arun_chain(inputs) for inputs in inputs_list)
+                )
+
+            result = self._finish_execution(outputs, run)  # type: ignore[arg-type]
+        except Exception as e:
+            result = self._fail_execution(e, run)
+        finally:
+            self._end_execution(run)
 
-class ContractedLLM:
+        if result.success and result.output is not None:
+            return result.output  # type: ignore[return-value]
+        else:
+            raise RuntimeError(f"Chain batch execution failed: {result.violations}")
+
+
+class SemanticCache(Protocol):
+    """Protocol for near-duplicate prompt caches used by ContractedLLM."""
+
+    def lookup(self, text: str, threshold: float) -> dict[str, Any] | None:
+        """Return the cached output of the most similar prompt, if similar enough."""
+        ...
+
+    def insert(self, text: str, output: dict[str, Any]) -> None:
+        """Store the output for a prompt."""
+        ...
+
+
+class EmbeddingSemanticCache:
+    """In-memory semantic cache using cosine similarity over embeddings.
+
+    Prompt embeddings are normalized and stacked into a single numpy matrix so
+    a lookup is one matrix-vector product. Works with any object exposing
+    LangChain's Embeddings.embed_query(text) method.
+
+    Example:
+        >>> from langchain_openai import OpenAIEmbeddings
+        >>> cache = EmbeddingSemanticCache(OpenAIEmbeddings())
+        >>> llm = ContractedLLM(contract=contract, llm=chat, semantic_cache=cache)
+    """
+
+    def __init__(self, embeddings: Any) -> None:
+        """Initialize semantic cache.
+
+        Args:
+            embeddings: LangChain Embeddings instance (or any object with embed_query)
+        """
+        import numpy as np
+
+        self._np = np
+        self.embeddings = embeddings
+        # Matrix of normalized prompt embeddings, stacked on first insert
+        self._vectors: Any = None
+        self._outputs: list[dict[str, Any]] = []
+        # Embedding of the last looked-up prompt, reused by insert() on a miss
+        self._last_query: tuple[str, Any] | None = None
+
+    def _embed(self, text: str) -> Any:
+        """Embed and L2-normalize a prompt."""
+        if self._last_query is not None and self._last_query[0] == text:
+            return self._last_query[1]
+
+        vector = self._np.asarray(self.embeddings.embed_query(text), dtype=float)
+        norm = self._np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        self._last_query = (text, vector)
+        return vector
+
+    def lookup(self, text: str, threshold: float) -> dict[str, Any] | None:
+        """Return the output of the most similar cached prompt.
+
+        Args:
+            text: Prompt to look up
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached output dictionary, or None on a miss
+        """
+        query = self._embed(text)
+        if not self._outputs:
+            return None
+
+        scores = self._vectors @ query
+        best = int(scores.argmax())
+        return self._outputs[best] if scores[best] >= threshold else None
+
+    def insert(self, text: str, output: dict[str, Any]) -> None:
+        """Store the output for a prompt.
+
+        Args:
+            text: Prompt that produced the output
+            output: Output dictionary to cache
+        """
+        vector = self._embed(text)
+        if self._outputs:
+            self._vectors = self._np.vstack([self._vectors, vector])
+        else:
+            self._vectors = vector[self._np.newaxis, :]
+        self._outputs.append(output)
+
+    def __len__(self) -> int:
+        """Return the number of cached prompts."""
+        return len(self._outputs)
+
+
+class ContractedLLM(ContractedChain):
     """Contract-aware wrapper for standalone LLM calls.
 
     This class wraps individual LLM calls (not full chains) with contract
     enforcement. Useful for simple use cases where you don't need a full chain.
+    It is a ContractedChain over a "{input}" pass-through prompt, so each
+    call goes through a single monitor and enforcement layer.
 
     Example:
         >>> from langchain.llms import OpenAI
@@ -317,6 +1018,10 @@ class ContractedLLM:
         contract: Contract,
         llm: Any,
         strict_mode: bool = True,
+        max_concurrency: int = 8,
+        cache: MutableMapping[bytes, dict[str, Any]] | None = None,
+        semantic_cache: SemanticCache | None = None,
+        semantic_threshold: float = 0.95,
     ) -> None:
         """Initialize contracted LLM.
 
@@ -324,6 +1029,13 @@ class ContractedLLM:
             contract: Contract to enforce
             llm: LangChain LLM instance
             strict_mode: If True, violations cause immediate termination
+            max_concurrency: Maximum concurrent async LLM calls
+            cache: Optional exact-match response cache (see ContractedChain)
+            semantic_cache: Optional near-duplicate prompt cache (e.g.
+                EmbeddingSemanticCache). Only used when the LLM's temperature
+                is explicitly 0: sampled responses are not reproducible, and
+                an unset temperature means the provider default (usually > 0)
+            semantic_threshold: Minimum cosine similarity for a semantic cache hit
         """
         if not LANGCHAIN_AVAILABLE:
             raise ImportError(
@@ -331,47 +1043,35 @@ class ContractedLLM:
                 "Install with: pip install langchain"
             )
 
-        self.contract = contract
         self.llm = llm
-        self.strict_mode = strict_mode
+        self.semantic_threshold = semantic_threshold
 
-        # Create a simple chain wrapper
-        try:
-            # Try LangChain 1.0+ LCEL API first
-            from langchain_core.output_parsers import StrOutputParser
-            from langchain_core.prompts import PromptTemplate
-            from langchain_core.runnables import RunnableLambda
-
-            # Simple pass-through prompt using LCEL
-            # Wrap output to match old LLMChain API (returns dict with "text" key)
-            def format_output(text: str) -> dict[str, Any]:
-                return {"text": text}
-
-            prompt = PromptTemplate.from_template("{input}")
-            self.chain = prompt | llm | StrOutputParser() | RunnableLambda(format_output)
-        except ImportError:
-            try:
-                # Fallback to old LangChain API (pre-1.0)
-                from langchain.chains import LLMChain
-                from langchain.prompts import PromptTemplate as LegacyPromptTemplate
-
-                # Simple pass-through prompt
-                prompt = LegacyPromptTemplate(input_variables=["input"], template="{input}")
-                self.chain = LLMChain(llm=llm, prompt=prompt)
-            except ImportError as err:
-                raise ImportError(
-                    "ContractedLLM requires either LangChain 1.0+ or LangChain <1.0. "
-                    "Install with: pip install langchain langchain-core"
-                ) from err
-
-        # Wrap with ContractedChain
-        self.contracted_chain = ContractedChain(
+        temperature = getattr(llm, "temperature", None)
+        deterministic = isinstance(temperature, int | float) and temperature == 0
+        self.semantic_cache = semantic_cache if deterministic else None
+
+        # Create a simple chain around the shared pass-through prompt
+        if _LCEL_AVAILABLE:
+            # LangChain 1.0+ LCEL pipeline, output wrapped as {"text": ...}
+            chain = _PASSTHROUGH_PROMPT | llm | _TEXT_OUTPUT
+        else:
+            # Old LangChain API (pre-1.0)
+            chain = LLMChain(llm=llm, prompt=_PASSTHROUGH_PROMPT)
+
+        super().__init__(
             contract=contract,
-            chain=self.chain,
+            chain=chain,
             strict_mode=strict_mode,
+            max_concurrency=max_concurrency,
+            cache=cache,
         )
 
-    def __call__(self, prompt: str) -> str:
+    @property
+    def contracted_chain(self) -> "ContractedLLM":
+        """Backward-compatible alias: ContractedLLM is itself the contracted chain."""
+        return self
+
+    def __call__(self, prompt: str) -> str:  # type: ignore[override]
         """Execute LLM call with contract enforcement.
 
         Args:
@@ -380,23 +1080,200 @@ class ContractedLLM:
         Returns:
             LLM's response text
         """
-        result = self.contracted_chain.execute({"input": prompt})
+        result = self.execute(prompt)
 
         if result.success and result.output:
             return result.output.get("text", "")  # type: ignore[no-any-return]
         else:
             raise RuntimeError(f"LLM call failed: {result.violations}")
 
-    def execute(self, prompt: str) -> ExecutionResult[dict[str, Any]]:
-        """Execute LLM call and return full execution result.
+    async def acall(self, prompt: str) -> str:  # type: ignore[override]
+        """Execute LLM call asynchronously with contract enforcement.
+
+        Args:
+            prompt: Input prompt for the LLM
+
+        Returns:
+            LLM's response text
+        """
+        result = await self.aexecute(prompt)
+
+        if result.success and result.output:
+            return result.output.get("text", "")  # type: ignore[no-any-return]
+        else:
+            raise RuntimeError(f"LLM call failed: {result.violations}")
+
+    def _monitored_execution(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Execute the LLM call, serving near-duplicate prompts from the semantic cache.
+
+        Cache hits run inside execute(), so they get the same constraint
+        checks and execution log as real calls.
+
+        Args:
+            input_data: Input dictionary for the chain
+
+        Returns:
+            Chain's output dictionary
+        """
+        prompt = self._semantic_prompt(input_data)
+        if prompt is not None:
+            cached = self._semantic_lookup(prompt)
+            if cached is not None:
+                return cached
+
+        output = super()._monitored_execution(input_data)
+        if prompt is not None:
+            self.semantic_cache.insert(prompt, dict(output))  # type: ignore[union-attr]
+        return output
+
+    async def _amonitored_execution(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Async counterpart of _monitored_execution().
+
+        Args:
+            input_data: Input dictionary for the chain
+
+        Returns:
+            Chain's output dictionary
+        """
+        prompt = self._semantic_prompt(input_data)
+        if prompt is not None:
+            cached = self._semantic_lookup(prompt)
+            if cached is not None:
+                return cached
+
+        output = await super()._amonitored_execution(input_data)
+        if prompt is not None:
+            self.semantic_cache.insert(prompt, dict(output))  # type: ignore[union-attr]
+        return output
+
+    def _semantic_prompt(self, input_data: dict[str, Any]) -> str | None:
+        """Return the prompt to match in the semantic cache, if it applies.
+
+        Only plain prompts ({"input": str}) are matched; other inputs would
+        be ignored by the similarity lookup.
+
+        Args:
+            input_data: Input dictionary for the chain
+
+        Returns:
+            Prompt text, or None if semantic caching doesn't apply
+        """
+        if self.semantic_cache is None:
+            return None
+        prompt = input_data.get("input")
+        if not isinstance(prompt, str) or not input_data.keys() <= {"input", "budget_info"}:
+            return None
+        return prompt
+
+    def _semantic_lookup(self, prompt: str) -> dict[str, Any] | None:
+        """Look up a near-duplicate prompt in the semantic cache.
+
+        Hits are counted in the resource usage metadata under
+        "semantic_cache_hits".
 
         Args:
             prompt: Input prompt for the LLM
 
+        Returns:
+            Copy of the cached output dictionary, or None on a miss
+        """
+        cached = self.semantic_cache.lookup(prompt, self.semantic_threshold)  # type: ignore[union-attr]
+        if cached is None:
+            return None
+
+        metadata = self.resource_monitor.usage.metadata
+        metadata["semantic_cache_hits"] = metadata.get("semantic_cache_hits", 0) + 1
+        return dict(cached)
+
+    def execute(self, prompt: str | dict[str, Any]) -> ExecutionResult[dict[str, Any]]:
+        """Execute LLM call and return full execution result.
+
+        Args:
+            prompt: Input prompt for the LLM (or a chain input dict)
+
+        Returns:
+            ExecutionResult with output and audit log
+        """
+        inputs = {"input": prompt} if isinstance(prompt, str) else prompt
+        return super().execute(inputs)
+
+    async def aexecute(self, prompt: str | dict[str, Any]) -> ExecutionResult[dict[str, Any]]:
+        """Execute LLM call asynchronously and return full execution result.
+
+        Args:
+            prompt: Input prompt for the LLM (or a chain input dict)
+
         Returns:
             ExecutionResult with output and audit log
         """
-        return self.contracted_chain.execute({"input": prompt})
+        inputs = {"input": prompt} if isinstance(prompt, str) else prompt
+        return await super().aexecute(inputs)
+
+    def batch(  # type: ignore[override]
+        self, prompts: list[str], max_concurrency: int | None = None
+    ) -> list[str]:
+        """Execute many LLM calls in a single batch with contract enforcement.
+
+        Args:
+            prompts: Input prompts for the LLM
+            max_concurrency: Maximum parallel calls (default: chain's max_concurrency)
+
+        Returns:
+            LLM response texts, in prompt order
+        """
+        outputs = super().batch(
+            [{"input": prompt} for prompt in prompts], max_concurrency=max_concurrency
+        )
+        return [output.get("text", "") for output in outputs]
+
+    async def abatch(  # type: ignore[override]
+        self, prompts: list[str], max_concurrency: int | None = None
+    ) -> list[str]:
+        """Async counterpart of batch().
+
+        Args:
+            prompts: Input prompts for the LLM
+            max_concurrency: Maximum concurrent calls (default: chain's max_concurrency)
+
+        Returns:
+            LLM response texts, in prompt order
+        """
+        outputs = await super().abatch(
+            [{"input": prompt} for prompt in prompts], max_concurrency=max_concurrency
+        )
+        return [output.get("text", "") for output in outputs]
+
+
+def _stable_chain_id(chain: Any) -> str:
+    """Derive a process-independent contract ID from a chain's configuration.
+
+    Hashes the chain's serialized configuration (to_json(), which includes
+    prompt text, model and parameters of every step), so the same chain
+    definition gets the same contract ID across processes and different
+    definitions get different ones. Chains that are not serializable fall
+    back to their LCEL graph (get_graph().to_json(), step types only), then
+    to id(chain).
+
+    Args:
+        chain: LangChain chain or Runnable
+
+    Returns:
+        Contract ID of the form "chain-<16 hex chars>" (or "chain-<id>")
+    """
+    for serialize in (
+        lambda: chain.to_json(),
+        lambda: chain.get_graph().to_json(),
+    ):
+        try:
+            config = serialize()
+        except Exception:
+            continue
+        if not isinstance(config, dict) or config.get("type") == "not_implemented":
+            continue
+        digest = hashlib.blake2b(_canonical_json(config), digest_size=8).hexdigest()
+        return f"chain-{digest}"
+
+    return f"chain-{id(chain)}"
 
 
 # Convenience function for creating contracted chains
@@ -436,7 +1313,7 @@ def create_contracted_chain(
     )
 
     # Create contract
-    contract_id_val = contract_id or f"chain-{id(chain)}"
+    contract_id_val = contract_id or _stable_chain_id(chain)
     contract = Contract(
         id=contract_id_val,
         name=contract_id_val,
@@ -46,9 +46,12 @@ Example:
     >>> result = contracted_workflow.invoke({"query": "..."})
 """
 
+from collections import deque
+from collections.abc import Callable, Collection
 from typing import Any, TypeVar
 
-from agent_contracts.core.contract import Contract
+from agent_contracts.core.contract import Contract, ResourceConstraints, TemporalConstraints
+from agent_contracts.core.tokens import TokenCounter
 from agent_contracts.core.wrapper import ContractAgent
 
 # Type checking imports
@@ -60,10 +63,133 @@ except ImportError:
     LANGGRAPH_AVAILABLE = False
     StateGraph = Any
 
+# Node result caching (LangGraph 0.4+)
+try:
+    from langgraph.cache.memory import InMemoryCache
+except ImportError:
+    InMemoryCache = None
+
+# LangGraph uses LangChain callbacks for token tracking
+try:
+    # LangChain 1.0+ callback system
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    CALLBACKS_AVAILABLE = True
+except ImportError:
+    try:
+        from langchain.callbacks.base import BaseCallbackHandler
+
+        CALLBACKS_AVAILABLE = True
+    except ImportError:
+        CALLBACKS_AVAILABLE = False
+        BaseCallbackHandler = object  # type: ignore[misc,assignment]
+
 # Type variable for state
 TState = TypeVar("TState")
 
 
+# Rates are kept as integer picodollars per token, so each cost is an exact
+# integer product with a single rounding when converted back to USD
+_PICODOLLARS_PER_USD = 10**12
+
+# Recent LLM run ids remembered to drop repeated on_llm_end notifications
+_SEEN_RUNS_LIMIT = 128
+
+# Per-token rate used when the model is unknown (gpt-4o-mini input pricing)
+_DEFAULT_TOKEN_RATE = 150_000
+
+# Locations of the total token count in an LLMResult, in lookup order
+_TOKEN_ACCESSORS: tuple[Callable[[Any], int], ...] = (
+    # OpenAI-style
+    lambda r: r.llm_output["token_usage"]["total_tokens"],
+    # Google-style
+    lambda r: r.llm_output["usage_metadata"]["total_tokens"],
+    # Generation metadata (some providers put it here)
+    lambda r: r.generations[0][0].message.response_metadata["usage_metadata"]["total_tokens"],
+)
+
+
+def _total_tokens(response: Any) -> int:
+    """Return the first non-zero total token count reported by an LLM result.
+
+    Args:
+        response: LangChain LLMResult
+
+    Returns:
+        Total tokens, or 0 if no location reports usage
+    """
+    for accessor in _TOKEN_ACCESSORS:
+        try:
+            total = accessor(response)
+        except (AttributeError, KeyError, IndexError, TypeError):
+            continue
+        if total:
+            return total
+    return 0
+
+
+class GraphTokenTrackingCallback(BaseCallbackHandler):  # type: ignore[misc]
+    """Callback to track token usage across all graph nodes."""
+
+    def __init__(self, monitor: Any, model_hint: str | None = None) -> None:
+        """Initialize with resource monitor.
+
+        Args:
+            monitor: ResourceMonitor to record usage on
+            model_hint: Model used by the graph's nodes, for cost estimates
+                when a response does not name its model
+        """
+        self.monitor = monitor
+        self._rates: dict[str, int] = {}
+        self._rate = self._rate_for(model_hint) if model_hint else _DEFAULT_TOKEN_RATE
+        # The handler can be reached twice for one LLM run (e.g. passed in the
+        # graph config and also bound to the model), so runs are counted once
+        self._seen_runs: set[Any] = set()
+        self._seen_order: deque[Any] = deque()
+
+    def _rate_for(self, model: str) -> int:
+        """Return the cached per-token rate for a model, in picodollars."""
+        rate = self._rates.get(model)
+        if rate is None:
+            pricing = TokenCounter.get_model_pricing(model)
+            # Only the total is reported, so price it at the input rate
+            rate = (
+                round(pricing["input"] * _PICODOLLARS_PER_USD) if pricing else _DEFAULT_TOKEN_RATE
+            )
+            self._rates[model] = rate
+        return rate
+
+    def _first_sighting(self, run_id: Any) -> bool:
+        """Record an LLM run id, returning False if it was already counted."""
+        if run_id is None:
+            return True
+        if run_id in self._seen_runs:
+            return False
+        self._seen_runs.add(run_id)
+        self._seen_order.append(run_id)
+        if len(self._seen_order) > _SEEN_RUNS_LIMIT:
+            self._seen_runs.discard(self._seen_order.popleft())
+        return True
+
+    def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        """Track tokens when any LLM call completes in any node."""
+        if not self._first_sighting(kwargs.get("run_id")):
+            return
+
+        total_tokens = _total_tokens(response)
+
+        # Track tokens cumulatively across all nodes
+        if total_tokens > 0:
+            self.monitor.usage.add_tokens(count=total_tokens)
+
+            # Track API call with cost estimate for the responding model
+            llm_output = getattr(response, "llm_output", None)
+            model = llm_output.get("model_name") if isinstance(llm_output, dict) else None
+            rate = self._rate_for(model) if model else self._rate
+            cost = total_tokens * rate / _PICODOLLARS_PER_USD
+            self.monitor.usage.add_api_call(cost=cost, tokens=0)
+
+
 class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
     """Contract-aware wrapper for LangGraph state machines.
 
@@ -131,6 +257,9 @@ class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
         graph: Any,  # CompiledGraph type (varies by LangGraph version)
         strict_mode: bool = True,
         enable_logging: bool = True,
+        cache_policy: Any | None = None,  # langgraph.types.CachePolicy
+        cached_nodes: Collection[str] | None = None,
+        model: str | None = None,
     ) -> None:
         """Initialize contracted LangGraph workflow.
 
@@ -139,9 +268,19 @@ class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
             graph: LangGraph CompiledGraph to wrap
             strict_mode: If True, violations cause immediate termination
             enable_logging: If True, log execution for audit trail
+            cache_policy: Optional LangGraph CachePolicy (e.g. CachePolicy(ttl=300))
+                applied to cached_nodes, so a node seeing the same input state
+                again (e.g. on another cycle) reuses its earlier result
+                instead of re-running and spending budget
+            cached_nodes: Names of the deterministic nodes (retrievers,
+                validators, temperature=0 calls) to cache; required with
+                cache_policy
+            model: Model the graph's nodes call, used to price responses
+                that do not report their model name
 
         Raises:
-            ImportError: If langgraph is not installed
+            ImportError: If langgraph is not installed, or too old for node caching
+            ValueError: If cache_policy is given without valid cached_nodes
         """
         if not LANGGRAPH_AVAILABLE:
             raise ImportError(
@@ -158,10 +297,28 @@ class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
         )
 
         self.graph = graph
+        self.cache_policy = cache_policy
+        self.cached_nodes = frozenset(cached_nodes or ())
 
-        # Set up interception for node-level token tracking
+        # Set up node caching; may replace self.graph with a cached copy
         self._setup_node_tracking()
 
+        # Compiled graphs are run through invoke() with a config; older APIs
+        # are plain callables. Resolved once, since the graph does not change.
+        self._graph_accepts_config = hasattr(self.graph, "invoke")
+        self._graph_invoke: Callable[..., dict[str, Any]] = (
+            self.graph.invoke if self._graph_accepts_config else self.graph
+        )
+
+        # Token tracking callback, created once and shared by every invocation
+        self._callback = (
+            GraphTokenTrackingCallback(self.resource_monitor, model_hint=model)
+            if CALLBACKS_AVAILABLE
+            else None
+        )
+        # Nothing in the config changes between runs, so it is built once
+        self._config = self._build_config()
+
     def _run_graph(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Run the LangGraph workflow.
 
@@ -174,88 +331,64 @@ class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
         Returns:
             Final state dictionary after graph execution
         """
-        # LangGraph uses invoke() method
-        if hasattr(self.graph, "invoke"):
-            # Pass config for callbacks if needed
-            config = self._build_config()
-            result = self.graph.invoke(inputs, config=config)
-            return result  # type: ignore[no-any-return]
-        else:
-            # Fallback for older API
-            return self.graph(inputs)  # type: ignore[no-any-return]
+        if self._graph_accepts_config:
+            # Pass config for callbacks
+            return self._graph_invoke(inputs, config=self._config)
+        # Fallback for older API
+        return self._graph_invoke(inputs)
 
     def _build_config(self) -> dict[str, Any]:
         """Build configuration for graph execution with callbacks.
 
         Returns:
-            Configuration dict with callbacks for tracking
+            Configuration dict with callbacks for tracking (empty if LangChain
+            callbacks are not available, in which case tracking is manual)
         """
-        config: dict[str, Any] = {}
-
-        # Try to set up callbacks for token tracking
-        try:
-            # Try LangChain 1.0+ callback system (LangGraph uses LangChain callbacks)
-            try:
-                from langchain_core.callbacks import BaseCallbackHandler
-            except ImportError:
-                from langchain.callbacks.base import BaseCallbackHandler
-
-            class GraphTokenTrackingCallback(BaseCallbackHandler):  # type: ignore[misc]
-                """Callback to track token usage across all graph nodes."""
-
-                def __init__(self, monitor: Any) -> None:
-                    """Initialize with resource monitor."""
-                    self.monitor = monitor
-
-                def on_llm_end(self, response: Any, **kwargs: Any) -> None:
-                    """Track tokens when any LLM call completes in any node."""
-                    total_tokens = 0
-
-                    # Try multiple locations for token usage
-                    if response.llm_output and "token_usage" in response.llm_output:
-                        usage = response.llm_output["token_usage"]
-                        total_tokens = usage.get("total_tokens", 0)
-                    elif response.llm_output and "usage_metadata" in response.llm_output:
-                        usage = response.llm_output["usage_metadata"]
-                        total_tokens = usage.get("total_tokens", 0)
-                    elif (
-                        response.generations
-                        and len(response.generations) > 0
-                        and len(response.generations[0]) > 0
-                    ):
-                        gen = response.generations[0][0]
-                        if hasattr(gen, "message") and hasattr(gen.message, "response_metadata"):
-                            metadata = gen.message.response_metadata
-                            if "usage_metadata" in metadata:
-                                usage = metadata["usage_metadata"]
-                                total_tokens = usage.get("total_tokens", 0)
-
-                    # Track tokens cumulatively across all nodes
-                    if total_tokens > 0:
-                        self.monitor.usage.add_tokens(count=total_tokens)
-
-                        # Track API call with cost estimate
-                        cost_estimate = total_tokens * 0.00000015
-                        self.monitor.usage.add_api_call(cost=cost_estimate, tokens=0)
-
-            # Add callback to config
-            callback = GraphTokenTrackingCallback(self.resource_monitor)
-            config["callbacks"] = [callback]
-
-        except ImportError:
-            # Callbacks not available, will need manual tracking
-            pass
-
-        return config
+        if self._callback is None:
+            return {}
+        return {"callbacks": [self._callback]}
 
     def _setup_node_tracking(self) -> None:
-        """Set up tracking for individual node executions.
+        """Set up tracking and caching for individual node executions.
+
+        Token usage is tracked through callbacks. When a cache_policy is
+        given, self.graph is replaced by a copy of the compiled graph in
+        which each of cached_nodes carries the policy, with an in-memory
+        cache if the graph has none. The caller's graph is left untouched,
+        so it and other wrappers around it never serve these cached results.
+        LangGraph keys cached results by a hash of the node's input, so a hit
+        skips the node entirely: no LLM call runs and no tokens are charged.
 
-        This wraps node functions to track budget at the node level,
-        enabling fine-grained monitoring and early termination if needed.
+        Raises:
+            ImportError: If the installed LangGraph doesn't support node caching
+            ValueError: If cached_nodes is empty or names unknown nodes
         """
-        # For now, rely on callbacks. Future enhancement could wrap individual nodes.
-        pass
+        if self.cache_policy is None:
+            return
+
+        if InMemoryCache is None:
+            raise ImportError(
+                "Node caching requires langgraph>=0.4. Install with: pip install -U langgraph"
+            )
+        if not self.cached_nodes:
+            raise ValueError("cached_nodes must name the deterministic nodes to cache")
+
+        nodes = self.graph.nodes
+        unknown = self.cached_nodes - set(nodes)
+        if unknown:
+            raise ValueError(f"Unknown nodes in cached_nodes: {sorted(unknown)}")
+
+        update: dict[str, Any] = {
+            "nodes": {
+                name: node.copy({"cache_policy": self.cache_policy})
+                if name in self.cached_nodes
+                else node
+                for name, node in nodes.items()
+            }
+        }
+        if getattr(self.graph, "cache", None) is None:
+            update["cache"] = InMemoryCache()
+        self.graph = self.graph.copy(update=update)
 
     def _monitored_execution(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Execute graph with monitoring.
@@ -327,15 +460,20 @@ class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
         self.enforcer.start()
 
         try:
-            config = self._build_config()
-
             # Stream execution
-            for chunk in self.graph.stream(inputs, config=config):
-                # Check constraints at each chunk
-                is_violated, _violations = self.enforcer.check_constraints()
+            for chunk in self.graph.stream(inputs, config=self._config):
+                # Updates served from the node cache are flagged by LangGraph
+                if isinstance(chunk, dict) and chunk.get("__metadata__", {}).get("cached"):
+                    metadata = self.resource_monitor.usage.metadata
+                    metadata["cache_hits"] = metadata.get("cache_hits", 0) + 1
+
+                # Cheap check at each chunk; the full check (which records and
+                # handles violations) only runs once a limit is exceeded
+                if self.enforcer.check_constraints_fast():
+                    is_violated, _violations = self.enforcer.check_constraints()
 
-                if is_violated and self.strict_mode:
-                    raise RuntimeError("Contract violated during streaming execution")
+                    if is_violated and self.strict_mode:
+                        raise RuntimeError("Contract violated during streaming execution")
 
                 yield chunk
 
@@ -344,7 +482,6 @@ class ContractedGraph(ContractAgent[dict[str, Any], dict[str, Any]]):
             self.enforcer.check_temporal_constraints()
 
         except Exception as e:
-            self.contract.state = self.contract.state  # Keep current state
             raise RuntimeError(f"Streaming execution failed: {e}") from e
 
     def __call__(self, inputs: dict[str, Any]) -> dict[str, Any]:
@@ -394,11 +531,6 @@ def create_contracted_graph(
         ...     temporal={"max_duration": "10 minutes"}
         ... )
     """
-    from agent_contracts.core.contract import (
-        ResourceConstraints,
-        TemporalConstraints,
-    )
-
     # Create contract
     contract_id_val = contract_id or f"graph-{id(graph)}"
     contract = Contract(
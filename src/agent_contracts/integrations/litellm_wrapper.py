@@ -4,11 +4,27 @@ This module provides a wrapper around litellm that automatically enforces
 contract constraints during LLM API calls.
 """
 
-from typing import Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
-from litellm import completion
+from litellm import acompletion, completion
 
-from agent_contracts.core import Contract, ContractEnforcer, EnforcementEvent, TokenCounter
+from agent_contracts.core import (
+    Contract,
+    ContractEnforcer,
+    EnforcementEvent,
+    TokenCount,
+    TokenCounter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Chunks between temporal constraint checks while streaming
+_STREAM_CHECK_INTERVAL = 64
+
+# Reads (prompt, completion, total) tokens from a fully populated usage block
+_get_usage_tokens = itemgetter("prompt_tokens", "completion_tokens", "total_tokens")
 
 
 class ContractViolationError(Exception):
@@ -17,6 +33,19 @@ class ContractViolationError(Exception):
     pass
 
 
+def _dict_token_details(details: Any) -> tuple[int, int]:
+    """Read (reasoning, text) tokens from a dict completion_tokens_details."""
+    return details.get("reasoning_tokens", 0) or 0, details.get("text_tokens", 0) or 0
+
+
+def _attr_token_details(details: Any) -> tuple[int, int]:
+    """Read (reasoning, text) tokens from a Pydantic completion_tokens_details."""
+    return (
+        getattr(details, "reasoning_tokens", 0) or 0,
+        getattr(details, "text_tokens", 0) or 0,
+    )
+
+
 class ContractedLLM:
     """LLM wrapper with automatic contract enforcement.
 
@@ -29,6 +58,17 @@ class ContractedLLM:
         auto_start: Whether to automatically start enforcement on first call
     """
 
+    # One wrapper is often created per conversation, so skip the instance dict
+    __slots__ = (
+        "_details_extractor",
+        "_details_type",
+        "_reasoning_effort",
+        "_started",
+        "auto_start",
+        "contract",
+        "enforcer",
+    )
+
     def __init__(
         self,
         contract: Contract,
@@ -46,6 +86,13 @@ class ContractedLLM:
         self.enforcer = ContractEnforcer(contract, strict_mode=strict_mode)
         self.auto_start = auto_start
         self._started = False
+        # Resource constraints are frozen, so the effort can be resolved once
+        self._reasoning_effort = (
+            contract.resources.reasoning_effort or contract.resources.recommended_reasoning_effort
+        )
+        # completion_tokens_details reader, specialized to the SDK's response type
+        self._details_type: type | None = None
+        self._details_extractor: Callable[[Any], tuple[int, int]] = _attr_token_details
 
     def start(self) -> None:
         """Start contract enforcement.
@@ -84,56 +131,101 @@ class ContractedLLM:
         Raises:
             ContractViolationError: If contract is violated in strict mode
         """
-        # Auto-start if needed
-        if self.auto_start and not self._started:
-            self.start()
+        self._prepare_call(kwargs)
 
-        # Check constraints before call
-        self._check_constraints_before_call()
+        # Make the LLM call
+        try:
+            response = completion(**kwargs)
+        except Exception as e:
+            # Track failed API call
+            self.enforcer.monitor.usage.add_api_call()
+            raise e
 
-        # Auto-apply reasoning_effort from contract if not already specified
-        if "reasoning_effort" not in kwargs:
-            effort = self._get_reasoning_effort()
-            if effort is not None:
-                kwargs["reasoning_effort"] = effort
+        return self._record_completion(response, kwargs.get("model", "unknown"))
+
+    async def acompletion(self, **kwargs: Any) -> Any:
+        """Make an async completion call with contract enforcement.
+
+        Same as completion(), but awaits litellm.acompletion() so many calls
+        can be in flight on one event loop.
+
+        Args:
+            **kwargs: Arguments to pass to litellm.acompletion()
+
+        Returns:
+            litellm completion response
+
+        Raises:
+            ContractViolationError: If contract is violated in strict mode
+        """
+        self._prepare_call(kwargs)
 
         # Make the LLM call
         try:
-            response = completion(**kwargs)
+            response = await acompletion(**kwargs)
         except Exception as e:
             # Track failed API call
             self.enforcer.monitor.usage.add_api_call()
             raise e
 
+        return self._record_completion(response, kwargs.get("model", "unknown"))
+
+    def _prepare_call(self, kwargs: dict[str, Any]) -> None:
+        """Start enforcement if needed, check constraints and fill in call arguments.
+
+        Args:
+            kwargs: Arguments for the litellm call, updated in place
+
+        Raises:
+            ContractViolationError: If already violated in strict mode
+        """
+        # Auto-start if needed
+        if self.auto_start and not self._started:
+            self.start()
+
+        # Check constraints before call
+        self._check_constraints_before_call()
+
+        # Auto-apply reasoning_effort from contract if not already specified
+        if self._reasoning_effort is not None:
+            kwargs.setdefault("reasoning_effort", self._reasoning_effort)
+
+    def _record_completion(self, response: Any, model: str) -> Any:
+        """Record a completed call's usage and check constraints after it.
+
+        Args:
+            response: litellm completion response
+            model: Model the call was made with
+
+        Returns:
+            The response, unchanged
+
+        Raises:
+            ContractViolationError: If violated in strict mode
+        """
         # Extract token usage from response
         usage = response.get("usage", {})
-        input_tokens = usage.get("prompt_tokens", 0)
-        output_tokens = usage.get("completion_tokens", 0)
-        total_tokens = usage.get("total_tokens", input_tokens + output_tokens)
+        try:
+            input_tokens, output_tokens, total_tokens = _get_usage_tokens(usage)
+        except (KeyError, TypeError):
+            # Partial usage block; fill in what is missing
+            input_tokens = usage.get("prompt_tokens", 0)
+            output_tokens = usage.get("completion_tokens", 0)
+            total_tokens = usage.get("total_tokens", input_tokens + output_tokens)
 
         # Extract reasoning vs text tokens for reasoning models (e.g., Gemini 2.5, o1)
         reasoning_tokens = 0
         text_tokens = 0
         completion_tokens_details = usage.get("completion_tokens_details")
         if completion_tokens_details:
-            # Handle both dict and Pydantic object formats
-            if isinstance(completion_tokens_details, dict):
-                reasoning_tokens = completion_tokens_details.get("reasoning_tokens", 0)
-                text_tokens = completion_tokens_details.get("text_tokens", 0)
-            else:
-                # Pydantic object - use attribute access
-                reasoning_tokens = getattr(completion_tokens_details, "reasoning_tokens", 0) or 0
-                text_tokens = getattr(completion_tokens_details, "text_tokens", 0) or 0
+            reasoning_tokens, text_tokens = self._extract_token_details(completion_tokens_details)
 
         # Estimate cost using our token counter or litellm's tracking
-        model = kwargs.get("model", "unknown")
         try:
             # Try to use litellm's cost tracking if available
             cost = response.get("_hidden_params", {}).get("response_cost", 0)
             if cost == 0:
                 # Fallback to our cost estimation
-                from agent_contracts.core.tokens import TokenCount
-
                 token_count = TokenCount(input_tokens=input_tokens, output_tokens=output_tokens)
                 cost_estimate = TokenCounter.calculate_cost(token_count, model)
                 cost = cost_estimate.total_cost
@@ -141,39 +233,40 @@ class ContractedLLM:
             # If cost calculation fails, use 0
             cost = 0
 
-        # Update resource usage with separate reasoning/text tracking
-        # Note: Don't pass tokens to add_api_call since we track them separately below
-        self.enforcer.monitor.usage.add_api_call(cost=cost, tokens=0)
+        # Models without a reasoning/text breakdown (GPT-4, Claude, etc.) have
+        # all output treated as text so fine-grained mode still works for them
+        if reasoning_tokens == 0 and text_tokens == 0:
+            text_tokens = output_tokens
+
+        # Record the call, cost, input tokens and output breakdown in one update
+        # (reasoning and text tokens also count toward the token total)
+        self.enforcer.monitor.update_resources(
+            {
+                "api_calls": 1,
+                "cost_usd": cost,
+                "tokens": input_tokens,
+                "reasoning_tokens": reasoning_tokens,
+                "text_tokens": text_tokens,
+            }
+        )
 
-        # Track tokens based on whether model provides reasoning/text breakdown
-        if reasoning_tokens > 0 or text_tokens > 0:
-            # Models with breakdown (Gemini 2.5, o1, etc.) - use detailed tracking
-            self.enforcer.monitor.usage.add_tokens(
-                count=0, reasoning=reasoning_tokens, text=text_tokens
-            )
-        else:
-            # Models without breakdown (GPT-4, Claude, etc.) - treat all as text
-            # This allows fine-grained mode to work with non-reasoning models
-            self.enforcer.monitor.usage.add_tokens(count=0, reasoning=0, text=output_tokens)
-
-        # Also track input tokens
-        self.enforcer.monitor.usage.add_tokens(count=input_tokens, reasoning=0, text=0)
-
-        # Emit completion event
-        self.enforcer._emit_event(
-            EnforcementEvent(
-                event_type="llm_completion",
-                contract=self.contract,
-                message=f"LLM completion: {model}",
-                data={
-                    "model": model,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens,
-                    "cost": cost,
-                },
+        # Emit completion event (only built when a callback is listening)
+        if self.enforcer.has_listeners("llm_completion"):
+            self.enforcer._emit_event(
+                EnforcementEvent(
+                    event_type="llm_completion",
+                    contract=self.contract,
+                    message=f"LLM completion: {model}",
+                    data={
+                        "model": model,
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens,
+                        "total_tokens": total_tokens,
+                        "cost": cost,
+                    },
+                )
             )
-        )
+            self.enforcer.flush()
 
         # Check constraints after call
         self._check_constraints_after_call()
@@ -183,8 +276,9 @@ class ContractedLLM:
     def streaming_completion(self, **kwargs: Any) -> Any:
         """Make a streaming completion call with contract enforcement.
 
-        This wraps litellm.completion(stream=True) and checks constraints
-        periodically during streaming.
+        This wraps litellm.completion(stream=True). Temporal constraints are
+        checked every few chunks; tokens and cost are taken from the usage
+        reported at the end of the stream and checked once it finishes.
 
         Args:
             **kwargs: Arguments to pass to litellm.completion()
@@ -198,18 +292,7 @@ class ContractedLLM:
         # Force streaming mode
         kwargs["stream"] = True
 
-        # Auto-start if needed
-        if self.auto_start and not self._started:
-            self.start()
-
-        # Check constraints before call
-        self._check_constraints_before_call()
-
-        # Auto-apply reasoning_effort from contract if not already specified
-        if "reasoning_effort" not in kwargs:
-            effort = self._get_reasoning_effort()
-            if effort is not None:
-                kwargs["reasoning_effort"] = effort
+        self._prepare_call(kwargs)
 
         # Track that we made an API call
         self.enforcer.monitor.usage.add_api_call()
@@ -217,9 +300,9 @@ class ContractedLLM:
         # Stream the response
         response = completion(**kwargs)
 
-        # Track tokens as we stream
-        total_input_tokens = 0
-        total_output_tokens = 0
+        # Usage is reported once, on the final chunk, so only the last
+        # non-empty usage is kept and accounted for when the stream ends
+        last_usage = None
         chunk_count = 0
         model = kwargs.get("model", "unknown")
 
@@ -227,71 +310,58 @@ class ContractedLLM:
             for chunk in response:
                 chunk_count += 1
 
-                # Extract token usage if available
                 usage = chunk.get("usage")
                 if usage:
-                    total_input_tokens = usage.get("prompt_tokens", total_input_tokens)
-                    total_output_tokens += usage.get("completion_tokens", 0)
-
-                # Check constraints periodically (every 10 chunks)
-                if chunk_count % 10 == 0:
-                    # Update estimated usage
-                    estimated_tokens = total_input_tokens + total_output_tokens
-                    if estimated_tokens > 0:
-                        # Update token count
-                        current_tokens = self.enforcer.monitor.usage.tokens
-                        self.enforcer.monitor.usage.tokens = (
-                            current_tokens - (chunk_count - 10) + estimated_tokens
-                        )
+                    last_usage = usage
 
-                    # Check constraints
-                    is_violated, violations = self.enforcer.check_constraints()
-                    if is_violated and self.enforcer.strict_mode:
+                # Token usage is not known mid-stream, so only deadlines are
+                # checked periodically
+                if chunk_count % _STREAM_CHECK_INTERVAL == 0:
+                    is_exceeded = self.enforcer.check_temporal_constraints()
+                    if is_exceeded and self.enforcer.strict_mode:
                         raise ContractViolationError(
-                            f"Contract violated during streaming: {violations}"
+                            "Temporal constraints exceeded during streaming"
                         )
 
                 yield chunk
 
         finally:
-            # Final token count update
+            total_input_tokens = 0
+            total_output_tokens = 0
+            if last_usage:
+                total_input_tokens = last_usage.get("prompt_tokens", 0) or 0
+                total_output_tokens = last_usage.get("completion_tokens", 0) or 0
             total_tokens = total_input_tokens + total_output_tokens
-            if total_tokens > 0:
-                # Set final token count
-                self.enforcer.monitor.usage.tokens = (
-                    self.enforcer.monitor.usage.tokens - chunk_count + total_tokens
-                )
 
             # Estimate final cost
+            cost = 0.0
             try:
-                from agent_contracts.core.tokens import TokenCount
-
                 token_count = TokenCount(
                     input_tokens=total_input_tokens, output_tokens=total_output_tokens
                 )
-                cost_estimate = TokenCounter.calculate_cost(token_count, model)
-                cost = cost_estimate.total_cost
-
-                # Update cost
-                self.enforcer.monitor.usage.add_cost(cost)
+                cost = TokenCounter.calculate_cost(token_count, model).total_cost
             except Exception:
                 pass
 
-            # Emit completion event
-            self.enforcer._emit_event(
-                EnforcementEvent(
-                    event_type="llm_streaming_completion",
-                    contract=self.contract,
-                    message=f"LLM streaming completion: {model}",
-                    data={
-                        "model": model,
-                        "input_tokens": total_input_tokens,
-                        "output_tokens": total_output_tokens,
-                        "total_tokens": total_tokens,
-                        "chunks": chunk_count,
-                    },
+            self.enforcer.monitor.update_resources({"tokens": total_tokens, "cost_usd": cost})
+
+            # Emit completion event (only built when a callback is listening)
+            if self.enforcer.has_listeners("llm_streaming_completion"):
+                self.enforcer._emit_event(
+                    EnforcementEvent(
+                        event_type="llm_streaming_completion",
+                        contract=self.contract,
+                        message=f"LLM streaming completion: {model}",
+                        data={
+                            "model": model,
+                            "input_tokens": total_input_tokens,
+                            "output_tokens": total_output_tokens,
+                            "total_tokens": total_tokens,
+                            "chunks": chunk_count,
+                        },
+                    )
                 )
-            )
+                self.enforcer.flush()
 
             # Final constraint check
             self._check_constraints_after_call()
@@ -304,15 +374,33 @@ class ContractedLLM:
         2. Auto-selected based on reasoning_tokens budget
         3. None if no reasoning constraints
 
+        The value is resolved once in ``__init__`` since resource
+        constraints are immutable.
+
         Returns:
             Reasoning effort level ("low"/"medium"/"high") or None
         """
-        # If explicitly specified in contract, use that
-        if self.contract.resources.reasoning_effort:
-            return self.contract.resources.reasoning_effort
+        return self._reasoning_effort
+
+    def _extract_token_details(self, details: Any) -> tuple[int, int]:
+        """Extract reasoning and text token counts from completion_tokens_details.
 
-        # Otherwise, auto-select based on budget
-        return self.contract.resources.recommended_reasoning_effort
+        Responses carry either a dict or a Pydantic object depending on the
+        SDK version. The matching reader is chosen once per response type and
+        reused, since a deployment almost always sees a single type.
+
+        Args:
+            details: The usage's completion_tokens_details value
+
+        Returns:
+            Tuple of (reasoning_tokens, text_tokens)
+        """
+        if type(details) is not self._details_type:
+            self._details_type = type(details)
+            self._details_extractor = (
+                _dict_token_details if isinstance(details, dict) else _attr_token_details
+            )
+        return self._details_extractor(details)
 
     def _check_constraints_before_call(self) -> None:
         """Check constraints before making an LLM call.
@@ -323,12 +411,15 @@ class ContractedLLM:
         if not self._started:
             return
 
-        # Check if already violated
-        is_violated, violations = self.enforcer.check_constraints()
-        if is_violated and self.enforcer.strict_mode:
-            raise ContractViolationError(f"Contract already violated: {violations}")
+        # Check if already violated. Usage may also be recorded outside this
+        # wrapper, so always check; the allocation-free check covers the
+        # common case and the full check only runs to record a violation.
+        if self.enforcer.check_constraints_fast():
+            is_violated, violations = self.enforcer.check_constraints()
+            if is_violated and self.enforcer.strict_mode:
+                raise ContractViolationError(f"Contract already violated: {violations}")
 
-        # Check temporal constraints
+        # Check temporal constraints (time moves on even when usage does not)
         is_exceeded = self.enforcer.check_temporal_constraints()
         if is_exceeded and self.enforcer.strict_mode:
             raise ContractViolationError("Temporal constraints exceeded")
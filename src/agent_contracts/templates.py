@@ -21,8 +21,12 @@ Example:
     ... )
 """
 
+import math
+from bisect import bisect_right
+from collections.abc import Iterable
 from datetime import timedelta
-from typing import Any, cast
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from agent_contracts.core.contract import (
     Contract,
@@ -33,6 +37,174 @@ from agent_contracts.core.contract import (
 )
 
 
+class _ModeConfig(NamedTuple):
+    """Default resource and time limits for one template mode or size tier."""
+
+    tokens: int | None
+    api_calls: int | None
+    cost_usd: float | None
+    max_duration: timedelta | None
+    web_searches: int | None = None
+    memory_mb: float | None = None
+
+
+def _apply_overrides(config: _ModeConfig, overrides: dict[str, Any]) -> _ModeConfig:
+    """Return config with custom resource limits applied.
+
+    Keys that are not template settings are ignored.
+
+    Args:
+        config: Default configuration
+        overrides: Custom resource limits
+
+    Returns:
+        New configuration with overrides applied
+    """
+    return config._replace(**{k: v for k, v in overrides.items() if k in _ModeConfig._fields})
+
+
+# Contract ID slugs, cached since the same topics and repositories tend to
+# recur when contracts are created per ticket or per PR
+@lru_cache(maxsize=1024)
+def _slug_topic(topic: str) -> str:
+    """Return a research topic as a lowercase, hyphenated ID slug."""
+    return topic.lower().replace(" ", "-")
+
+
+@lru_cache(maxsize=1024)
+def _slug_repo(repository: str) -> str:
+    """Return an "owner/name" repository as an ID slug."""
+    return repository.replace("/", "-")
+
+
+@lru_cache(maxsize=1024)
+def _slug_dataset(dataset_name: str) -> str:
+    """Return a dataset file name as an ID slug."""
+    return dataset_name.replace(".", "-")
+
+
+# Default configurations, built once at import and shared by every contract
+
+# Research resource allocations by mode
+_RESEARCH_MODE_CONFIGS: dict[ContractMode, _ModeConfig] = {
+    ContractMode.URGENT: _ModeConfig(
+        tokens=200_000,
+        web_searches=30,
+        api_calls=60,
+        cost_usd=4.0,
+        max_duration=timedelta(minutes=30),
+    ),
+    ContractMode.BALANCED: _ModeConfig(
+        tokens=150_000,
+        web_searches=20,
+        api_calls=40,
+        cost_usd=3.0,
+        max_duration=timedelta(hours=2),
+    ),
+    ContractMode.ECONOMICAL: _ModeConfig(
+        tokens=80_000,
+        web_searches=10,
+        api_calls=25,
+        cost_usd=1.5,
+        max_duration=timedelta(hours=4),
+    ),
+}
+
+# Code review resources by PR size
+_CODE_REVIEW_SMALL = _ModeConfig(
+    tokens=30_000,
+    api_calls=15,
+    cost_usd=1.50,
+    max_duration=timedelta(minutes=3),
+)
+_CODE_REVIEW_MEDIUM = _ModeConfig(
+    tokens=50_000,
+    api_calls=25,
+    cost_usd=2.50,
+    max_duration=timedelta(minutes=5),
+)
+_CODE_REVIEW_LARGE = _ModeConfig(
+    tokens=80_000,
+    api_calls=40,
+    cost_usd=4.00,
+    max_duration=timedelta(minutes=10),
+)
+
+# Upper bounds of the small (< 5 files) and medium (<= 15 files) PR tiers
+_CODE_REVIEW_BOUNDS = (5, math.nextafter(15, math.inf))
+_CODE_REVIEW_TIERS = (_CODE_REVIEW_SMALL, _CODE_REVIEW_MEDIUM, _CODE_REVIEW_LARGE)
+
+# Skills listed in contract metadata (tuples, so every contract can share them)
+_CODE_REVIEW_SKILLS = (
+    "static_analysis",
+    "security_scanning",
+    "style_checking",
+    "complexity_analysis",
+)
+_SUPPORT_SKILLS = ("triage", "knowledge_search", "response_generation")
+_DATA_ANALYSIS_SKILLS = ("data_loading", "statistical_analysis", "visualization")
+
+# Customer support mode for each ticket priority
+_SUPPORT_PRIORITY_MODES = {
+    "low": ContractMode.ECONOMICAL,
+    "normal": ContractMode.BALANCED,
+    "high": ContractMode.URGENT,
+    "urgent": ContractMode.URGENT,
+}
+
+# Customer support resources by mode
+_SUPPORT_MODE_CONFIGS: dict[ContractMode, _ModeConfig] = {
+    ContractMode.URGENT: _ModeConfig(
+        tokens=10_000,
+        api_calls=15,
+        web_searches=5,
+        cost_usd=0.50,
+        max_duration=timedelta(minutes=2),
+    ),
+    ContractMode.BALANCED: _ModeConfig(
+        tokens=8_000,
+        api_calls=10,
+        web_searches=3,
+        cost_usd=0.30,
+        max_duration=timedelta(minutes=5),
+    ),
+    ContractMode.ECONOMICAL: _ModeConfig(
+        tokens=5_000,
+        api_calls=5,
+        web_searches=2,
+        cost_usd=0.15,
+        max_duration=timedelta(minutes=10),
+    ),
+}
+
+# Data analysis resources by dataset size
+_DATA_ANALYSIS_SMALL = _ModeConfig(
+    tokens=20_000,
+    api_calls=10,
+    cost_usd=1.00,
+    memory_mb=512.0,
+    max_duration=timedelta(minutes=5),
+)
+_DATA_ANALYSIS_MEDIUM = _ModeConfig(
+    tokens=50_000,
+    api_calls=25,
+    cost_usd=2.50,
+    memory_mb=1024.0,
+    max_duration=timedelta(minutes=15),
+)
+_DATA_ANALYSIS_LARGE = _ModeConfig(
+    tokens=100_000,
+    api_calls=50,
+    cost_usd=5.00,
+    memory_mb=2048.0,
+    max_duration=timedelta(minutes=30),
+)
+
+# Upper bounds of the small (< 1MB) and medium (<= 10MB) dataset tiers
+_DATA_ANALYSIS_BOUNDS = (1.0, math.nextafter(10.0, math.inf))
+_DATA_ANALYSIS_TIERS = (_DATA_ANALYSIS_SMALL, _DATA_ANALYSIS_MEDIUM, _DATA_ANALYSIS_LARGE)
+
+
 class ResearchContract:
     """Research report generation contract (Whitepaper Section 6.1).
 
@@ -52,8 +224,9 @@ class ResearchContract:
     - Economical: 4 hours, 80K tokens, 10 searches (90% quality)
     """
 
-    @staticmethod
+    @classmethod
     def create(
+        cls,
         topic: str,
         depth: str = "comprehensive",
         mode: ContractMode = ContractMode.BALANCED,
@@ -79,55 +252,85 @@ class ResearchContract:
             ...     mode=ContractMode.BALANCED
             ... )
         """
-        # Default resource allocations by mode
-        mode_configs = {
-            ContractMode.URGENT: {
-                "tokens": 200_000,
-                "web_searches": 30,
-                "api_calls": 60,
-                "cost_usd": 4.0,
-                "max_duration": timedelta(minutes=30),
-            },
-            ContractMode.BALANCED: {
-                "tokens": 150_000,
-                "web_searches": 20,
-                "api_calls": 40,
-                "cost_usd": 3.0,
-                "max_duration": timedelta(hours=2),
-            },
-            ContractMode.ECONOMICAL: {
-                "tokens": 80_000,
-                "web_searches": 10,
-                "api_calls": 25,
-                "cost_usd": 1.5,
-                "max_duration": timedelta(hours=4),
-            },
-        }
+        resource_constraints, temporal_constraints = cls._constraints(mode, resources)
+        return cls._contract(
+            topic, depth, mode, resource_constraints, temporal_constraints, contract_id
+        )
+
+    @classmethod
+    def create_batch(
+        cls,
+        topics: Iterable[str],
+        depth: str = "comprehensive",
+        mode: ContractMode = ContractMode.BALANCED,
+        resources: dict[str, Any] | None = None,
+    ) -> list[Contract]:
+        """Create research contracts for many topics at once.
+
+        Equivalent to calling create() for each topic, but the constraints
+        are resolved once and shared by every contract (they are immutable).
+
+        Args:
+            topics: Research topics, one contract each
+            depth: Depth of research ("overview", "standard", "comprehensive")
+            mode: Contract mode (URGENT, BALANCED, ECONOMICAL)
+            resources: Optional custom resource limits
+
+        Returns:
+            Configured Contract instances, in topic order
+
+        Example:
+            >>> contracts = ResearchContract.create_batch(
+            ...     ["Solid-State Batteries", "Grid Storage"],
+            ...     mode=ContractMode.ECONOMICAL
+            ... )
+        """
+        resource_constraints, temporal_constraints = cls._constraints(mode, resources)
+        return [
+            cls._contract(topic, depth, mode, resource_constraints, temporal_constraints, None)
+            for topic in topics
+        ]
 
+    @staticmethod
+    def _constraints(
+        mode: ContractMode, resources: dict[str, Any] | None
+    ) -> tuple[ResourceConstraints, TemporalConstraints]:
+        """Resolve the resource and temporal constraints for a mode."""
         # Get config for selected mode
-        config = mode_configs[mode]
+        config = _RESEARCH_MODE_CONFIGS[mode]
 
         # Override with custom resources if provided
         if resources:
-            config.update(resources)
+            config = _apply_overrides(config, resources)
 
         # Create resource constraints
         resource_constraints = ResourceConstraints(
-            tokens=cast("int | None", config.get("tokens")),
-            web_searches=cast("int | None", config.get("web_searches")),
-            api_calls=cast("int | None", config.get("api_calls")),
-            cost_usd=cast("float | None", config.get("cost_usd")),
+            tokens=config.tokens,
+            web_searches=config.web_searches,
+            api_calls=config.api_calls,
+            cost_usd=config.cost_usd,
         )
 
         # Create temporal constraints
         temporal_constraints = TemporalConstraints(
-            max_duration=cast("timedelta | None", config.get("max_duration")),
+            max_duration=config.max_duration,
             deadline_type=DeadlineType.SOFT,
         )
 
-        # Create contract
+        return resource_constraints, temporal_constraints
+
+    @staticmethod
+    def _contract(
+        topic: str,
+        depth: str,
+        mode: ContractMode,
+        resource_constraints: ResourceConstraints,
+        temporal_constraints: TemporalConstraints,
+        contract_id: str | None,
+    ) -> Contract:
+        """Create the contract for one topic from resolved constraints."""
         return Contract(
-            id=contract_id or f"research-{topic.lower().replace(' ', '-')}",
+            id=contract_id or f"research-{_slug_topic(topic)}",
             name=f"Research: {topic}",
             mode=mode,
             resources=resource_constraints,
@@ -160,8 +363,9 @@ class CodeReviewContract:
     - Large (>15 files): 80K tokens, $4.00
     """
 
-    @staticmethod
+    @classmethod
     def create(
+        cls,
         repository: str,
         pr_number: int | None = None,
         files_changed: int = 10,
@@ -190,53 +394,30 @@ class CodeReviewContract:
             ... )
         """
         # Scale resources based on PR size
-        if files_changed < 5:
-            # Small PR
-            default_config = {
-                "tokens": 30_000,
-                "api_calls": 15,
-                "cost_usd": 1.50,
-                "max_duration": timedelta(minutes=3),
-            }
-        elif files_changed <= 15:
-            # Medium PR
-            default_config = {
-                "tokens": 50_000,
-                "api_calls": 25,
-                "cost_usd": 2.50,
-                "max_duration": timedelta(minutes=5),
-            }
-        else:
-            # Large PR
-            default_config = {
-                "tokens": 80_000,
-                "api_calls": 40,
-                "cost_usd": 4.00,
-                "max_duration": timedelta(minutes=10),
-            }
+        default_config = _CODE_REVIEW_TIERS[bisect_right(_CODE_REVIEW_BOUNDS, files_changed)]
 
         # Override with custom resources if provided
         if resources:
-            default_config.update(resources)
+            default_config = _apply_overrides(default_config, resources)
 
         # Create resource constraints
         resource_constraints = ResourceConstraints(
-            tokens=cast("int | None", default_config.get("tokens")),
-            api_calls=cast("int | None", default_config.get("api_calls")),
-            cost_usd=cast("float | None", default_config.get("cost_usd")),
+            tokens=default_config.tokens,
+            api_calls=default_config.api_calls,
+            cost_usd=default_config.cost_usd,
             web_searches=0,  # No web access for code review
         )
 
         # Create temporal constraints
         temporal_constraints = TemporalConstraints(
-            max_duration=cast("timedelta | None", default_config.get("max_duration")),
+            max_duration=default_config.max_duration,
             deadline_type=DeadlineType.SOFT if not strict_mode else DeadlineType.HARD,
         )
 
         # Create contract
         pr_id = f"-pr{pr_number}" if pr_number else ""
         return Contract(
-            id=contract_id or f"code-review-{repository.replace('/', '-')}{pr_id}",
+            id=contract_id or f"code-review-{_slug_repo(repository)}{pr_id}",
             name=f"Code Review: {repository}",
             mode=ContractMode.BALANCED,
             resources=resource_constraints,
@@ -246,12 +427,7 @@ class CodeReviewContract:
                 "pr_number": pr_number,
                 "files_changed": files_changed,
                 "template": "CodeReviewContract",
-                "skills": [
-                    "static_analysis",
-                    "security_scanning",
-                    "style_checking",
-                    "complexity_analysis",
-                ],
+                "skills": _CODE_REVIEW_SKILLS,
             },
         )
 
@@ -271,8 +447,9 @@ class CustomerSupportContract:
     - Economical: Low-priority, cost-optimized (10 min)
     """
 
-    @staticmethod
+    @classmethod
     def create(
+        cls,
         ticket_id: str,
         priority: str = "normal",
         mode: ContractMode | None = None,
@@ -299,57 +476,26 @@ class CustomerSupportContract:
         """
         # Auto-select mode based on priority if not specified
         if mode is None:
-            mode_mapping = {
-                "low": ContractMode.ECONOMICAL,
-                "normal": ContractMode.BALANCED,
-                "high": ContractMode.URGENT,
-                "urgent": ContractMode.URGENT,
-            }
-            mode = mode_mapping.get(priority.lower(), ContractMode.BALANCED)
-
-        # Resource configurations by mode
-        mode_configs = {
-            ContractMode.URGENT: {
-                "tokens": 10_000,
-                "api_calls": 15,
-                "web_searches": 5,
-                "cost_usd": 0.50,
-                "max_duration": timedelta(minutes=2),
-            },
-            ContractMode.BALANCED: {
-                "tokens": 8_000,
-                "api_calls": 10,
-                "web_searches": 3,
-                "cost_usd": 0.30,
-                "max_duration": timedelta(minutes=5),
-            },
-            ContractMode.ECONOMICAL: {
-                "tokens": 5_000,
-                "api_calls": 5,
-                "web_searches": 2,
-                "cost_usd": 0.15,
-                "max_duration": timedelta(minutes=10),
-            },
-        }
+            mode = _SUPPORT_PRIORITY_MODES.get(priority.lower(), ContractMode.BALANCED)
 
         # Get config for selected mode
-        config = mode_configs[mode]
+        config = _SUPPORT_MODE_CONFIGS[mode]
 
         # Override with custom resources if provided
         if resources:
-            config.update(resources)
+            config = _apply_overrides(config, resources)
 
         # Create resource constraints
         resource_constraints = ResourceConstraints(
-            tokens=cast("int | None", config.get("tokens")),
-            api_calls=cast("int | None", config.get("api_calls")),
-            web_searches=cast("int | None", config.get("web_searches")),
-            cost_usd=cast("float | None", config.get("cost_usd")),
+            tokens=config.tokens,
+            api_calls=config.api_calls,
+            web_searches=config.web_searches,
+            cost_usd=config.cost_usd,
         )
 
         # Create temporal constraints
         temporal_constraints = TemporalConstraints(
-            max_duration=cast("timedelta | None", config.get("max_duration")),
+            max_duration=config.max_duration,
             deadline_type=DeadlineType.SOFT,
         )
 
@@ -364,7 +510,7 @@ class CustomerSupportContract:
                 "ticket_id": ticket_id,
                 "priority": priority,
                 "template": "CustomerSupportContract",
-                "skills": ["triage", "knowledge_search", "response_generation"],
+                "skills": _SUPPORT_SKILLS,
             },
         )
 
@@ -384,8 +530,9 @@ class DataAnalysisContract:
     - Large (>10MB): 100K tokens, $5.00
     """
 
-    @staticmethod
+    @classmethod
     def create(
+        cls,
         dataset_name: str,
         dataset_size_mb: float = 1.0,
         analysis_type: str = "exploratory",
@@ -412,56 +559,30 @@ class DataAnalysisContract:
             ... )
         """
         # Scale resources based on dataset size
-        if dataset_size_mb < 1.0:
-            # Small dataset
-            default_config = {
-                "tokens": 20_000,
-                "api_calls": 10,
-                "cost_usd": 1.00,
-                "memory_mb": 512.0,
-                "max_duration": timedelta(minutes=5),
-            }
-        elif dataset_size_mb <= 10.0:
-            # Medium dataset
-            default_config = {
-                "tokens": 50_000,
-                "api_calls": 25,
-                "cost_usd": 2.50,
-                "memory_mb": 1024.0,
-                "max_duration": timedelta(minutes=15),
-            }
-        else:
-            # Large dataset
-            default_config = {
-                "tokens": 100_000,
-                "api_calls": 50,
-                "cost_usd": 5.00,
-                "memory_mb": 2048.0,
-                "max_duration": timedelta(minutes=30),
-            }
+        default_config = _DATA_ANALYSIS_TIERS[bisect_right(_DATA_ANALYSIS_BOUNDS, dataset_size_mb)]
 
         # Override with custom resources if provided
         if resources:
-            default_config.update(resources)
+            default_config = _apply_overrides(default_config, resources)
 
         # Create resource constraints
         resource_constraints = ResourceConstraints(
-            tokens=cast("int | None", default_config.get("tokens")),
-            api_calls=cast("int | None", default_config.get("api_calls")),
-            cost_usd=cast("float | None", default_config.get("cost_usd")),
-            memory_mb=cast("float | None", default_config.get("memory_mb")),
+            tokens=default_config.tokens,
+            api_calls=default_config.api_calls,
+            cost_usd=default_config.cost_usd,
+            memory_mb=default_config.memory_mb,
             web_searches=0,  # No web access for data analysis
         )
 
         # Create temporal constraints
         temporal_constraints = TemporalConstraints(
-            max_duration=cast("timedelta | None", default_config.get("max_duration")),
+            max_duration=default_config.max_duration,
             deadline_type=DeadlineType.SOFT,
         )
 
         # Create contract
         return Contract(
-            id=contract_id or f"analysis-{dataset_name.replace('.', '-')}",
+            id=contract_id or f"analysis-{_slug_dataset(dataset_name)}",
             name=f"Data Analysis: {dataset_name}",
             mode=ContractMode.BALANCED,
             resources=resource_constraints,
@@ -471,7 +592,7 @@ class DataAnalysisContract:
                 "dataset_size_mb": dataset_size_mb,
                 "analysis_type": analysis_type,
                 "template": "DataAnalysisContract",
-                "skills": ["data_loading", "statistical_analysis", "visualization"],
+                "skills": _DATA_ANALYSIS_SKILLS,
             },
         )
 
@@ -501,7 +622,8 @@ def get_template(template_name: str) -> type:
         >>> template = get_template("research")
         >>> contract = template.create(topic="AI Ethics")
     """
-    if template_name not in TEMPLATES:
+    template = TEMPLATES.get(template_name)
+    if template is None:
         available = ", ".join(TEMPLATES.keys())
         raise KeyError(f"Template '{template_name}' not found. Available templates: {available}")
-    return TEMPLATES[template_name]
+    return template
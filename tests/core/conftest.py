@@ -0,0 +1,51 @@
+"""Shared fixtures for core tests."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from agent_contracts.core import Contract, EnforcementEvent
+
+
+class EventCollector:
+    """Enforcement callback that records every event it receives."""
+
+    def __init__(self) -> None:
+        """Start with no recorded events."""
+        self.events: list[EnforcementEvent] = []
+
+    def __call__(self, event: EnforcementEvent) -> None:
+        """Record an event."""
+        self.events.append(event)
+
+
+@pytest.fixture
+def drafted_contract() -> Contract:
+    """A fresh contract in the DRAFTED state."""
+    return Contract(id="test", name="Test")
+
+
+@pytest.fixture
+def activated_contract(drafted_contract: Contract) -> Contract:
+    """A fresh contract in the ACTIVE state."""
+    drafted_contract.activate()
+    return drafted_contract
+
+
+@pytest.fixture
+def contract_factory() -> Callable[..., Contract]:
+    """Build fresh contracts with id "test" and name "Test" unless overridden."""
+
+    def _make(**overrides: Any) -> Contract:
+        overrides.setdefault("id", "test")
+        overrides.setdefault("name", "Test")
+        return Contract(**overrides)
+
+    return _make
+
+
+@pytest.fixture
+def event_collector() -> EventCollector:
+    """A fresh callback that collects enforcement events."""
+    return EventCollector()
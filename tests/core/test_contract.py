@@ -1,6 +1,7 @@
 """Unit tests for core contract data structures."""
 
 from datetime import datetime, timedelta
+from typing import Any
 
 import pytest
 
@@ -17,6 +18,60 @@ from agent_contracts.core import (
     TerminationCondition,
 )
 
+# Shared time values (immutable, so tests can check they are stored as given)
+_DEADLINE = datetime(2025, 12, 31, 23, 59, 59)
+_TWO_HOURS = timedelta(hours=2)
+_FIVE_MINUTES = timedelta(minutes=5)
+
+# Core data structures should construct and transition without any warnings
+pytestmark = pytest.mark.filterwarnings("error")
+
+# Out-of-range values and the error each constructor reports for them
+_INVALID_VALUES = [
+    pytest.param(
+        ResourceConstraints, {"tokens": -100}, "tokens must be non-negative", id="tokens_neg"
+    ),
+    pytest.param(
+        ResourceConstraints, {"cost_usd": -1.0}, "cost_usd must be non-negative", id="cost_neg"
+    ),
+    pytest.param(
+        TemporalConstraints,
+        {"soft_deadline_quality_decay": -0.1},
+        "soft_deadline_quality_decay must be non-negative",
+        id="decay_neg",
+    ),
+    pytest.param(
+        SuccessCriterion,
+        {"name": "test", "condition": "true", "weight": -0.1},
+        "weight must be in",
+        id="weight_low",
+    ),
+    pytest.param(
+        SuccessCriterion,
+        {"name": "test", "condition": "true", "weight": 1.5},
+        "weight must be in",
+        id="weight_high",
+    ),
+    pytest.param(
+        OutputSpecification, {"min_quality": -0.1}, "min_quality must be in", id="minq_low"
+    ),
+    pytest.param(
+        OutputSpecification, {"min_quality": 1.1}, "min_quality must be in", id="minq_high"
+    ),
+]
+
+
+class TestValidation:
+    """Tests for constructor validation of contract components."""
+
+    @pytest.mark.parametrize(("cls", "kwargs", "match"), _INVALID_VALUES)
+    def test_invalid_values_raise_error(
+        self, cls: type, kwargs: dict[str, Any], match: str
+    ) -> None:
+        """Test that out-of-range values raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            cls(**kwargs)
+
 
 class TestResourceConstraints:
     """Tests for ResourceConstraints validation and creation."""
@@ -36,14 +91,6 @@ class TestResourceConstraints:
         assert constraints.cost_usd == 5.0
         assert constraints.memory_mb == 500.0
 
-    def test_negative_values_raise_error(self) -> None:
-        """Test that negative resource values raise ValueError."""
-        with pytest.raises(ValueError, match="tokens must be non-negative"):
-            ResourceConstraints(tokens=-100)
-
-        with pytest.raises(ValueError, match="cost_usd must be non-negative"):
-            ResourceConstraints(cost_usd=-1.0)
-
     def test_zero_values_allowed(self) -> None:
         """Test that zero values are valid (no budget)."""
         constraints = ResourceConstraints(tokens=0, api_calls=0, cost_usd=0.0)
@@ -51,6 +98,13 @@ class TestResourceConstraints:
         assert constraints.api_calls == 0
         assert constraints.cost_usd == 0.0
 
+    def test_any_set(self) -> None:
+        """Test detecting whether any resource limit is specified."""
+        assert ResourceConstraints().any_set() is False
+        assert ResourceConstraints(reasoning_effort="low").any_set() is False
+        assert ResourceConstraints(tokens=0).any_set() is True
+        assert ResourceConstraints(cost_usd=1.0).any_set() is True
+
     def test_immutability(self) -> None:
         """Test that ResourceConstraints is immutable (frozen dataclass)."""
         constraints = ResourceConstraints(tokens=1000)
@@ -72,36 +126,24 @@ class TestContractMode:
         contract = Contract(id="test", name="Test Contract")
         assert contract.mode == ContractMode.BALANCED
 
-    def test_contract_with_urgent_mode(self) -> None:
-        """Test creating contract with URGENT mode."""
-        contract = Contract(
-            id="urgent-task",
-            name="Urgent Task",
-            mode=ContractMode.URGENT,
-            resources=ResourceConstraints(tokens=20000),  # Higher budget for speed
-        )
-        assert contract.mode == ContractMode.URGENT
-        assert contract.resources.tokens == 20000
-
-    def test_contract_with_economical_mode(self) -> None:
-        """Test creating contract with ECONOMICAL mode."""
+    @pytest.mark.parametrize(
+        ("mode", "tokens"),
+        [
+            (ContractMode.URGENT, 20000),  # Higher budget for speed
+            (ContractMode.BALANCED, 10000),
+            (ContractMode.ECONOMICAL, 5000),  # Lower budget for cost savings
+        ],
+    )
+    def test_contract_with_mode(self, mode: ContractMode, tokens: int) -> None:
+        """Test creating a contract in each mode with a matching budget."""
         contract = Contract(
-            id="batch-job",
-            name="Batch Processing",
-            mode=ContractMode.ECONOMICAL,
-            resources=ResourceConstraints(tokens=5000),  # Lower budget for cost savings
+            id=f"{mode.value}-task",
+            name=f"{mode.value} task",
+            mode=mode,
+            resources=ResourceConstraints(tokens=tokens),
         )
-        assert contract.mode == ContractMode.ECONOMICAL
-        assert contract.resources.tokens == 5000
-
-    def test_contract_mode_in_repr(self) -> None:
-        """Test that contract mode is represented in string format."""
-        contract_urgent = Contract(id="u1", name="Urgent", mode=ContractMode.URGENT)
-        contract_eco = Contract(id="e1", name="Eco", mode=ContractMode.ECONOMICAL)
-
-        # Mode should be accessible
-        assert contract_urgent.mode == ContractMode.URGENT
-        assert contract_eco.mode == ContractMode.ECONOMICAL
+        assert contract.mode is mode
+        assert contract.resources.tokens == tokens
 
 
 class TestTemporalConstraints:
@@ -116,27 +158,26 @@ class TestTemporalConstraints:
 
     def test_create_with_deadline(self) -> None:
         """Test creating constraints with absolute deadline."""
-        deadline = datetime(2025, 12, 31, 23, 59, 59)
-        constraints = TemporalConstraints(deadline=deadline, deadline_type=DeadlineType.SOFT)
-        assert constraints.deadline == deadline
+        constraints = TemporalConstraints(deadline=_DEADLINE, deadline_type=DeadlineType.SOFT)
+        assert constraints.deadline is _DEADLINE
         assert constraints.deadline_type == DeadlineType.SOFT
 
     def test_create_with_duration(self) -> None:
         """Test creating constraints with max duration."""
-        duration = timedelta(hours=2)
-        constraints = TemporalConstraints(max_duration=duration)
-        assert constraints.max_duration == duration
-
-    def test_negative_quality_decay_raises_error(self) -> None:
-        """Test that negative quality decay raises ValueError."""
-        with pytest.raises(ValueError, match="soft_deadline_quality_decay must be non-negative"):
-            TemporalConstraints(soft_deadline_quality_decay=-0.1)
+        constraints = TemporalConstraints(max_duration=_TWO_HOURS)
+        assert constraints.max_duration is _TWO_HOURS
 
     def test_quality_decay_zero_allowed(self) -> None:
         """Test that zero quality decay is valid."""
         constraints = TemporalConstraints(soft_deadline_quality_decay=0.0)
         assert constraints.soft_deadline_quality_decay == 0.0
 
+    def test_any_set(self) -> None:
+        """Test detecting whether any time boundary is specified."""
+        assert TemporalConstraints().any_set() is False
+        assert TemporalConstraints(deadline_type=DeadlineType.SOFT).any_set() is False
+        assert TemporalConstraints(max_duration=_FIVE_MINUTES).any_set() is True
+
 
 class TestInputOutputSpecification:
     """Tests for InputSpecification and OutputSpecification."""
@@ -166,16 +207,10 @@ class TestInputOutputSpecification:
         assert spec.quality_criteria == {}
         assert spec.min_quality == 0.0
 
-    def test_output_spec_min_quality_validation(self) -> None:
-        """Test that min_quality must be in [0, 1]."""
-        OutputSpecification(min_quality=0.0)  # Valid
-        OutputSpecification(min_quality=1.0)  # Valid
-
-        with pytest.raises(ValueError, match="min_quality must be in"):
-            OutputSpecification(min_quality=-0.1)
-
-        with pytest.raises(ValueError, match="min_quality must be in"):
-            OutputSpecification(min_quality=1.1)
+    @pytest.mark.parametrize("min_quality", [0.0, 1.0])
+    def test_output_spec_min_quality_bounds(self, min_quality: float) -> None:
+        """Test that both ends of the [0, 1] min_quality range are accepted."""
+        assert OutputSpecification(min_quality=min_quality).min_quality == min_quality
 
 
 class TestSuccessCriterion:
@@ -189,16 +224,10 @@ class TestSuccessCriterion:
         assert criterion.weight == 0.5
         assert criterion.required is False
 
-    def test_weight_validation(self) -> None:
-        """Test that weight must be in [0, 1]."""
-        SuccessCriterion(name="test", condition="true", weight=0.0)
-        SuccessCriterion(name="test", condition="true", weight=1.0)
-
-        with pytest.raises(ValueError, match="weight must be in"):
-            SuccessCriterion(name="test", condition="true", weight=-0.1)
-
-        with pytest.raises(ValueError, match="weight must be in"):
-            SuccessCriterion(name="test", condition="true", weight=1.5)
+    @pytest.mark.parametrize("weight", [0.0, 1.0])
+    def test_weight_bounds(self, weight: float) -> None:
+        """Test that both ends of the [0, 1] weight range are accepted."""
+        assert SuccessCriterion(name="test", condition="true", weight=weight).weight == weight
 
 
 class TestContract:
@@ -214,6 +243,8 @@ class TestContract:
 
     def test_create_full_contract(self) -> None:
         """Test creating a contract with all fields."""
+        criterion = SuccessCriterion(name="completion", condition="done", weight=0.5, required=True)
+        termination = TerminationCondition(type="time_limit", condition="timeout", priority=1)
         contract = Contract(
             id="code-review-1",
             name="Code Review Agent",
@@ -223,28 +254,24 @@ class TestContract:
             outputs=OutputSpecification(min_quality=0.8),
             skills=["static_analysis", "security_scan"],
             resources=ResourceConstraints(tokens=50000, api_calls=30),
-            temporal=TemporalConstraints(max_duration=timedelta(minutes=5)),
-            success_criteria=[
-                SuccessCriterion(name="completion", condition="done", weight=0.5, required=True)
-            ],
-            termination_conditions=[
-                TerminationCondition(type="time_limit", condition="timeout", priority=1)
-            ],
+            temporal=TemporalConstraints(max_duration=_FIVE_MINUTES),
+            success_criteria=[criterion],
+            termination_conditions=[termination],
         )
 
         assert contract.id == "code-review-1"
         assert contract.name == "Code Review Agent"
         assert contract.description == "Automated PR review"
         assert contract.version == "2.0"
-        assert len(contract.skills) == 2
+        assert contract.skills == ["static_analysis", "security_scan"]
         assert contract.resources.tokens == 50000
-        assert contract.temporal.max_duration == timedelta(minutes=5)
-        assert len(contract.success_criteria) == 1
-        assert len(contract.termination_conditions) == 1
+        assert contract.temporal.max_duration is _FIVE_MINUTES
+        assert contract.success_criteria == [criterion]
+        assert contract.termination_conditions == [termination]
 
-    def test_contract_state_transitions(self) -> None:
+    def test_contract_state_transitions(self, drafted_contract: Contract) -> None:
         """Test valid contract state transitions."""
-        contract = Contract(id="test", name="Test")
+        contract = drafted_contract
         assert contract.state == ContractState.DRAFTED
 
         # DRAFTED -> ACTIVE
@@ -256,79 +283,60 @@ class TestContract:
         with pytest.raises(ValueError, match="Cannot activate contract"):
             contract.activate()
 
-    def test_contract_fulfill(self) -> None:
-        """Test fulfilling a contract."""
-        contract = Contract(id="test", name="Test")
-        contract.activate()
-
-        contract.fulfill()
-        assert contract.state == ContractState.FULFILLED
-        assert contract.is_complete()
-
-        # Cannot fulfill from non-active state
-        contract2 = Contract(id="test2", name="Test2")
+    @pytest.mark.parametrize(
+        ("action", "expected"),
+        [
+            ("fulfill", ContractState.FULFILLED),
+            ("violate", ContractState.VIOLATED),
+            ("expire", ContractState.EXPIRED),
+            ("terminate", ContractState.TERMINATED),
+        ],
+    )
+    def test_lifecycle_transitions(
+        self, activated_contract: Contract, action: str, expected: ContractState
+    ) -> None:
+        """Test each transition out of ACTIVE ends in its terminal state."""
+        getattr(activated_contract, action)()
+        assert activated_contract.state is expected
+        assert activated_contract.is_complete()
+        assert not activated_contract.is_active()
+
+    def test_contract_fulfill_requires_active(self, drafted_contract: Contract) -> None:
+        """Test that a contract cannot be fulfilled before it is active."""
         with pytest.raises(ValueError, match="Cannot fulfill contract"):
-            contract2.fulfill()
+            drafted_contract.fulfill()
 
-    def test_contract_violate(self) -> None:
-        """Test violating a contract."""
-        contract = Contract(id="test", name="Test")
-        contract.activate()
-
-        contract.violate(reason="Budget exceeded")
-        assert contract.state == ContractState.VIOLATED
-        assert contract.metadata["violation_reason"] == "Budget exceeded"
-        assert contract.is_complete()
+    def test_contract_violate_records_reason(self, activated_contract: Contract) -> None:
+        """Test that violating a contract records the reason."""
+        activated_contract.violate(reason="Budget exceeded")
+        assert activated_contract.metadata["violation_reason"] == "Budget exceeded"
 
-    def test_contract_expire(self) -> None:
-        """Test expiring a contract."""
-        contract = Contract(id="test", name="Test")
-        contract.activate()
+    @pytest.mark.parametrize("start", ["drafted_contract", "activated_contract"])
+    def test_contract_terminate(self, request: pytest.FixtureRequest, start: str) -> None:
+        """Test terminating a contract from DRAFTED and from ACTIVE."""
+        contract: Contract = request.getfixturevalue(start)
 
-        contract.expire()
-        assert contract.state == ContractState.EXPIRED
-        assert contract.is_complete()
-
-    def test_contract_terminate(self) -> None:
-        """Test terminating a contract."""
-        contract = Contract(id="test", name="Test")
-
-        # Can terminate from DRAFTED
         contract.terminate(reason="User cancelled")
         assert contract.state == ContractState.TERMINATED
         assert contract.metadata["termination_reason"] == "User cancelled"
         assert contract.is_complete()
 
-        # Can terminate from ACTIVE
-        contract2 = Contract(id="test2", name="Test2")
-        contract2.activate()
-        contract2.terminate()
-        assert contract2.state == ContractState.TERMINATED
-
         # Cannot terminate from terminal states
         with pytest.raises(ValueError, match="Cannot terminate contract"):
-            contract2.terminate()
-
-    def test_is_active_method(self) -> None:
-        """Test is_active method."""
-        contract = Contract(id="test", name="Test")
-        assert not contract.is_active()
-
-        contract.activate()
-        assert contract.is_active()
+            contract.terminate()
 
-        contract.fulfill()
+    def test_lifecycle_predicates(self, drafted_contract: Contract) -> None:
+        """Test is_active and is_complete at each step from DRAFTED to FULFILLED."""
+        contract = drafted_contract
         assert not contract.is_active()
-
-    def test_is_complete_method(self) -> None:
-        """Test is_complete method."""
-        contract = Contract(id="test", name="Test")
         assert not contract.is_complete()
 
         contract.activate()
+        assert contract.is_active()
         assert not contract.is_complete()
 
         contract.fulfill()
+        assert not contract.is_active()
         assert contract.is_complete()
 
     def test_contract_repr(self) -> None:
@@ -349,9 +357,9 @@ class TestContract:
 
         assert before <= contract.created_at <= after
 
-    def test_metadata_storage(self) -> None:
+    def test_metadata_storage(self, drafted_contract: Contract) -> None:
         """Test that metadata dict works correctly."""
-        contract = Contract(id="test", name="Test")
+        contract = drafted_contract
         contract.metadata["custom_key"] = "custom_value"
         contract.metadata["priority"] = 10
 
@@ -1,7 +1,9 @@
 """Unit tests for contract enforcement mechanisms."""
 
-import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -15,13 +17,32 @@ from agent_contracts.core import (
     TemporalConstraints,
 )
 
+if TYPE_CHECKING:
+    from tests.core.conftest import EventCollector
+
+# Frozen, so one instance is safely shared by every test that needs it
+_RC_1K = ResourceConstraints(tokens=1000)
+
+# Margin for deadlines that must be clearly past or clearly ahead of now
+_ONE_HOUR = timedelta(hours=1)
+
+
+def _count(events: list[EnforcementEvent], event_type: str) -> int:
+    """Count the events of one type."""
+    return sum(1 for e in events if e.event_type == event_type)
+
+
+def _first(events: list[EnforcementEvent], event_type: str) -> EnforcementEvent:
+    """Return the first event of one type."""
+    return next(e for e in events if e.event_type == event_type)
+
 
 class TestEnforcementEvent:
     """Tests for EnforcementEvent."""
 
-    def test_create_event(self) -> None:
+    def test_create_event(self, contract_factory: Callable[..., Contract]) -> None:
         """Test creating an enforcement event."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         event = EnforcementEvent(
             event_type="test_event",
             contract=contract,
@@ -35,16 +56,35 @@ class TestEnforcementEvent:
         assert event.data == {"key": "value"}
         assert isinstance(event.timestamp, datetime)
 
-    def test_event_without_data(self) -> None:
+    def test_timestamp_is_taken_at_creation(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
+        """Test that the lazily built timestamp reflects creation time."""
+        before = datetime.now()
+        event = EnforcementEvent(event_type="test_event", contract=contract_factory(), message="")
+        after = datetime.now()
+
+        assert before <= event.timestamp <= after
+        assert event.timestamp is event.timestamp  # Built once, then cached
+
+    def test_event_without_data(self, contract_factory: Callable[..., Contract]) -> None:
         """Test creating event without data."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         event = EnforcementEvent(event_type="test_event", contract=contract, message="Test")
 
         assert event.data == {}
 
-    def test_repr(self) -> None:
+    def test_uses_slots(self, contract_factory: Callable[..., Contract]) -> None:
+        """Test that events carry no per-instance __dict__."""
+        event = EnforcementEvent(event_type="test_event", contract=contract_factory(), message="")
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = True  # type: ignore[attr-defined]
+
+    def test_repr(self, contract_factory: Callable[..., Contract]) -> None:
         """Test string representation."""
-        contract = Contract(id="test-123", name="Test")
+        contract = contract_factory(id="test-123")
         event = EnforcementEvent(event_type="violation", contract=contract, message="Test")
         repr_str = repr(event)
 
@@ -55,9 +95,9 @@ class TestEnforcementEvent:
 class TestContractEnforcer:
     """Tests for ContractEnforcer."""
 
-    def test_create_enforcer(self) -> None:
+    def test_create_enforcer(self, contract_factory: Callable[..., Contract]) -> None:
         """Test creating a contract enforcer."""
-        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
+        contract = contract_factory(resources=_RC_1K)
         enforcer = ContractEnforcer(contract)
 
         assert enforcer.contract == contract
@@ -65,20 +105,17 @@ class TestContractEnforcer:
         assert len(enforcer.callbacks) == 0
         assert not enforcer.is_active()
 
-    def test_create_enforcer_with_callbacks(self) -> None:
+    def test_create_enforcer_with_callbacks(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
         """Test creating enforcer with callbacks."""
-        contract = Contract(id="test", name="Test")
-        events: list[EnforcementEvent] = []
-
-        def callback(event: EnforcementEvent) -> None:
-            events.append(event)
-
-        enforcer = ContractEnforcer(contract, callbacks=[callback])
+        contract = contract_factory()
+        enforcer = ContractEnforcer(contract, callbacks=[event_collector])
         assert len(enforcer.callbacks) == 1
 
-    def test_start_enforcement(self) -> None:
+    def test_start_enforcement(self, contract_factory: Callable[..., Contract]) -> None:
         """Test starting enforcement."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         enforcer = ContractEnforcer(contract)
 
         enforcer.start()
@@ -86,32 +123,33 @@ class TestContractEnforcer:
         assert enforcer.is_active()
         assert contract.state == ContractState.ACTIVE
 
-    def test_start_enforcement_emits_event(self) -> None:
+    def test_start_enforcement_emits_event(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
         """Test that starting enforcement emits an event."""
-        contract = Contract(id="test", name="Test")
-        events: list[EnforcementEvent] = []
+        contract = contract_factory()
+        events = event_collector.events
 
-        def callback(event: EnforcementEvent) -> None:
-            events.append(event)
-
-        enforcer = ContractEnforcer(contract, callbacks=[callback])
+        enforcer = ContractEnforcer(contract, callbacks=[event_collector])
         enforcer.start()
 
         assert len(events) == 1
         assert events[0].event_type == "contract_started"
 
-    def test_start_already_active_raises_error(self) -> None:
+    def test_start_already_active_raises_error(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
         """Test that starting already active enforcement raises error."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         enforcer = ContractEnforcer(contract)
         enforcer.start()
 
         with pytest.raises(RuntimeError, match="already active"):
             enforcer.start()
 
-    def test_stop_enforcement(self) -> None:
+    def test_stop_enforcement(self, contract_factory: Callable[..., Contract]) -> None:
         """Test stopping enforcement."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         enforcer = ContractEnforcer(contract)
         enforcer.start()
 
@@ -119,15 +157,14 @@ class TestContractEnforcer:
 
         assert not enforcer.is_active()
 
-    def test_stop_emits_event(self) -> None:
+    def test_stop_emits_event(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
         """Test that stopping enforcement emits an event."""
-        contract = Contract(id="test", name="Test")
-        events: list[EnforcementEvent] = []
-
-        def callback(event: EnforcementEvent) -> None:
-            events.append(event)
+        contract = contract_factory()
+        events = event_collector.events
 
-        enforcer = ContractEnforcer(contract, callbacks=[callback])
+        enforcer = ContractEnforcer(contract, callbacks=[event_collector])
         enforcer.start()
         events.clear()  # Clear start event
 
@@ -137,16 +174,20 @@ class TestContractEnforcer:
         assert events[0].event_type == "contract_stopped"
         assert events[0].data["reason"] == "Test"
 
-    def test_stop_inactive_enforcer_is_safe(self) -> None:
+    def test_stop_inactive_enforcer_is_safe(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
         """Test that stopping inactive enforcer doesn't error."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         enforcer = ContractEnforcer(contract)
 
         enforcer.stop()  # Should not raise
 
-    def test_check_constraints_no_violations(self) -> None:
+    def test_check_constraints_no_violations(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
         """Test checking constraints with no violations."""
-        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
+        contract = contract_factory(resources=_RC_1K)
         enforcer = ContractEnforcer(contract)
         enforcer.start()
 
@@ -158,10 +199,21 @@ class TestContractEnforcer:
         assert not is_violated
         assert len(violations) == 0
 
-    def test_check_constraints_with_violations_strict(self) -> None:
-        """Test checking constraints with violations in strict mode."""
-        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
-        enforcer = ContractEnforcer(contract, strict_mode=True)
+    @pytest.mark.parametrize(
+        ("strict_mode", "end_state", "still_active"),
+        [(True, ContractState.VIOLATED, False), (False, ContractState.ACTIVE, True)],
+        ids=["strict", "lenient"],
+    )
+    def test_check_constraints_with_violations(
+        self,
+        contract_factory: Callable[..., Contract],
+        strict_mode: bool,
+        end_state: ContractState,
+        still_active: bool,
+    ) -> None:
+        """Test that violations stop enforcement only in strict mode."""
+        contract = contract_factory(resources=_RC_1K)
+        enforcer = ContractEnforcer(contract, strict_mode=strict_mode)
         enforcer.start()
 
         # Exceed token limit
@@ -171,53 +223,53 @@ class TestContractEnforcer:
 
         assert is_violated
         assert len(violations) == 1
-        # Contract should be violated and stopped
-        assert contract.state == ContractState.VIOLATED
-        assert not enforcer.is_active()
+        assert contract.state == end_state
+        assert enforcer.is_active() is still_active
 
-    def test_check_constraints_with_violations_lenient(self) -> None:
-        """Test checking constraints with violations in lenient mode."""
-        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
-        enforcer = ContractEnforcer(contract, strict_mode=False)
+    def test_check_constraints_emits_violation_event(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
+        """Test that constraint violations emit events."""
+        contract = contract_factory(resources=_RC_1K)
+        events = event_collector.events
+
+        enforcer = ContractEnforcer(contract, strict_mode=False, callbacks=[event_collector])
         enforcer.start()
+        events.clear()  # Clear start event
 
-        # Exceed token limit
         enforcer.monitor.usage.add_tokens(1500)
+        enforcer.check_constraints()
 
-        is_violated, violations = enforcer.check_constraints()
-
-        assert is_violated
-        assert len(violations) == 1
-        # Contract should still be active in lenient mode
-        assert contract.state == ContractState.ACTIVE
-        assert enforcer.is_active()
-
-    def test_check_constraints_emits_violation_event(self) -> None:
-        """Test that constraint violations emit events."""
-        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
-        events: list[EnforcementEvent] = []
+        # Should have violation event
+        assert _count(events, "constraint_violated") == 1
+        assert "violations" in _first(events, "constraint_violated").data
 
-        def callback(event: EnforcementEvent) -> None:
-            events.append(event)
+    def test_check_constraints_fast(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
+        """Test that the fast check reports violations without side effects."""
+        contract = contract_factory(resources=_RC_1K)
+        events = event_collector.events
 
-        enforcer = ContractEnforcer(contract, strict_mode=False, callbacks=[callback])
+        enforcer = ContractEnforcer(contract, strict_mode=True, callbacks=[event_collector])
         enforcer.start()
         events.clear()  # Clear start event
 
-        enforcer.monitor.usage.add_tokens(1500)
-        enforcer.check_constraints()
+        enforcer.monitor.usage.add_tokens(500)
+        assert enforcer.check_constraints_fast() is False
 
-        # Should have violation event
-        violation_events = [e for e in events if e.event_type == "constraint_violated"]
-        assert len(violation_events) == 1
-        assert "violations" in violation_events[0].data
+        enforcer.monitor.usage.add_tokens(1000)
+        assert enforcer.check_constraints_fast() is True
 
-    def test_check_temporal_no_violations(self) -> None:
+        # No events, no recorded violations, contract untouched
+        assert events == []
+        assert enforcer.monitor.violations == []
+        assert contract.state == ContractState.ACTIVE
+
+    def test_check_temporal_no_violations(self, contract_factory: Callable[..., Contract]) -> None:
         """Test checking temporal constraints with no violations."""
-        future_deadline = datetime.now() + timedelta(hours=1)
-        contract = Contract(
-            id="test",
-            name="Test",
+        future_deadline = datetime.now() + _ONE_HOUR
+        contract = contract_factory(
             temporal=TemporalConstraints(
                 deadline=future_deadline, max_duration=timedelta(minutes=10)
             ),
@@ -229,56 +281,51 @@ class TestContractEnforcer:
 
         assert not is_exceeded
 
-    def test_check_temporal_deadline_exceeded(self) -> None:
-        """Test checking temporal constraints with deadline exceeded."""
-        past_deadline = datetime.now() - timedelta(hours=1)
-        contract = Contract(
-            id="test", name="Test", temporal=TemporalConstraints(deadline=past_deadline)
-        )
-        enforcer = ContractEnforcer(contract, strict_mode=True)
+    @pytest.mark.parametrize(
+        ("strict_mode", "end_state", "still_active"),
+        [(True, ContractState.EXPIRED, False), (False, ContractState.ACTIVE, True)],
+        ids=["strict", "lenient"],
+    )
+    def test_check_temporal_deadline_exceeded(
+        self,
+        contract_factory: Callable[..., Contract],
+        strict_mode: bool,
+        end_state: ContractState,
+        still_active: bool,
+    ) -> None:
+        """Test that a passed deadline expires the contract only in strict mode."""
+        past_deadline = datetime.now() - _ONE_HOUR
+        contract = contract_factory(temporal=TemporalConstraints(deadline=past_deadline))
+        enforcer = ContractEnforcer(contract, strict_mode=strict_mode)
         enforcer.start()
 
         is_exceeded = enforcer.check_temporal_constraints()
 
         assert is_exceeded
-        assert contract.state == ContractState.EXPIRED
-        assert not enforcer.is_active()
+        assert contract.state == end_state
+        assert enforcer.is_active() is still_active
 
-    def test_check_temporal_duration_exceeded(self) -> None:
+    def test_check_temporal_duration_exceeded(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
         """Test checking temporal constraints with duration exceeded."""
-        contract = Contract(
-            id="test",
-            name="Test",
+        contract = contract_factory(
             temporal=TemporalConstraints(max_duration=timedelta(seconds=0.01)),
         )
         enforcer = ContractEnforcer(contract, strict_mode=True)
         enforcer.start()
 
-        time.sleep(0.02)  # Exceed duration
+        # Backdate the start instead of sleeping past the limit
+        enforcer.monitor.usage.start_time -= timedelta(seconds=1)
 
         is_exceeded = enforcer.check_temporal_constraints()
 
         assert is_exceeded
         assert contract.state == ContractState.EXPIRED
 
-    def test_check_temporal_lenient_mode(self) -> None:
-        """Test temporal checking in lenient mode."""
-        past_deadline = datetime.now() - timedelta(hours=1)
-        contract = Contract(
-            id="test", name="Test", temporal=TemporalConstraints(deadline=past_deadline)
-        )
-        enforcer = ContractEnforcer(contract, strict_mode=False)
-        enforcer.start()
-
-        is_exceeded = enforcer.check_temporal_constraints()
-
-        assert is_exceeded
-        # Contract should still be active in lenient mode
-        assert contract.state == ContractState.ACTIVE
-
-    def test_get_usage_summary(self) -> None:
+    def test_get_usage_summary(self, contract_factory: Callable[..., Contract]) -> None:
         """Test getting usage summary."""
-        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
+        contract = contract_factory(resources=_RC_1K)
         enforcer = ContractEnforcer(contract)
         enforcer.start()
 
@@ -294,49 +341,108 @@ class TestContractEnforcer:
         assert summary["usage"]["tokens"] == 500
         assert summary["percentages"]["tokens"] == 50.0
 
-    def test_add_callback(self) -> None:
+    def test_add_callback(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
         """Test adding callbacks dynamically."""
-        contract = Contract(id="test", name="Test")
+        contract = contract_factory()
         enforcer = ContractEnforcer(contract)
-        events: list[EnforcementEvent] = []
-
-        def callback(event: EnforcementEvent) -> None:
-            events.append(event)
+        events = event_collector.events
 
-        enforcer.add_callback(callback)
+        enforcer.add_callback(event_collector)
         enforcer.start()
 
         assert len(events) == 1  # Start event
 
-    def test_remove_callback(self) -> None:
+    def test_remove_callback(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
         """Test removing callbacks."""
-        contract = Contract(id="test", name="Test")
-        events: list[EnforcementEvent] = []
-
-        def callback(event: EnforcementEvent) -> None:
-            events.append(event)
+        contract = contract_factory()
+        events = event_collector.events
 
-        enforcer = ContractEnforcer(contract, callbacks=[callback])
-        enforcer.remove_callback(callback)
+        enforcer = ContractEnforcer(contract, callbacks=[event_collector])
+        enforcer.remove_callback(event_collector)
         enforcer.start()
 
         assert len(events) == 0  # Callback was removed
 
-    def test_callback_error_handling(self) -> None:
-        """Test that callback errors don't crash enforcement."""
-        contract = Contract(id="test", name="Test")
+    def test_typed_callbacks_only_see_their_events(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
+        """Test that callbacks filtered by event type skip other events."""
+        enforcer = ContractEnforcer(contract_factory())
+        stopped: list[EnforcementEvent] = []
+        started: list[EnforcementEvent] = []
+        for _ in range(100):
+            enforcer.add_callback(stopped.append, event_types=("contract_stopped",))
+        enforcer.add_callback(started.append, event_types=("contract_started",))
+
+        enforcer.start()
 
-        def bad_callback(event: EnforcementEvent) -> None:
-            raise ValueError("Callback error")
+        assert stopped == []
+        assert _count(started, "contract_started") == 1
+        assert enforcer.callbacks == []  # Typed callbacks are kept apart
 
-        enforcer = ContractEnforcer(contract, callbacks=[bad_callback])
+        enforcer.remove_callback(started.append)
+        assert not enforcer.has_listeners("contract_started")
+        assert enforcer.has_listeners("contract_stopped")
+        assert not enforcer.has_listeners("constraint_violated")
+
+    def test_batch_callbacks_coalesce_events(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
+        """Test that batch callbacks get one list per enforcer call."""
+        contract = contract_factory(resources=_RC_1K)
+        events: list[EnforcementEvent] = []
+        batches: list[list[EnforcementEvent]] = []
+        enforcer = ContractEnforcer(
+            contract, callbacks=[events.append], batch_callbacks=[batches.append]
+        )
+
+        enforcer.start()
+        for _ in range(5):
+            enforcer.monitor.usage.add_tokens(100)
+            enforcer.check_constraints()  # Within budget: nothing emitted
+        enforcer.monitor.usage.add_tokens(1000)
+        enforcer.check_constraints()  # Violated, stopped and terminated in one call
+
+        assert [[e.event_type for e in batch] for batch in batches] == [
+            ["contract_started"],
+            ["constraint_violated", "contract_stopped", "contract_terminated"],
+        ]
+        # Same events, in the same order, as the per-event callbacks saw
+        assert [e for batch in batches for e in batch] == events
+
+    def test_flush_without_buffered_events_is_noop(
+        self, contract_factory: Callable[..., Contract]
+    ) -> None:
+        """Test that flushing an empty buffer calls no batch callbacks."""
+        batches: list[list[EnforcementEvent]] = []
+        enforcer = ContractEnforcer(contract_factory(), batch_callbacks=[batches.append])
+
+        enforcer.flush()
+
+        assert batches == []
+
+    def test_callback_error_handling(self, contract_factory: Callable[..., Contract]) -> None:
+        """Test that callback errors don't crash enforcement."""
+        contract = contract_factory()
+        bad_callback = MagicMock(side_effect=ValueError("Callback error"))
+        good_callback = MagicMock()
+
+        enforcer = ContractEnforcer(contract, callbacks=[bad_callback, good_callback])
         enforcer.start()  # Should not raise despite callback error
 
         assert enforcer.is_active()
+        bad_callback.assert_called_once()
+        # Later callbacks still receive the event
+        good_callback.assert_called_once()
+        assert good_callback.call_args.args[0].event_type == "contract_started"
 
-    def test_repr(self) -> None:
+    def test_repr(self, contract_factory: Callable[..., Contract]) -> None:
         """Test string representation."""
-        contract = Contract(id="test-123", name="Test")
+        contract = contract_factory(id="test-123")
         enforcer = ContractEnforcer(contract, strict_mode=True)
 
         repr_str = repr(enforcer)
@@ -352,7 +458,7 @@ class TestContractEnforcer:
 class TestEnforcementIntegration:
     """Integration tests for enforcement system."""
 
-    def test_full_enforcement_workflow(self) -> None:
+    def test_full_enforcement_workflow(self, event_collector: "EventCollector") -> None:
         """Test complete enforcement workflow."""
         # Create contract with constraints
         contract = Contract(
@@ -363,13 +469,10 @@ class TestEnforcementIntegration:
         )
 
         # Track events
-        events: list[EnforcementEvent] = []
-
-        def event_logger(event: EnforcementEvent) -> None:
-            events.append(event)
+        events = event_collector.events
 
         # Create enforcer
-        enforcer = ContractEnforcer(contract, strict_mode=True, callbacks=[event_logger])
+        enforcer = ContractEnforcer(contract, strict_mode=True, callbacks=[event_collector])
 
         # Start enforcement
         enforcer.start()
@@ -391,27 +494,22 @@ class TestEnforcementIntegration:
 
         # Stop enforcement
         enforcer.stop(reason="Task complete")
-        stop_events = [e for e in events if e.event_type == "contract_stopped"]
-        assert len(stop_events) == 1
+        assert _count(events, "contract_stopped") == 1
 
-    def test_enforcement_with_violation(self) -> None:
+    def test_enforcement_with_violation(
+        self, contract_factory: Callable[..., Contract], event_collector: "EventCollector"
+    ) -> None:
         """Test enforcement handling violations."""
-        contract = Contract(
-            id="test", name="Test", resources=ResourceConstraints(tokens=1000, api_calls=5)
-        )
-        events: list[EnforcementEvent] = []
-
-        def event_logger(event: EnforcementEvent) -> None:
-            events.append(event)
+        contract = contract_factory(resources=ResourceConstraints(tokens=1000, api_calls=5))
+        events = event_collector.events
 
-        enforcer = ContractEnforcer(contract, strict_mode=True, callbacks=[event_logger])
+        enforcer = ContractEnforcer(contract, strict_mode=True, callbacks=[event_collector])
         enforcer.start()
         events.clear()
 
         # Violate multiple constraints
         enforcer.monitor.usage.add_tokens(2000)
-        for _ in range(10):
-            enforcer.monitor.usage.add_api_call()
+        enforcer.monitor.usage.add_api_calls(10)
 
         enforcer.check_constraints()
 
@@ -420,19 +518,15 @@ class TestEnforcementIntegration:
         assert not enforcer.is_active()
 
         # Check events
-        violation_events = [e for e in events if e.event_type == "constraint_violated"]
-        termination_events = [e for e in events if e.event_type == "contract_terminated"]
-
-        assert len(violation_events) == 1
-        assert len(termination_events) == 1
-        assert len(violation_events[0].data["violations"]) == 2  # tokens and api_calls
+        assert _count(events, "constraint_violated") == 1
+        assert _count(events, "contract_terminated") == 1
+        violation = _first(events, "constraint_violated")
+        assert len(violation.data["violations"]) == 2  # tokens and api_calls
 
-    def test_soft_deadline_workflow(self) -> None:
+    def test_soft_deadline_workflow(self, contract_factory: Callable[..., Contract]) -> None:
         """Test workflow with soft deadline."""
-        future_deadline = datetime.now() + timedelta(hours=1)
-        contract = Contract(
-            id="test",
-            name="Test",
+        future_deadline = datetime.now() + _ONE_HOUR
+        contract = contract_factory(
             temporal=TemporalConstraints(deadline=future_deadline, deadline_type=DeadlineType.SOFT),
         )
 
@@ -444,26 +538,19 @@ class TestEnforcementIntegration:
         assert not is_exceeded
         assert enforcer.is_active()
 
-    def test_multiple_callbacks(self) -> None:
+    def test_multiple_callbacks(self, contract_factory: Callable[..., Contract]) -> None:
         """Test multiple callbacks receiving events."""
-        contract = Contract(id="test", name="Test")
-
-        events1: list[EnforcementEvent] = []
-        events2: list[EnforcementEvent] = []
-
-        def callback1(event: EnforcementEvent) -> None:
-            events1.append(event)
-
-        def callback2(event: EnforcementEvent) -> None:
-            events2.append(event)
+        contract = contract_factory()
+        callback1 = MagicMock()
+        callback2 = MagicMock()
 
         enforcer = ContractEnforcer(contract, callbacks=[callback1, callback2])
         enforcer.start()
 
-        # Both callbacks should receive the event
-        assert len(events1) == 1
-        assert len(events2) == 1
-        assert events1[0].event_type == events2[0].event_type
+        # Both callbacks should receive the same event
+        callback1.assert_called_once()
+        callback2.assert_called_once_with(callback1.call_args.args[0])
+        assert callback1.call_args.args[0].event_type == "contract_started"
 
     def test_realistic_budget_scenario(self) -> None:
         """Test realistic budget management scenario."""
@@ -482,20 +569,20 @@ class TestEnforcementIntegration:
         enforcer = ContractEnforcer(contract, strict_mode=False)
         enforcer.start()
 
-        # Simulate incremental work
-        for i in range(20):
-            enforcer.monitor.usage.add_api_call(cost=0.10, tokens=2000)
-            is_violated, _ = enforcer.check_constraints()
+        # Twenty $0.10 / 2000-token calls in one update: well within budget
+        enforcer.monitor.update_resources({"api_calls": 20, "tokens": 40000, "cost_usd": 2.0})
+        is_violated, _ = enforcer.check_constraints()
+        assert not is_violated
 
-            if i < 10:
-                # First half should be fine
-                assert not is_violated
-            else:
-                # After 10 calls, cost exceeds budget
-                if is_violated:
-                    break
+        # One large call pushes tokens past the limit
+        enforcer.monitor.usage.add_api_call(cost=0.10, tokens=20000)
+        is_violated, violations = enforcer.check_constraints()
+        assert is_violated
+        assert [v.resource for v in violations] == ["tokens"]
 
-        # Check final state
+        # Lenient mode keeps the contract running with the overrun recorded
         summary = enforcer.get_usage_summary()
-        assert summary["usage"]["api_calls"] <= 100
-        assert summary["usage"]["cost_usd"] >= 2.0  # At least some cost accumulated
+        assert enforcer.is_active()
+        assert summary["usage"]["api_calls"] == 21
+        assert summary["usage"]["tokens"] == 60000
+        assert summary["violations"] == 1
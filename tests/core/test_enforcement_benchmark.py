@@ -0,0 +1,55 @@
+"""Micro-benchmarks for the enforcement hot path.
+
+Skipped unless pytest-benchmark is installed.
+"""
+
+from typing import Any
+
+import pytest
+
+from agent_contracts.core import Contract, ContractEnforcer, ResourceConstraints
+
+pytest.importorskip("pytest_benchmark")
+
+# From one constrained resource up to every resource the monitor checks
+_CONSTRAINT_SETS = {
+    "tokens": ResourceConstraints(tokens=1000),
+    "budget": ResourceConstraints(tokens=1000, api_calls=10, cost_usd=1.0),
+    "all": ResourceConstraints(
+        tokens=1000,
+        api_calls=10,
+        web_searches=10,
+        tool_invocations=10,
+        memory_mb=1024,
+        compute_seconds=60,
+        cost_usd=1.0,
+    ),
+}
+
+
+def _enforcer(resources: ResourceConstraints) -> ContractEnforcer:
+    """Start an enforcer with some usage recorded, still within budget."""
+    enforcer = ContractEnforcer(Contract(id="bench", name="Bench", resources=resources))
+    enforcer.start()
+    enforcer.monitor.usage.add_api_call(cost=0.1, tokens=500)
+    return enforcer
+
+
+class TestCheckConstraintsBenchmark:
+    """Benchmarks for ContractEnforcer constraint checks."""
+
+    @pytest.mark.parametrize(
+        "resources", list(_CONSTRAINT_SETS.values()), ids=list(_CONSTRAINT_SETS)
+    )
+    def test_check_constraints(self, benchmark: Any, resources: ResourceConstraints) -> None:
+        """Benchmark the full constraint check on the allow path."""
+        is_violated, _ = benchmark(_enforcer(resources).check_constraints)
+
+        assert not is_violated
+
+    @pytest.mark.parametrize(
+        "resources", list(_CONSTRAINT_SETS.values()), ids=list(_CONSTRAINT_SETS)
+    )
+    def test_check_constraints_fast(self, benchmark: Any, resources: ResourceConstraints) -> None:
+        """Benchmark the side-effect-free constraint check."""
+        assert benchmark(_enforcer(resources).check_constraints_fast) is False
@@ -77,6 +77,28 @@ class TestResourceUsage:
         with pytest.raises(ValueError, match="Cost must be non-negative"):
             usage.add_api_call(cost=-0.01)
 
+    def test_add_api_calls_matches_repeated_add_api_call(self) -> None:
+        """Test that bulk recording equals recording each call."""
+        bulk = ResourceUsage()
+        bulk.add_api_calls(10, cost=0.25, tokens=150)
+
+        looped = ResourceUsage()
+        for _ in range(10):
+            looped.add_api_call(cost=0.25, tokens=150)
+
+        assert (bulk.api_calls, bulk.cost_usd, bulk.tokens) == (10, 2.5, 1500)
+        assert (bulk.api_calls, bulk.cost_usd, bulk.tokens) == (
+            looped.api_calls,
+            looped.cost_usd,
+            looped.tokens,
+        )
+
+    def test_add_api_calls_negative_count_raises_error(self) -> None:
+        """Test that a negative call count raises error."""
+        usage = ResourceUsage()
+        with pytest.raises(ValueError, match="Call count must be non-negative"):
+            usage.add_api_calls(-1)
+
     def test_add_web_search(self) -> None:
         """Test recording web searches."""
         usage = ResourceUsage()
@@ -369,6 +391,45 @@ class TestResourceMonitor:
         # Zero constraints are excluded to avoid division errors
         assert "tokens" not in percentages
 
+    def test_snapshot(self) -> None:
+        """Test capturing remaining budgets in one snapshot."""
+        monitor = ResourceMonitor(ResourceConstraints(tokens=1000, cost_usd=1.0))
+        monitor.usage.add_tokens(300)
+        monitor.usage.add_api_call(cost=0.25)
+
+        snapshot = monitor.snapshot()
+
+        assert snapshot.remaining_tokens == monitor.get_remaining_tokens() == 700
+        assert snapshot.remaining_cost == monitor.get_remaining_cost() == 0.75
+        assert snapshot.remaining_api_calls == float("inf")
+        with pytest.raises(AttributeError):
+            snapshot.remaining_tokens = 0  # type: ignore
+
+    def test_update_resources(self) -> None:
+        """Test applying several usage deltas in one update."""
+        monitor = ResourceMonitor(ResourceConstraints(tokens=1000))
+
+        monitor.update_resources({"tokens": 100, "api_calls": 1, "cost_usd": 0.01})
+        monitor.update_resources({"reasoning_tokens": 30, "text_tokens": 20, "memory_mb": 64})
+
+        assert monitor.usage.tokens == 150
+        assert monitor.usage.reasoning_tokens == 30
+        assert monitor.usage.text_tokens == 20
+        assert monitor.usage.api_calls == 1
+        assert monitor.usage.cost_usd == pytest.approx(0.01)
+        assert monitor.usage.memory_mb == 64
+
+    def test_update_resources_invalid(self) -> None:
+        """Test invalid deltas are rejected without partial updates."""
+        monitor = ResourceMonitor(ResourceConstraints(tokens=1000))
+
+        with pytest.raises(ValueError, match="Unknown resource"):
+            monitor.update_resources({"tokens": 10, "bogus": 1})
+        with pytest.raises(ValueError, match="non-negative"):
+            monitor.update_resources({"tokens": 10, "cost_usd": -1})
+
+        assert monitor.usage.tokens == 0
+
     def test_reset(self) -> None:
         """Test resetting monitor state."""
         constraints = ResourceConstraints(tokens=1000)
@@ -141,6 +141,18 @@ class TestTokenCounter:
         assert pricing is not None
         assert pricing["input"] > 0
 
+    def test_get_model_pricing_prefers_longest_prefix(self) -> None:
+        """Test that versioned names match their most specific model."""
+        assert TokenCounter.get_model_pricing(
+            "gpt-4o-2024-08-06"
+        ) == TokenCounter.get_model_pricing("gpt-4o")
+        assert TokenCounter.get_model_pricing(
+            "gpt-4o-mini-2024-07-18"
+        ) == TokenCounter.get_model_pricing("gpt-4o-mini")
+        assert TokenCounter.get_model_pricing("gpt-4o-mini-2024-07-18") != (
+            TokenCounter.get_model_pricing("gpt-4")
+        )
+
     def test_calculate_cost_gpt4(self) -> None:
         """Test cost calculation for GPT-4."""
         token_count = TokenCount(input_tokens=1000, output_tokens=500)
@@ -1,5 +1,6 @@
 """Tests for ContractAgent wrapper (Phase 2B)."""
 
+import asyncio
 import time
 from datetime import timedelta
 
@@ -120,6 +121,68 @@ class TestContractAgent:
         assert len(result.violations) == 1
         assert "Agent failed!" in result.violations[0]
 
+    def test_aexecute_async_agent(self) -> None:
+        """Test executing a coroutine agent via aexecute()."""
+        contract = Contract(
+            id="test-aexec",
+            name="test-aexec",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        async def async_agent(x: str) -> str:
+            await asyncio.sleep(0)
+            return f"Result: {x}"
+
+        agent = ContractAgent(contract=contract, agent=async_agent)
+        result = asyncio.run(agent.aexecute("test input"))
+
+        assert result.success is True
+        assert result.output == "Result: test input"
+        assert contract.state == ContractState.ACTIVE
+
+    def test_aexecute_with_exception(self) -> None:
+        """Test that aexecute() handles agent exceptions like execute()."""
+        contract = Contract(
+            id="test-aexec-fail",
+            name="test-aexec-fail",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        async def failing_agent(x: str) -> str:
+            raise ValueError("Agent failed!")
+
+        agent = ContractAgent(contract=contract, agent=failing_agent)
+        result = asyncio.run(agent.aexecute("input"))
+
+        assert result.success is False
+        assert contract.state == ContractState.VIOLATED
+        assert "Agent failed!" in result.violations[0]
+
+    def test_concurrent_aexecute_keeps_runs_separate(self) -> None:
+        """Test that gathered executions on one agent get their own logs."""
+        contract = Contract(id="test-gather", name="test-gather")
+
+        async def async_agent(x: str) -> str:
+            await asyncio.sleep(0.01)
+            if x == "b":
+                raise ValueError("boom-b")
+            return f"Result: {x}"
+
+        agent = ContractAgent(contract=contract, agent=async_agent)
+
+        async def run_both() -> list:
+            return await asyncio.gather(agent.aexecute("a"), agent.aexecute("b"))
+
+        result_a, result_b = asyncio.run(run_both())
+
+        assert result_a.success is True
+        assert result_a.output == "Result: a"
+        assert result_b.success is False
+        assert result_a.execution_log is not result_b.execution_log
+        assert not any("boom-b" in e["message"] for e in result_a.execution_log.events)
+        assert any("boom-b" in e["message"] for e in result_b.execution_log.events)
+        assert agent._active_runs == 0
+
     def test_execution_log_created(self) -> None:
         """Test that execution log is created."""
         contract = Contract(
@@ -139,6 +139,36 @@ class TestContractedAdkAgent:
             assert result["usage_metadata"]["total_tokens"] == 100
             assert result["usage_metadata"]["prompt_tokens"] == 50
             assert result["usage_metadata"]["candidates_tokens"] == 50
+            assert result["events"] == []
+
+    def test_run_collect_events(self) -> None:
+        """Test that events are only returned when collect_events=True."""
+        from google.adk.agents import LlmAgent
+        from google.genai.types import Content, Part
+
+        from agent_contracts.integrations.google_adk import ContractedAdkAgent
+
+        contract = Contract(
+            id="test-events",
+            name="test-events",
+            resources=ResourceConstraints(tokens=10000),
+        )
+        agent = LlmAgent(name="test_agent", model="gemini-2.0-flash", instruction="Help.")
+        contracted = ContractedAdkAgent(contract=contract, agent=agent)
+
+        mock_event = Mock()
+        mock_event.usageMetadata = None
+        mock_event.content = Content(parts=[Part(text="Hi")])
+
+        with patch.object(contracted.runner, "run", return_value=iter([mock_event])):
+            result = contracted.run(
+                user_id="test_user",
+                session_id="test_session",
+                message="Hello",
+                collect_events=True,
+            )
+
+        assert result["events"] == [mock_event]
 
     def test_budget_enforcement(self) -> None:
         """Test that budget limits are enforced."""
@@ -236,6 +266,65 @@ class TestContractedAdkAgent:
             assert result["response"] == "Debug response"
             assert result["total_tokens"] == 50
 
+    def test_budget_info_skipped_when_unchanged(self) -> None:
+        """Test that budget info is only re-sent when the budget moves."""
+        from google.adk.agents import LlmAgent
+
+        from agent_contracts.integrations.google_adk import ContractedAdkAgent
+
+        contract = Contract(
+            id="test-budget-info",
+            name="test-budget-info",
+            resources=ResourceConstraints(tokens=10000),
+        )
+        agent = LlmAgent(name="test_agent", model="gemini-2.0-flash", instruction="Help.")
+        contracted = ContractedAdkAgent(contract=contract, agent=agent, runner=Mock())
+
+        sent: list[bool] = []
+
+        def fake_run_agent(inputs: dict) -> dict:
+            sent.append("budget_info" in inputs)
+            return {"response": "ok"}
+
+        with patch.object(contracted, "_run_agent", side_effect=fake_run_agent):
+            contracted._monitored_execution({"message": "first"})
+            contracted.resource_monitor.usage.add_tokens(500)  # 5% of budget
+            contracted._monitored_execution({"message": "second"})
+            contracted.resource_monitor.usage.add_tokens(2000)  # >10% change
+            contracted._monitored_execution({"message": "third"})
+
+        assert sent == [True, False, True]
+
+    def test_budget_info_resent_after_failed_turn(self) -> None:
+        """Test that a failed turn doesn't count as having delivered the budget."""
+        from google.adk.agents import LlmAgent
+
+        from agent_contracts.integrations.google_adk import ContractedAdkAgent
+
+        contract = Contract(
+            id="test-budget-info-retry",
+            name="test-budget-info-retry",
+            resources=ResourceConstraints(tokens=10000),
+        )
+        agent = LlmAgent(name="test_agent", model="gemini-2.0-flash", instruction="Help.")
+        contracted = ContractedAdkAgent(contract=contract, agent=agent, runner=Mock())
+
+        sent: list[bool] = []
+
+        def fake_run_agent(inputs: dict) -> dict:
+            sent.append("budget_info" in inputs)
+            if inputs["message"] == "fails":
+                raise RuntimeError("turn failed")
+            return {"response": "ok"}
+
+        with patch.object(contracted, "_run_agent", side_effect=fake_run_agent):
+            with pytest.raises(RuntimeError, match="turn failed"):
+                contracted._monitored_execution({"message": "fails"})
+            contracted._monitored_execution({"message": "retry"})
+            contracted._monitored_execution({"message": "steady"})
+
+        assert sent == [True, True, False]
+
 
 class TestConvenienceFunctions:
     """Test convenience functions for creating contracted agents."""
@@ -266,6 +355,25 @@ class TestConvenienceFunctions:
         assert contracted.contract.resources.api_calls == 25
         assert contracted.contract.temporal.max_duration == 600
 
+    def test_create_contracted_adk_agent_stable_default_id(self) -> None:
+        """Test that the auto-generated contract ID depends only on agent config."""
+        from google.adk.agents import LlmAgent
+
+        from agent_contracts.integrations.google_adk import create_contracted_adk_agent
+
+        def make_agent() -> LlmAgent:
+            return LlmAgent(
+                name="test_agent",
+                model="gemini-2.0-flash",
+                instruction="You are a helpful assistant.",
+            )
+
+        first = create_contracted_adk_agent(agent=make_agent(), runner=Mock())
+        second = create_contracted_adk_agent(agent=make_agent(), runner=Mock())
+
+        assert first.contract.id.startswith("adk-agent-")
+        assert first.contract.id == second.contract.id
+
 
 class TestMultiAgentSupport:
     """Test multi-agent system support."""
@@ -309,3 +417,47 @@ class TestMultiAgentSupport:
         assert contracted is not None
         assert contracted.agent == coordinator
         assert len(contracted.agent.sub_agents) == 2
+
+    def test_multi_agent_tracks_per_agent_tokens(self) -> None:
+        """Test that token usage is attributed to each sub-agent."""
+        from google.adk.agents import LlmAgent
+        from google.genai.types import Content, GenerateContentResponseUsageMetadata, Part
+
+        from agent_contracts.integrations.google_adk import ContractedAdkMultiAgent
+
+        coordinator = LlmAgent(
+            name="coordinator",
+            model="gemini-2.0-flash",
+            instruction="You coordinate.",
+        )
+        contract = Contract(
+            id="multi-agent-usage",
+            name="multi-agent-usage",
+            resources=ResourceConstraints(tokens=100000),
+        )
+        contracted = ContractedAdkMultiAgent(contract=contract, agent=coordinator)
+
+        def make_event(author: str, tokens: int) -> Mock:
+            event = Mock()
+            event.author = author
+            event.usageMetadata = GenerateContentResponseUsageMetadata(
+                total_token_count=tokens,
+                prompt_token_count=tokens // 2,
+                candidates_token_count=tokens // 2,
+                thoughts_token_count=0,
+                cached_content_token_count=0,
+            )
+            event.content = Content(parts=[Part(text=f"{author} done")])
+            return event
+
+        events = [
+            make_event("coordinator", 100),
+            make_event("researcher", 300),
+            make_event("researcher", 200),
+        ]
+
+        with patch.object(contracted.runner, "run", return_value=iter(events)):
+            result = contracted.run(user_id="u", session_id="s", message="Go")
+
+        assert result["per_agent_tokens"] == {"coordinator": 100, "researcher": 500}
+        assert contracted.get_per_agent_usage() == {"coordinator": 100, "researcher": 500}
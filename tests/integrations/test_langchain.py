@@ -3,7 +3,9 @@
 Note: These tests mock LangChain since it's an optional dependency.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -175,6 +177,372 @@ class TestContractedChainMocked:
 
         assert output == {"text": "Result"}
 
+    def test_contracted_chain_aexecute(self) -> None:
+        """Test executing a ContractedChain asynchronously via ainvoke."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-aexec",
+            name="test-aexec",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.ainvoke = AsyncMock(return_value={"text": "Async result"})
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+
+        async def run_all() -> list:
+            return await asyncio.gather(
+                contracted.aexecute({"input": "a"}), contracted.aexecute({"input": "b"})
+            )
+
+        results = asyncio.run(run_all())
+
+        assert all(r.success for r in results)
+        assert results[0].output == {"text": "Async result"}
+        assert mock_chain.ainvoke.await_count == 2
+        mock_chain.invoke.assert_not_called()
+
+        # The async path uses the async callback handler
+        config = mock_chain.ainvoke.call_args.kwargs["config"]
+        assert config["callbacks"] == [contracted._async_callback_handler]
+
+    def test_contracted_chain_reused_across_event_loops(self) -> None:
+        """Test that the concurrency limit works across separate asyncio.run calls."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-loops",
+            name="test-loops",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        async def slow_ainvoke(inputs: dict, config: dict) -> dict:
+            await asyncio.sleep(0)  # Yield so gathered calls contend for the limit
+            return {"text": "Async result"}
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.ainvoke = AsyncMock(side_effect=slow_ainvoke)
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain, max_concurrency=1)
+
+        async def run_all() -> list:
+            return await asyncio.gather(*(contracted.aexecute({"input": str(i)}) for i in range(3)))
+
+        # Each asyncio.run uses a new event loop
+        for _ in range(2):
+            results = asyncio.run(run_all())
+            assert all(r.success for r in results)
+
+        assert mock_chain.ainvoke.await_count == 6
+
+    def test_contracted_chain_legacy_call(self) -> None:
+        """Test chains without invoke() fall back to the legacy __call__ API."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-legacy",
+            name="test-legacy",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        legacy_chain = Mock(spec=["__call__", "callbacks"])
+        legacy_chain.callbacks = []
+        legacy_chain.return_value = {"text": "Legacy result"}
+
+        contracted = ContractedChain(contract=contract, chain=legacy_chain)
+        result = contracted.execute({"input": "test"})
+
+        assert result.output == {"text": "Legacy result"}
+        legacy_chain.assert_called_once()
+        # __call__ takes no config, so the callback is attached to the chain
+        assert legacy_chain.callbacks == [contracted._callback_handler]
+
+    def test_contracted_chain_binds_config_to_runnable(self) -> None:
+        """Test LCEL runnables get the callback config baked in once."""
+        pytest.importorskip("langchain")
+        pytest.importorskip("langchain_core")
+
+        from langchain_core.runnables import RunnableLambda
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-binding",
+            name="test-binding",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        chain = RunnableLambda(lambda inputs: {"text": inputs["input"]})
+        contracted = ContractedChain(contract=contract, chain=chain)
+
+        assert contracted.chain is chain
+        assert contracted._run_config == {}
+        assert contracted._runnable.config["callbacks"] == [contracted._callback_handler]
+
+        result = contracted.execute({"input": "hello"})
+        assert result.output == {"text": "hello"}
+
+    def test_contracted_chain_reuses_run_config(self) -> None:
+        """Test that every invoke receives the same prebuilt config."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-config",
+            name="test-config",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.invoke.return_value = {"text": "ok"}
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+        contracted.execute({"input": "a"})
+        contracted.execute({"input": "b"})
+
+        configs = [c.kwargs["config"] for c in mock_chain.invoke.call_args_list]
+        assert configs[0] is configs[1] is contracted._run_config
+        assert configs[0]["tags"] == ["contract:test-config"]
+
+    def test_contracted_chain_batch(self) -> None:
+        """Test batch() delegates to the chain's batch and tracks usage per result."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-batch",
+            name="test-batch",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        outputs = []
+        for text in ("a", "b"):
+            output = Mock()
+            output.usage_metadata = {"total_tokens": 100}
+            output.text = text
+            outputs.append(output)
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.batch.return_value = outputs
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain, max_concurrency=4)
+        results = contracted.batch([{"input": "a"}, {"input": "b"}])
+
+        assert results == outputs
+        assert mock_chain.invoke.call_count == 0
+        assert mock_chain.batch.call_args.kwargs["config"]["max_concurrency"] == 4
+        assert contracted.resource_monitor.usage.tokens == 200
+
+    def test_contracted_chain_batch_violation(self) -> None:
+        """Test batch() raises when the batch exceeds the contract."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-batch-violation",
+            name="test-batch-violation",
+            resources=ResourceConstraints(tokens=150),
+        )
+
+        output = Mock()
+        output.usage_metadata = {"total_tokens": 100}
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.batch.return_value = [output, output]
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain, strict_mode=False)
+
+        with pytest.raises(RuntimeError, match="batch execution failed"):
+            contracted.batch([{"input": "a"}, {"input": "b"}])
+
+    def test_callback_prices_by_model(self) -> None:
+        """Test the token callback prices prompt and completion tokens per model."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-pricing",
+            name="test-pricing",
+            resources=ResourceConstraints(tokens=10000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+
+        response = Mock()
+        response.llm_output = {
+            "model_name": "gpt-4o-2024-08-06",
+            "token_usage": {
+                "prompt_tokens": 1000,
+                "completion_tokens": 500,
+                "total_tokens": 1500,
+            },
+        }
+        contracted._callback_handler.on_llm_end(response)
+
+        usage = contracted.resource_monitor.usage
+        assert usage.tokens == 1500
+        assert usage.cost_usd == pytest.approx(1000 * 2.5e-6 + 500 * 10.0e-6)
+
+    def test_callback_tracks_streamed_usage(self) -> None:
+        """Test usage reported on the final streamed chunk is tracked."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-streaming",
+            name="test-streaming",
+            resources=ResourceConstraints(tokens=10000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+        callback = contracted._callback_handler
+
+        final_chunk = Mock()
+        final_chunk.usage_metadata = {"input_tokens": 20, "output_tokens": 10, "total_tokens": 30}
+        callback.on_llm_new_token("Hel", chunk=Mock(usage_metadata=None, message=None), run_id=1)
+        callback.on_llm_new_token("lo", chunk=final_chunk, run_id=1)
+
+        response = Mock()
+        response.llm_output = None
+        response.generations = []
+        callback.on_llm_end(response, run_id=1)
+
+        assert contracted.resource_monitor.usage.tokens == 30
+        assert contracted.resource_monitor.usage.api_calls == 1
+        assert callback._stream_usage == {}
+
+    def test_callback_skips_message_usage_when_not_streamed(self) -> None:
+        """Test non-streamed message usage is left to the result tracking."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-no-double-count",
+            name="test-no-double-count",
+            resources=ResourceConstraints(tokens=10000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+
+        # Gemini-style result: no llm_output, usage only on the message
+        usage = {"input_tokens": 60, "output_tokens": 40, "total_tokens": 100}
+        message = Mock(usage_metadata=usage, response_metadata={})
+        response = Mock()
+        response.llm_output = None
+        response.generations = [[Mock(message=message, generation_info=None)]]
+
+        contracted._callback_handler.on_llm_end(response, run_id=1)
+        contracted._track_result_usage(message)
+
+        assert contracted.resource_monitor.usage.tokens == 100
+        assert contracted.resource_monitor.usage.api_calls == 1
+
+    def test_async_callback_shares_accounting(self) -> None:
+        """Test the async callback records usage through the sync tracker."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-async-callback",
+            name="test-async-callback",
+            resources=ResourceConstraints(tokens=10000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+
+        response = Mock()
+        response.llm_output = {"token_usage": {"total_tokens": 40}}
+
+        async def finish_all() -> None:
+            await asyncio.gather(
+                *(contracted._async_callback_handler.on_llm_end(response) for _ in range(3))
+            )
+
+        asyncio.run(finish_all())
+
+        assert contracted.resource_monitor.usage.tokens == 120
+        assert contracted.resource_monitor.usage.api_calls == 3
+
+    def test_contracted_chain_exact_match_cache(self) -> None:
+        """Test that identical inputs are served from the cache."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-cache",
+            name="test-cache",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.invoke.return_value = {"text": "Cached result"}
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain, cache={})
+
+        first = contracted.execute({"input": "same"})
+        second = contracted.execute({"input": "same"})
+        third = contracted.execute({"input": "different"})
+
+        assert first.output == second.output == {"text": "Cached result"}
+        assert third.success is True
+        assert mock_chain.invoke.call_count == 2
+        assert contracted.resource_monitor.usage.metadata["cache_hits"] == 1
+
+    def test_contracted_chain_cache_isolates_callers(self) -> None:
+        """Test cached outputs are copies and any JSON input can be keyed."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(id="test-cache-copy", name="test-cache-copy")
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.invoke.side_effect = lambda inputs, config=None: {"text": "result"}
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain, cache={})
+
+        first = contracted.execute({"input": "same"})
+        first.output["text"] = "mutated"
+        second = contracted.execute({"input": "same"})
+        second.output["text"] = "mutated again"
+        third = contracted.execute({"input": "same"})
+
+        assert third.output == {"text": "result"}
+        assert mock_chain.invoke.call_count == 1
+
+        # Integers wider than 64 bits fall back to stdlib JSON for the key
+        assert contracted.execute({"input": 2**70}).success is True
+
     def test_contracted_chain_with_strict_mode(self) -> None:
         """Test ContractedChain with strict mode."""
         pytest.importorskip("langchain")
@@ -236,6 +604,23 @@ class TestContractedLLMMocked:
         assert contracted.contract == contract
         assert contracted.llm == mock_llm
 
+    def test_contracted_llm_is_single_layer(self) -> None:
+        """Test ContractedLLM is itself the contracted chain (one monitor)."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain, ContractedLLM
+
+        contract = Contract(
+            id="test-llm-layer",
+            name="test-llm-layer",
+            resources=ResourceConstraints(tokens=500),
+        )
+
+        contracted = ContractedLLM(contract=contract, llm=Mock())
+
+        assert isinstance(contracted, ContractedChain)
+        assert contracted.contracted_chain is contracted
+
     def test_contracted_llm_callable(self) -> None:
         """Test ContractedLLM is callable."""
         pytest.importorskip("langchain")
@@ -262,6 +647,75 @@ class TestContractedLLMMocked:
 
         assert response == "LLM Response"
 
+    def test_contracted_llm_semantic_cache(self) -> None:
+        """Test near-duplicate prompts are served from the semantic cache."""
+        pytest.importorskip("langchain")
+        pytest.importorskip("numpy")
+
+        from agent_contracts.integrations.langchain import (
+            ContractedLLM,
+            EmbeddingSemanticCache,
+        )
+
+        contract = Contract(
+            id="test-llm-semantic",
+            name="test-llm-semantic",
+            resources=ResourceConstraints(tokens=500),
+        )
+
+        # Whitespace-insensitive "embedding" so paraphrases map to the same vector
+        embeddings = Mock()
+        embeddings.embed_query.side_effect = lambda text: (
+            [1.0, 0.0] if " ".join(text.split()) == "What is 2+2?" else [0.0, 1.0]
+        )
+
+        mock_llm = Mock()
+        mock_llm.temperature = 0
+        cache = EmbeddingSemanticCache(embeddings)
+        contracted = ContractedLLM(contract=contract, llm=mock_llm, semantic_cache=cache)
+
+        contracted._run_chain = Mock(return_value={"text": "4"})
+
+        assert contracted("What is 2+2?") == "4"
+        result = contracted.execute("What  is 2+2? ")
+        assert result.output == {"text": "4"}
+        assert result.execution_log is not None
+        assert contracted._run_chain.call_count == 1
+        assert contracted.resource_monitor.usage.metadata["semantic_cache_hits"] == 1
+        assert len(cache) == 1
+
+        contracted("Something else")
+        assert contracted._run_chain.call_count == 2
+
+        # Hits are still subject to the contract's constraints
+        contracted.resource_monitor.usage.add_tokens(1000)
+        with pytest.raises(RuntimeError, match="LLM call failed"):
+            contracted("What is 2+2?")
+
+    def test_contracted_llm_semantic_cache_skipped_for_sampling(self) -> None:
+        """Test the semantic cache is disabled for non-deterministic LLMs."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedLLM
+
+        contract = Contract(
+            id="test-llm-semantic-temp",
+            name="test-llm-semantic-temp",
+            resources=ResourceConstraints(tokens=500),
+        )
+
+        mock_llm = Mock()
+        mock_llm.temperature = 0.7
+        contracted = ContractedLLM(contract=contract, llm=mock_llm, semantic_cache=Mock())
+
+        assert contracted.semantic_cache is None
+
+        # An unset temperature means the provider default, usually > 0
+        mock_llm.temperature = None
+        contracted = ContractedLLM(contract=contract, llm=mock_llm, semantic_cache=Mock())
+
+        assert contracted.semantic_cache is None
+
     def test_contracted_llm_execute(self) -> None:
         """Test ContractedLLM execute() method."""
         pytest.importorskip("langchain")
@@ -361,6 +815,50 @@ class TestCreateContractedChain:
         # ID should be auto-generated
         assert contracted.contract.id.startswith("chain-")
 
+    def test_create_contracted_chain_stable_auto_id(self) -> None:
+        """Test equal chain configurations get the same auto-generated ID."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import create_contracted_chain
+
+        def make_chain(template: str) -> Mock:
+            mock_chain = Mock()
+            mock_chain.callbacks = []
+            mock_chain.to_json.return_value = {
+                "lc": 1,
+                "type": "constructor",
+                "id": ["langchain", "prompts", "prompt", "PromptTemplate"],
+                "kwargs": {"template": template},
+            }
+            return mock_chain
+
+        first = create_contracted_chain(chain=make_chain("Summarize {text}"))
+        second = create_contracted_chain(chain=make_chain("Summarize {text}"))
+
+        assert first.contract.id == second.contract.id
+        assert first.contract.id.startswith("chain-")
+
+    def test_create_contracted_chain_auto_id_covers_config(self) -> None:
+        """Test chains differing only in prompt text get different IDs."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import _stable_chain_id
+
+        graph = {"nodes": [{"id": 0, "data": "PromptTemplate"}], "edges": []}
+        chains = []
+        for template in ("Summarize {text}", "Translate {text}"):
+            mock_chain = Mock()
+            mock_chain.to_json.return_value = {"type": "constructor", "kwargs": {"t": template}}
+            mock_chain.get_graph.return_value.to_json.return_value = graph
+            chains.append(mock_chain)
+
+        assert _stable_chain_id(chains[0]) != _stable_chain_id(chains[1])
+
+        # Non-serializable chains fall back to the graph
+        for mock_chain in chains:
+            mock_chain.to_json.return_value = {"type": "not_implemented"}
+        assert _stable_chain_id(chains[0]) == _stable_chain_id(chains[1])
+
 
 class TestLangChainTokenTracking:
     """Test token tracking for LangChain."""
@@ -450,3 +948,132 @@ class TestLangChainBudgetAwareness:
         assert "remaining_tokens" in input_data["budget_info"]
         assert "remaining_cost" in input_data["budget_info"]
         assert "time_pressure" in input_data["budget_info"]
+
+    def test_caller_budget_info_is_kept(self) -> None:
+        """Test that budget_info supplied by the caller is not overwritten."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-budget-keep",
+            name="test-budget-keep",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.invoke.return_value = {"text": "Result"}
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+        input_data = {"query": "test", "budget_info": {"remaining_tokens": 42}}
+        contracted._monitored_execution(input_data)
+
+        assert input_data["budget_info"] == {"remaining_tokens": 42}
+
+    def test_budget_info_skipped_for_chains_without_it(self) -> None:
+        """Test budget_info is not injected when the chain doesn't declare it."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-budget-skip",
+            name="test-budget-skip",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.input_variables = ["query"]
+        mock_chain.invoke.return_value = {"text": "Result"}
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+        input_data = {"query": "test"}
+        contracted._monitored_execution(input_data)
+
+        assert "budget_info" not in input_data
+
+    def test_budget_info_skipped_for_unconstrained_contract(self) -> None:
+        """Test budget_info is not injected when the contract sets no limits."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(id="test-audit-only", name="test-audit-only")
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+        input_data = {"query": "test"}
+        contracted._inject_budget_info(input_data)
+
+        assert "budget_info" not in input_data
+
+    def test_budget_info_is_lazy_view(self) -> None:
+        """Test budget_info snapshots the monitors once per execution."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-budget-view",
+            name="test-budget-view",
+            resources=ResourceConstraints(tokens=1000),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+        mock_chain.input_variables = ["query", "budget_info"]
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+        input_data = {"query": "test"}
+        contracted._inject_budget_info(input_data)
+
+        budget_info = input_data["budget_info"]
+        assert budget_info["remaining_tokens"] == 1000
+        contracted.resource_monitor.usage.add_tokens(400)
+        # Memoized within the execution
+        assert budget_info["remaining_tokens"] == 1000
+
+        # The next execution gets its own view; earlier views never change
+        next_input: dict = {"query": "again"}
+        contracted._inject_budget_info(next_input)
+        assert next_input["budget_info"] is not budget_info
+        assert next_input["budget_info"]["remaining_tokens"] == 600
+        assert budget_info["remaining_tokens"] == 1000
+        assert set(budget_info) == {"remaining_tokens", "remaining_cost", "time_pressure"}
+
+    def test_budget_info_is_quantized(self) -> None:
+        """Test budget_info values stay stable across small usage changes."""
+        pytest.importorskip("langchain")
+
+        from agent_contracts.integrations.langchain import ContractedChain
+
+        contract = Contract(
+            id="test-budget-quantized",
+            name="test-budget-quantized",
+            resources=ResourceConstraints(tokens=10000, cost_usd=1.0),
+        )
+
+        mock_chain = Mock()
+        mock_chain.callbacks = []
+
+        contracted = ContractedChain(contract=contract, chain=mock_chain)
+
+        def budget_info() -> Any:
+            input_data: dict = {}
+            contracted._inject_budget_info(input_data)
+            return input_data["budget_info"]
+
+        before = repr(budget_info())
+
+        contracted.resource_monitor.usage.add_tokens(100)
+
+        # A later execution renders byte-identical values within a bucket
+        assert repr(budget_info()) == before
+        assert budget_info()["remaining_tokens"] == 9216
+
+        contracted.resource_monitor.usage.add_cost(0.015)
+        assert budget_info()["remaining_cost"] == 0.98
@@ -3,6 +3,7 @@
 Note: These tests mock LangGraph since it's an optional dependency.
 """
 
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -138,6 +139,22 @@ class TestContractedGraphMocked:
         assert output == {"result": "Success"}
         contracted.execute.assert_called_once()
 
+    def test_contracted_graph_plain_callable_fallback(self) -> None:
+        """Test that a graph without invoke() is called directly."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.integrations.langgraph import ContractedGraph
+
+        contract = Contract(id="test-plain", name="test-plain")
+        plain_graph = Mock(spec=["__call__"], return_value={"output": "Plain"})
+
+        contracted = ContractedGraph(contract=contract, graph=plain_graph)
+        result = contracted.execute({"input": "test"})
+
+        assert result.output == {"output": "Plain"}
+        plain_graph.assert_called_once()
+        assert plain_graph.call_args.kwargs == {}
+
     def test_contracted_graph_callable(self) -> None:
         """Test ContractedGraph is callable."""
         pytest.importorskip("langgraph")
@@ -234,6 +251,47 @@ class TestContractedGraphStreaming:
         assert chunks[-1]["output"] == "Final"
         mock_graph.stream.assert_called_once()
 
+    def test_stream_full_check_only_on_violation(self) -> None:
+        """Test that streaming runs the full constraint check only when needed."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.integrations.langgraph import ContractedGraph
+
+        contract = Contract(
+            id="test-stream-checks",
+            name="test-stream-checks",
+            resources=ResourceConstraints(tokens=100),
+        )
+
+        mock_graph = Mock()
+        mock_graph.stream = Mock(return_value=iter([{"step": i} for i in range(5)]))
+
+        contracted = ContractedGraph(contract=contract, graph=mock_graph)
+
+        with patch.object(
+            contracted.enforcer, "check_constraints", wraps=contracted.enforcer.check_constraints
+        ) as check:
+            list(contracted.stream({"input": "test"}))
+
+        # Only the final check runs when no chunk exceeds a limit
+        assert check.call_count == 1
+
+        def overspend() -> Any:
+            yield {"step": 1}
+            overspent.resource_monitor.usage.add_tokens(count=500)
+            yield {"step": 2}
+
+        overspent = ContractedGraph(
+            contract=Contract(
+                id="test-stream-overspend",
+                name="test-stream-overspend",
+                resources=ResourceConstraints(tokens=100),
+            ),
+            graph=Mock(stream=Mock(return_value=overspend())),
+        )
+        with pytest.raises(RuntimeError, match="Streaming execution failed"):
+            list(overspent.stream({"input": "test"}))
+
     def test_stream_not_supported(self) -> None:
         """Test stream() when graph doesn't support streaming."""
         pytest.importorskip("langgraph")
@@ -254,6 +312,95 @@ class TestContractedGraphStreaming:
             list(contracted.stream({"input": "test"}))
 
 
+class TestLangGraphNodeCaching:
+    """Test node result caching via LangGraph CachePolicy."""
+
+    def test_cache_policy_attached_to_named_nodes(self) -> None:
+        """Test the cache policy is attached only to the listed nodes."""
+        pytest.importorskip("langgraph.cache.memory")
+
+        from langgraph.types import CachePolicy
+
+        from agent_contracts.integrations.langgraph import ContractedGraph
+
+        contract = Contract(id="test-node-cache", name="test-node-cache")
+
+        def node() -> Mock:
+            # PregelNode.copy(update) returns a new node with update applied
+            spec = Mock(cache_policy=None)
+            spec.copy = Mock(side_effect=lambda update: Mock(**update))
+            return spec
+
+        mock_graph = Mock()
+        mock_graph.cache = None
+        mock_graph.nodes = {"retrieve": node(), "generate": node()}
+        # Pregel.copy(update=...) returns a new graph with update applied
+        mock_graph.copy = Mock(side_effect=lambda update: Mock(**update))
+        original_nodes = dict(mock_graph.nodes)
+        policy = CachePolicy(ttl=300)
+
+        contracted = ContractedGraph(
+            contract=contract,
+            graph=mock_graph,
+            cache_policy=policy,
+            cached_nodes=["retrieve"],
+        )
+
+        # The wrapper runs a copy with the policy on the listed node only
+        assert contracted.graph is not mock_graph
+        assert contracted.graph.nodes["retrieve"].cache_policy is policy
+        assert contracted.graph.nodes["generate"] is original_nodes["generate"]
+        assert contracted.graph.cache is not None
+        assert contracted._graph_invoke is contracted.graph.invoke
+
+        # The caller's graph is left exactly as it was
+        assert mock_graph.nodes == original_nodes
+        assert mock_graph.nodes["retrieve"].cache_policy is None
+        assert mock_graph.cache is None
+
+    def test_cache_policy_requires_known_nodes(self) -> None:
+        """Test that cached_nodes must be given and exist in the graph."""
+        pytest.importorskip("langgraph.cache.memory")
+
+        from agent_contracts.integrations.langgraph import ContractedGraph
+
+        mock_graph = Mock()
+        mock_graph.nodes = {"retrieve": Mock()}
+
+        for cached_nodes in (None, ["missing"]):
+            contract = Contract(id="test-node-cache-invalid", name="test-node-cache-invalid")
+            with pytest.raises(ValueError, match="cached_nodes"):
+                ContractedGraph(
+                    contract=contract,
+                    graph=mock_graph,
+                    cache_policy=Mock(),
+                    cached_nodes=cached_nodes,
+                )
+
+    def test_stream_counts_cache_hits(self) -> None:
+        """Test that cached node updates are counted while streaming."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.integrations.langgraph import ContractedGraph
+
+        contract = Contract(id="test-cache-hits", name="test-cache-hits")
+
+        mock_graph = Mock()
+        mock_graph.stream = Mock(
+            return_value=iter(
+                [
+                    {"retrieve": {"docs": []}},
+                    {"retrieve": {"docs": []}, "__metadata__": {"cached": True}},
+                ]
+            )
+        )
+
+        contracted = ContractedGraph(contract=contract, graph=mock_graph)
+        list(contracted.stream({"input": "test"}))
+
+        assert contracted.resource_monitor.usage.metadata["cache_hits"] == 1
+
+
 class TestCreateContractedGraph:
     """Test create_contracted_graph convenience function."""
 
@@ -493,6 +640,47 @@ class TestLangGraphTokenTracking:
         assert contracted.resource_monitor is not None
         assert contracted.resource_monitor.usage.tokens == 0
 
+    def test_callback_created_once(self) -> None:
+        """Test that every config shares the callback created at init."""
+        pytest.importorskip("langgraph")
+        pytest.importorskip("langchain_core")
+
+        from agent_contracts.integrations.langgraph import (
+            ContractedGraph,
+            GraphTokenTrackingCallback,
+        )
+
+        contract = Contract(id="test-callback-once", name="test-callback-once")
+        contracted = ContractedGraph(contract=contract, graph=Mock())
+
+        first = contracted._build_config()["callbacks"][0]
+        second = contracted._build_config()["callbacks"][0]
+
+        assert isinstance(first, GraphTokenTrackingCallback)
+        assert first is second
+        assert first.monitor is contracted.resource_monitor
+
+    def test_config_reused_across_runs(self) -> None:
+        """Test that invoke and stream pass the same prebuilt config."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.integrations.langgraph import ContractedGraph
+
+        mock_graph = Mock()
+        mock_graph.invoke = Mock(return_value={"output": "done"})
+        mock_graph.stream = Mock(return_value=iter([{"step": 1}]))
+
+        contract = Contract(id="test-config-reuse", name="test-config-reuse")
+        contracted = ContractedGraph(contract=contract, graph=mock_graph)
+
+        list(contracted.stream({"input": "a"}))
+        contracted.invoke({"input": "b"})
+        contracted.invoke({"input": "c"})
+
+        configs = [call.kwargs["config"] for call in mock_graph.invoke.call_args_list]
+        configs.append(mock_graph.stream.call_args.kwargs["config"])
+        assert all(config is contracted._config for config in configs)
+
     def test_callback_tracks_tokens_openai_style(self) -> None:
         """Test that callback tracks tokens from OpenAI-style responses."""
         pytest.importorskip("langgraph")
@@ -598,6 +786,76 @@ class TestLangGraphTokenTracking:
         assert contracted.resource_monitor.usage.tokens == 250
         assert contracted.resource_monitor.usage.api_calls == 1
 
+    def test_total_tokens_accessors(self) -> None:
+        """Test token extraction falls through missing or empty locations."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.integrations.langgraph import _total_tokens
+
+        message = Mock(response_metadata={"usage_metadata": {"total_tokens": 70}})
+        response = Mock(llm_output={"token_usage": {}}, generations=[[Mock(message=message)]])
+        assert _total_tokens(response) == 70
+
+        assert _total_tokens(Mock(llm_output=None, generations=[])) == 0
+        assert _total_tokens(Mock(llm_output={"token_usage": {"total_tokens": 5}})) == 5
+
+    def test_callback_prices_tokens_per_model(self) -> None:
+        """Test that cost estimates use the responding model's pricing."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.core.monitor import ResourceMonitor
+        from agent_contracts.core.tokens import MODEL_PRICING
+        from agent_contracts.integrations.langgraph import GraphTokenTrackingCallback
+
+        monitor = ResourceMonitor(ResourceConstraints(tokens=10000))
+        callback = GraphTokenTrackingCallback(monitor, model_hint="gpt-4o")
+
+        hinted = Mock(llm_output={"token_usage": {"total_tokens": 1000}})
+        callback.on_llm_end(hinted)
+        assert monitor.usage.cost_usd == pytest.approx(1000 * MODEL_PRICING["gpt-4o"]["input"])
+
+        named = Mock(
+            llm_output={"token_usage": {"total_tokens": 1000}, "model_name": "gpt-4"},
+        )
+        callback.on_llm_end(named)
+        expected = 1000 * (MODEL_PRICING["gpt-4o"]["input"] + MODEL_PRICING["gpt-4"]["input"])
+        assert monitor.usage.cost_usd == pytest.approx(expected)
+
+    def test_callback_cost_is_exactly_rounded(self) -> None:
+        """Test that per-call cost estimates carry no floating-point drift."""
+        pytest.importorskip("langgraph")
+
+        from agent_contracts.core.monitor import ResourceMonitor
+        from agent_contracts.integrations.langgraph import GraphTokenTrackingCallback
+
+        monitor = ResourceMonitor(ResourceConstraints(tokens=10000))
+        callback = GraphTokenTrackingCallback(monitor)
+
+        # 11 * 1.5e-7 is 1.6499999999999999e-06 in float arithmetic
+        callback.on_llm_end(Mock(llm_output={"token_usage": {"total_tokens": 11}}))
+        assert monitor.usage.cost_usd == 1.65e-06
+
+    def test_callback_counts_each_run_once(self) -> None:
+        """Test that a repeated on_llm_end for the same run is not double-counted."""
+        pytest.importorskip("langgraph")
+
+        from uuid import uuid4
+
+        from agent_contracts.core.monitor import ResourceMonitor
+        from agent_contracts.integrations.langgraph import GraphTokenTrackingCallback
+
+        monitor = ResourceMonitor(ResourceConstraints(tokens=10000))
+        callback = GraphTokenTrackingCallback(monitor)
+        response = Mock(llm_output={"token_usage": {"total_tokens": 100}})
+
+        run_id = uuid4()
+        callback.on_llm_end(response, run_id=run_id)
+        callback.on_llm_end(response, run_id=run_id)
+        callback.on_llm_end(response, run_id=uuid4())
+
+        assert monitor.usage.tokens == 200
+        assert monitor.usage.api_calls == 2
+
     def test_callback_cumulative_tracking(self) -> None:
         """Test that callback tracks tokens cumulatively across multiple calls."""
         pytest.importorskip("langgraph")
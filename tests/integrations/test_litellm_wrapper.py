@@ -1,7 +1,9 @@
 """Unit tests for litellm integration."""
 
+import asyncio
 from datetime import timedelta
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -22,6 +24,14 @@ class TestContractedLLM:
         assert llm.auto_start is True
         assert not llm._started
 
+    def test_uses_slots(self) -> None:
+        """Test that wrapper instances carry no per-instance dict."""
+        llm = ContractedLLM(Contract(id="test", name="Test"))
+
+        assert not hasattr(llm, "__dict__")
+        with pytest.raises(AttributeError):
+            llm.unknown_attribute = 1  # type: ignore[attr-defined]
+
     def test_manual_start_stop(self) -> None:
         """Test manual start and stop."""
         contract = Contract(id="test", name="Test")
@@ -71,6 +81,53 @@ class TestContractedLLM:
         # Verify auto-start
         assert llm._started
 
+    @patch("agent_contracts.integrations.litellm_wrapper.acompletion", new_callable=AsyncMock)
+    def test_acompletion_concurrent(self, mock_acompletion: AsyncMock) -> None:
+        """Test that concurrent async completions are all tracked."""
+        mock_acompletion.return_value = {
+            "choices": [{"message": {"content": "Hello!"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            "model": "gpt-4o-mini",
+        }
+
+        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
+        llm = ContractedLLM(contract)
+
+        async def run_all() -> list[Any]:
+            return await asyncio.gather(
+                *(
+                    llm.acompletion(
+                        model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}]
+                    )
+                    for _ in range(3)
+                )
+            )
+
+        responses = asyncio.run(run_all())
+
+        assert len(responses) == 3
+        assert mock_acompletion.await_count == 3
+        assert llm.enforcer.monitor.usage.tokens == 45
+        assert llm.enforcer.monitor.usage.api_calls == 3
+
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_completion_partial_usage(self, mock_completion: MagicMock) -> None:
+        """Test that a usage block without total_tokens is still tracked."""
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Hello!"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+            "model": "gpt-4o-mini",
+        }
+
+        llm = ContractedLLM(Contract(id="test", name="Test"))
+        events: list[Any] = []
+        llm.add_callback(events.append)
+
+        llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+
+        assert llm.enforcer.monitor.usage.tokens == 15
+        assert events[-1].data["total_tokens"] == 15
+
     @patch("agent_contracts.integrations.litellm_wrapper.completion")
     def test_completion_with_cost_from_response(self, mock_completion: MagicMock) -> None:
         """Test completion using cost from litellm response."""
@@ -89,6 +146,49 @@ class TestContractedLLM:
         # Should use cost from response
         assert llm.enforcer.monitor.usage.cost_usd == 0.0001
 
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_completion_tracks_token_breakdown(self, mock_completion: MagicMock) -> None:
+        """Test reasoning/text token tracking with and without a breakdown."""
+        mock_completion.return_value = {
+            "usage": {
+                "prompt_tokens": 10,
+                "completion_tokens": 50,
+                "total_tokens": 60,
+                "completion_tokens_details": {"reasoning_tokens": 40, "text_tokens": 10},
+            },
+            "_hidden_params": {"response_cost": 0.001},
+        }
+
+        llm = ContractedLLM(Contract(id="test", name="Test"))
+        llm.completion(model="o1", messages=[])
+
+        usage = llm.enforcer.monitor.usage
+        assert usage.tokens == 60
+        assert usage.reasoning_tokens == 40
+        assert usage.text_tokens == 10
+        assert usage.api_calls == 1
+        assert usage.cost_usd == 0.001
+
+        # Without a breakdown, all output tokens count as text
+        mock_completion.return_value = {
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        }
+        llm.completion(model="gpt-4o-mini", messages=[])
+
+        assert usage.tokens == 75
+        assert usage.reasoning_tokens == 40
+        assert usage.text_tokens == 15
+        assert usage.api_calls == 2
+
+    def test_extract_token_details_formats(self) -> None:
+        """Test token detail extraction from dict and object formats."""
+        llm = ContractedLLM(Contract(id="test", name="Test"))
+
+        details = MagicMock(reasoning_tokens=30, text_tokens=None)
+        assert llm._extract_token_details(details) == (30, 0)
+        assert llm._extract_token_details({"reasoning_tokens": 5, "text_tokens": 7}) == (5, 7)
+        assert llm._extract_token_details(details) == (30, 0)
+
     @patch("agent_contracts.integrations.litellm_wrapper.completion")
     def test_completion_violation_strict_mode(self, mock_completion: MagicMock) -> None:
         """Test that violations raise errors in strict mode."""
@@ -165,6 +265,55 @@ class TestContractedLLM:
         assert llm.enforcer.monitor.usage.tokens == 75  # 15 * 5
         assert llm.enforcer.monitor.usage.api_calls == 5
 
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_before_call_full_check_only_on_violation(self, mock_completion: MagicMock) -> None:
+        """Test that the before-call check only escalates to a full check when violated."""
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Response"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            "model": "gpt-4o-mini",
+        }
+
+        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=1000))
+        llm = ContractedLLM(contract)
+
+        with (
+            patch.object(
+                llm.enforcer, "check_constraints", wraps=llm.enforcer.check_constraints
+            ) as check,
+            patch.object(
+                llm.enforcer, "check_constraints_fast", wraps=llm.enforcer.check_constraints_fast
+            ) as fast_check,
+        ):
+            for _ in range(3):
+                llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+
+        # A fast check before each call, a full check only after each call
+        assert fast_check.call_count == 3
+        assert check.call_count == 3
+
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_usage_recorded_outside_wrapper_blocks_next_call(
+        self, mock_completion: MagicMock
+    ) -> None:
+        """Test that usage recorded directly on the enforcer is checked before a call."""
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Response"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            "model": "gpt-4o-mini",
+        }
+
+        contract = Contract(id="test", name="Test", resources=ResourceConstraints(tokens=100))
+        llm = ContractedLLM(contract)
+        llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+
+        # E.g. a tool step sharing the enforcer
+        llm.enforcer.monitor.usage.add_tokens(500)
+
+        with pytest.raises(ContractViolationError, match="already violated"):
+            llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+        mock_completion.assert_called_once()
+
     @patch("agent_contracts.integrations.litellm_wrapper.completion")
     def test_streaming_completion(self, mock_completion: MagicMock) -> None:
         """Test streaming completion."""
@@ -191,6 +340,24 @@ class TestContractedLLM:
 
         assert len(collected) == 3
         assert llm.enforcer.monitor.usage.api_calls == 1
+        # Tokens come from the final chunk's usage only
+        assert llm.enforcer.monitor.usage.tokens == 13
+        assert llm.enforcer.monitor.usage.cost_usd > 0
+
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_streaming_completion_accumulates(self, mock_completion: MagicMock) -> None:
+        """Test that consecutive streams add to previously tracked tokens."""
+        chunks = [{"choices": [{"delta": {"content": "x"}}], "usage": None}] * 100 + [
+            {"usage": {"prompt_tokens": 20, "completion_tokens": 30, "total_tokens": 50}}
+        ]
+
+        llm = ContractedLLM(Contract(id="test", name="Test"))
+        for _ in range(2):
+            mock_completion.return_value = iter(chunks)
+            assert len(list(llm.streaming_completion(model="gpt-4o-mini", messages=[]))) == 101
+
+        assert llm.enforcer.monitor.usage.tokens == 100
+        assert llm.enforcer.monitor.usage.api_calls == 2
 
     @patch("agent_contracts.integrations.litellm_wrapper.completion")
     def test_temporal_constraint_violation(self, mock_completion: MagicMock) -> None:
@@ -243,6 +410,32 @@ class TestContractedLLM:
 
         assert len(events) == 1  # Start event
 
+    @patch("agent_contracts.integrations.litellm_wrapper.EnforcementEvent")
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_completion_event_only_built_with_callbacks(
+        self, mock_completion: MagicMock, mock_event: MagicMock
+    ) -> None:
+        """Test that completion events are skipped when nobody listens."""
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Hello!"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            "model": "gpt-4o-mini",
+        }
+
+        llm = ContractedLLM(Contract(id="test", name="Test"))
+        llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+        mock_event.assert_not_called()
+
+        llm.enforcer.batch_callbacks.append(lambda events: None)
+        llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+        assert mock_event.call_args.kwargs["event_type"] == "llm_completion"
+
+        mock_event.reset_mock()
+        llm.enforcer.batch_callbacks.clear()
+        llm.add_callback(lambda event: None)
+        llm.completion(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+        assert mock_event.call_args.kwargs["event_type"] == "llm_completion"
+
     def test_context_manager(self) -> None:
         """Test using ContractedLLM as context manager."""
         contract = Contract(id="test", name="Test")
@@ -268,6 +461,31 @@ class TestContractedLLM:
         repr_str = repr(llm)
         assert "STARTED" in repr_str
 
+    @patch("agent_contracts.integrations.litellm_wrapper.completion")
+    def test_reasoning_effort_applied(self, mock_completion: MagicMock) -> None:
+        """Test that the contract's reasoning effort is passed unless overridden."""
+        mock_completion.return_value = {
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        }
+
+        contract = Contract(
+            id="test",
+            name="Test",
+            resources=ResourceConstraints(reasoning_tokens=5000, reasoning_effort="high"),
+        )
+        llm = ContractedLLM(contract)
+        assert llm._get_reasoning_effort() == "high"
+
+        llm.completion(model="o1", messages=[])
+        assert mock_completion.call_args.kwargs["reasoning_effort"] == "high"
+
+        llm.completion(model="o1", messages=[], reasoning_effort="low")
+        assert mock_completion.call_args.kwargs["reasoning_effort"] == "low"
+
+        plain = ContractedLLM(Contract(id="plain", name="Plain"))
+        plain.completion(model="gpt-4o-mini", messages=[])
+        assert "reasoning_effort" not in mock_completion.call_args.kwargs
+
 
 class TestIntegration:
     """Integration tests for litellm wrapper."""
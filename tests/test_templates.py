@@ -1,6 +1,7 @@
 """Tests for contract templates (Phase 2B)."""
 
 from datetime import timedelta
+from typing import Any
 
 import pytest
 
@@ -70,6 +71,56 @@ class TestResearchContract:
         assert contract.resources.cost_usd == 1.0
         assert contract.resources.web_searches == 15
 
+    def test_custom_resources_do_not_leak(self) -> None:
+        """Test that overrides for one contract don't change later defaults."""
+        ResearchContract.create(topic="First", resources={"tokens": 1})
+        CodeReviewContract.create(repository="org/repo", resources={"tokens": 1})
+        CustomerSupportContract.create(ticket_id="T-1", resources={"tokens": 1})
+        DataAnalysisContract.create(dataset_name="a.csv", resources={"memory_mb": 1.0})
+
+        assert ResearchContract.create(topic="Second").resources.tokens == 150_000
+        assert CodeReviewContract.create(repository="org/repo").resources.tokens == 50_000
+        assert CustomerSupportContract.create(ticket_id="T-2").resources.tokens == 8_000
+        assert DataAnalysisContract.create(dataset_name="b.csv").resources.memory_mb == 1024.0
+
+    def test_unknown_resource_overrides_ignored(self) -> None:
+        """Test that override keys the template doesn't use are ignored."""
+        contract = ResearchContract.create(
+            topic="Extra", resources={"tokens": 60000, "unknown_limit": 3}
+        )
+
+        assert contract.resources.tokens == 60000
+        assert contract.resources.api_calls == 40
+
+    def test_research_contract_batch(self) -> None:
+        """Test creating research contracts for several topics at once."""
+        topics = ["Grid Storage", "Solid State Batteries"]
+        contracts = ResearchContract.create_batch(
+            topics, mode=ContractMode.URGENT, resources={"tokens": 90000}
+        )
+
+        assert [c.id for c in contracts] == [
+            ResearchContract.create(topic=topic).id for topic in topics
+        ]
+        assert [c.metadata["topic"] for c in contracts] == topics
+        assert all(c.mode == ContractMode.URGENT for c in contracts)
+        assert all(c.resources.tokens == 90000 for c in contracts)
+        assert contracts[0].temporal.max_duration == timedelta(minutes=30)
+
+    def test_research_contract_subclass_hooks(self) -> None:
+        """Test that create() dispatches through the subclass."""
+        from agent_contracts.core.contract import ResourceConstraints, TemporalConstraints
+
+        class CappedResearch(ResearchContract):
+            @staticmethod
+            def _constraints(
+                mode: ContractMode, resources: dict[str, Any] | None
+            ) -> tuple[ResourceConstraints, TemporalConstraints]:
+                return ResourceConstraints(tokens=1000), TemporalConstraints()
+
+        assert CappedResearch.create(topic="Capped").resources.tokens == 1000
+        assert CappedResearch.create_batch(["A", "B"])[1].resources.tokens == 1000
+
     def test_research_contract_custom_id(self) -> None:
         """Test research contract with custom ID."""
         contract = ResearchContract.create(topic="Test", contract_id="my-research-123")
@@ -384,6 +435,17 @@ class TestTemplateIntegration:
         assert isinstance(analysis, Contract)
         assert analysis.resources is not None
 
+    def test_auto_ids_for_repeated_subjects(self) -> None:
+        """Test that auto-generated IDs are stable when subjects repeat."""
+        for _ in range(2):
+            research = ResearchContract.create(topic="Edge AI Chips")
+            review = CodeReviewContract.create(repository="org/app", pr_number=7)
+            analysis = DataAnalysisContract.create(dataset_name="sales.q3.csv")
+
+            assert research.id == "research-edge-ai-chips"
+            assert review.id == "code-review-org-app-pr7"
+            assert analysis.id == "analysis-sales-q3-csv"
+
     def test_templates_with_contract_agent(self) -> None:
         """Test using templates with ContractAgent."""
         from agent_contracts.core.wrapper import ContractAgent
@@ -417,6 +479,22 @@ class TestTemplateIntegration:
             small_data.resources.tokens < medium_data.resources.tokens < large_data.resources.tokens
         )
 
+    def test_size_tier_boundaries(self) -> None:
+        """Test that tier boundaries match the documented size ranges."""
+        review_tokens = {
+            files: CodeReviewContract.create(repository="r", files_changed=files).resources.tokens
+            for files in (4, 5, 15, 16)
+        }
+        assert review_tokens == {4: 30_000, 5: 50_000, 15: 50_000, 16: 80_000}
+
+        analysis_tokens = {
+            size: DataAnalysisContract.create(
+                dataset_name="d", dataset_size_mb=size
+            ).resources.tokens
+            for size in (0.99, 1.0, 10.0, 10.01)
+        }
+        assert analysis_tokens == {0.99: 20_000, 1.0: 50_000, 10.0: 50_000, 10.01: 100_000}
+
     def test_template_mode_variations(self) -> None:
         """Test templates with different modes."""
         for mode in [ContractMode.URGENT, ContractMode.BALANCED, ContractMode.ECONOMICAL]: